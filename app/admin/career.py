@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from app.admin.base import admin_site
 from app.models.career import Career
+from app.signals import update_queryset
 
 
 @admin.register(Career, site=admin_site)
@@ -104,8 +105,8 @@ class CareerAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark selected careers as active")
     def mark_as_active(self, request, queryset):
-        queryset.update(is_active=True)
+        update_queryset(queryset, is_active=True)
 
     @admin.action(description="Mark selected careers as inactive")
     def mark_as_inactive(self, request, queryset):
-        queryset.update(is_active=False)
+        update_queryset(queryset, is_active=False)
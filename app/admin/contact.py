@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from app.admin.base import admin_site
+from app.signals import update_queryset
 from app.models.contact import ContactMessage
 
 
@@ -97,16 +98,16 @@ class ContactMessageAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark selected messages as read")
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
+        update_queryset(queryset, is_read=True)
 
     @admin.action(description="Mark selected messages as unread")
     def mark_as_unread(self, request, queryset):
-        queryset.update(is_read=False)
+        update_queryset(queryset, is_read=False)
 
     @admin.action(description="Mark selected messages as replied")
     def mark_as_replied(self, request, queryset):
-        queryset.update(replied=True)
+        update_queryset(queryset, replied=True)
 
     @admin.action(description="Mark selected messages as pending reply")
     def mark_as_pending(self, request, queryset):
-        queryset.update(replied=False)
+        update_queryset(queryset, replied=False)
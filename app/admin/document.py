@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from app.admin.base import admin_site
-from app.models.document import Document
+from app.models.document import Document, DocumentDownloadDaily
 
 
 @admin.register(Document,site=admin_site)
@@ -93,3 +93,20 @@ class DocumentAdmin(admin.ModelAdmin):
         return "—"
 
     file_link.short_description = "File"
+
+
+@admin.register(DocumentDownloadDaily, site=admin_site)
+class DocumentDownloadDailyAdmin(admin.ModelAdmin):
+    list_display = ("date", "document", "count")
+    list_filter = ("document__document_type", "date")
+    search_fields = ("document__title",)
+    list_select_related = ("document",)
+    date_hierarchy = "date"
+    ordering = ("-date", "-count")
+    list_per_page = 50
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
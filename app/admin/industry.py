@@ -3,6 +3,7 @@ from django.utils.html import format_html
 
 from app.models.industry import Client, Industry, Testimonial
 from app.admin.base import admin_site
+from app.images import get_thumbnail_url
 
 @admin.register(Industry, site=admin_site)
 class IndustryAdmin(admin.ModelAdmin):
@@ -87,8 +88,9 @@ class ClientAdmin(admin.ModelAdmin):
     def logo_preview(self, obj):
         if obj.logo:
             return format_html(
-                "<img src='{}' style='height:40px; object-fit:contain;' />",
-                obj.logo.url,
+                "<img src='{}' loading='lazy' decoding='async' "
+                "style='height:40px; object-fit:contain;' />",
+                get_thumbnail_url(obj.logo),
             )
         return "-"
 
@@ -3,6 +3,7 @@ from django.utils.html import format_html
 
 from app.models.inquiry import EmployerInquiry
 from app.admin.base import admin_site
+from app.signals import update_queryset
 
 @admin.register(EmployerInquiry, site=admin_site)
 class EmployerInquiryAdmin(admin.ModelAdmin):
@@ -138,16 +139,16 @@ class EmployerInquiryAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark selected as Processing")
     def mark_processing(self, request, queryset):
-        queryset.update(status="processing")
+        update_queryset(queryset, status="processing")
 
     @admin.action(description="Mark selected as Quotation Sent")
     def mark_quotation_sent(self, request, queryset):
-        queryset.update(status="quotation_sent")
+        update_queryset(queryset, status="quotation_sent")
 
     @admin.action(description="Mark selected as Completed")
     def mark_completed(self, request, queryset):
-        queryset.update(status="completed")
+        update_queryset(queryset, status="completed")
 
     @admin.action(description="Mark selected as Cancelled")
     def mark_cancelled(self, request, queryset):
-        queryset.update(status="cancelled")
+        update_queryset(queryset, status="cancelled")
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from app.admin.base import admin_site
+from app.images import get_thumbnail_url
 from app.models.japan import (
     JapanBulletPoint,
     JapanLandingPage,
@@ -16,7 +17,9 @@ def image_preview(obj, field_name):
     img = getattr(obj, field_name)
     if img:
         return format_html(
-            '<img src="{}" style="max-height:100px; max-width:150px;" />', img.url
+            '<img src="{}" loading="lazy" decoding="async" '
+            'style="max-height:100px; max-width:150px;" />',
+            get_thumbnail_url(img),
         )
     return "—"
 
@@ -3,6 +3,8 @@ from django.utils.html import format_html
 
 from app.models.medianews import MediaAlbum, MediaPhoto, NewsPost
 from app.admin.base import admin_site
+from app.images import get_thumbnail_url
+from app.signals import update_queryset
 
 class MediaPhotoInline(admin.TabularInline):
     model = MediaPhoto
@@ -14,8 +16,9 @@ class MediaPhotoInline(admin.TabularInline):
     def image_preview(self, obj):
         if obj.image:
             return format_html(
-                '<img src="{}" style="height:60px;border-radius:4px;" />',
-                obj.image.url,
+                '<img src="{}" loading="lazy" decoding="async" '
+                'style="height:60px;border-radius:4px;" />',
+                get_thumbnail_url(obj.image),
             )
         return "—"
 
@@ -77,7 +80,7 @@ class MediaAlbumAdmin(admin.ModelAdmin):
     list_per_page = 20
 
     def photo_count(self, obj):
-        return obj.photo.count()
+        return obj.photo_count
 
     photo_count.short_description = "Photos"
 
@@ -161,8 +164,8 @@ class NewsPostAdmin(admin.ModelAdmin):
 
     @admin.action(description="Publish selected posts")
     def publish_posts(self, request, queryset):
-        queryset.update(is_published=True)
+        update_queryset(queryset, is_published=True)
 
     @admin.action(description="Unpublish selected posts")
     def unpublish_posts(self, request, queryset):
-        queryset.update(is_published=False)
+        update_queryset(queryset, is_published=False)
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 
 from app.admin.base import admin_site
+from app.images import get_thumbnail_url
 from app.models.office import (
     Branch,
     Certification,
@@ -12,11 +13,13 @@ from app.models.office import (
 
 
 def image_preview(obj, field_name, width=80):
+    # Small cached copies, see app.images.get_thumbnail_url
     field = getattr(obj, field_name)
     if field:
         return format_html(
-            '<img src="{}" width="{}" style="border-radius:6px;" />',
-            field.url,
+            '<img src="{}" width="{}" loading="lazy" decoding="async" '
+            'style="border-radius:6px;" />',
+            get_thumbnail_url(field),
             width,
         )
     return "-"
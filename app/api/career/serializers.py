@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.career import Career
 
 
-class CareerListSerializer(serializers.ModelSerializer):
+class CareerListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Career
         fields = [
@@ -20,7 +22,7 @@ class CareerListSerializer(serializers.ModelSerializer):
         ]
 
 
-class CareerDetailSerializer(serializers.ModelSerializer):
+class CareerDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Career
         fields = "__all__"
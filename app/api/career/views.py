@@ -2,11 +2,21 @@ from rest_framework import viewsets, filters
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+)
 from app.models.career import Career
 from app.api.career.serializers import CareerListSerializer, CareerDetailSerializer
 
 
-class CareerViewSet(viewsets.ReadOnlyModelViewSet):
+class CareerViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Internal career opportunities at KHRM (separate from overseas jobs)."""
     queryset = Career.objects.filter(is_active=True)
     permission_classes = [AllowAny]
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.contact import ContactMessage
 
 
-class ContactMessageSerializer(serializers.ModelSerializer):
+class ContactMessageSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     inquiry_type_display = serializers.CharField(
         source="get_inquiry_type_display", read_only=True
     )
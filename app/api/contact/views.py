@@ -3,11 +3,13 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from app.api.mixin import AutoPrefetchMixin
+from app.api.pagination import KeysetPagination
 from app.models.contact import ContactMessage
 from app.api.contact.serializers import ContactMessageSerializer
 
 
-class ContactMessageViewSet(viewsets.ModelViewSet):
+class ContactMessageViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """API endpoint for contact messages"""
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
@@ -15,6 +17,7 @@ class ContactMessageViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["inquiry_type", "is_read", "replied"]
     ordering = ["-created_at"]
+    pagination_class = KeysetPagination
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
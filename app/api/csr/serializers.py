@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.csr import CSRProject
 
 
-class CSRProjectSerializer(serializers.ModelSerializer):
+class CSRProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = CSRProject
         fields = "__all__"
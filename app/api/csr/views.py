@@ -1,11 +1,21 @@
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+)
 from app.models.csr import CSRProject
 from app.api.csr.serializers import CSRProjectSerializer
 
 
-class CSRProjectViewSet(viewsets.ReadOnlyModelViewSet):
+class CSRProjectViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for CSR projects"""
     queryset = CSRProject.objects.filter(is_active=True)
     serializer_class = CSRProjectSerializer
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.document import Document
 
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     document_type_display = serializers.CharField(
         source="get_document_type_display", read_only=True
     )
@@ -4,11 +4,24 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+)
+from app.download_buffer import download_buffer
 from app.models.document import Document
 from app.api.document.serializers import DocumentSerializer
 
 
-class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
+class DocumentViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for documents"""
     queryset = Document.objects.filter(is_active=True)
     serializer_class = DocumentSerializer
@@ -22,22 +35,18 @@ class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
     def download(self, request, pk=None):
         """Track download and return file URL"""
         document = self.get_object()
-        document.download_count += 1
-        document.save(update_fields=["download_count"])
+        # Buffered and written in batches, see app.download_buffer
+        download_buffer.record(document.pk)
         return Response(
             {
                 "file_url": request.build_absolute_uri(document.file.url),
                 "filename": document.title,
-                "download_count": document.download_count,
+                "download_count": document.download_count
+                + download_buffer.pending(document.pk),
             }
         )
 
     @action(detail=False, methods=["get"])
     def by_type(self, request):
         """Get documents grouped by type"""
-        docs_by_type = {}
-        for doc_type, label in Document.DOCUMENT_TYPE:
-            documents = self.queryset.filter(document_type=doc_type)
-            if documents.exists():
-                docs_by_type[doc_type] = self.get_serializer(documents, many=True).data
-        return Response(docs_by_type)
+        return self.grouped_response("document_type", Document.DOCUMENT_TYPE)
@@ -0,0 +1,38 @@
+from rest_framework.filters import BaseFilterBackend
+
+from app.trigram import get_trigram_index
+
+
+class FuzzyFilter(BaseFilterBackend):
+    """
+    Typo tolerant exact filters for free-text columns.
+
+    Each field in the view's ``fuzzy_filter_fields`` is filtered by the
+    query parameter of the same name. The input is resolved to the stored
+    values it most resembles ("qatar ", "Quatar" -> "Qatar") through the
+    trigram index of that column, without scanning the table.
+    """
+
+    def get_fuzzy_fields(self, view):
+        return getattr(view, "fuzzy_filter_fields", [])
+
+    def filter_queryset(self, request, queryset, view):
+        for field in self.get_fuzzy_fields(view):
+            text = request.query_params.get(field, "").strip()
+            if not text:
+                continue
+            values = get_trigram_index(queryset.model, field).resolve(text)
+            queryset = queryset.filter(**{f"{field}__in": values})
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": field,
+                "required": False,
+                "in": "query",
+                "description": f"Fuzzy match on {field}",
+                "schema": {"type": "string"},
+            }
+            for field in self.get_fuzzy_fields(view)
+        ]
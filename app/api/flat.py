@@ -0,0 +1,195 @@
+import re
+from operator import itemgetter
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import FileField
+from django.utils.encoding import force_str
+from rest_framework import serializers
+from rest_framework.fields import Field, empty
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
+
+# Model.get_FOO_display(), resolved from FOO's choices
+DISPLAY_RE = re.compile(r"get_(\w+)_display")
+
+# Plain conversions that skip the bound method call
+FAST_CONVERSIONS = {
+    serializers.CharField: str,
+    serializers.IntegerField: int,
+}
+
+MISSING = object()
+
+
+class FlatSerializer:
+    """
+    A serializer compiled down to a ``values()`` query and a row -> dict
+    function.
+
+    Every readable field of the (possibly ``?fields=`` pruned) serializer is
+    mapped to the lookups it reads and the conversion DRF would apply, so a
+    list can be serialized from plain rows without building model
+    instances or walking ``get_attribute`` per field. The output is the
+    same as ``serializer.data``: same keys in the same order, choice labels
+    from ``get_FOO_display``, absolute media URLs from the request, ``None``
+    or an omitted key when a nullable relation is empty.
+
+    Use ``compile()``; it returns None for serializers that read something
+    other than columns (method fields, nested serializers, properties, ...).
+    """
+
+    def __init__(self, serializer, steps, lookups, annotations):
+        self.serializer = serializer
+        self.steps = steps
+        self.lookups = lookups
+        self.annotations = annotations
+        self.finish = getattr(serializer, "to_flat_representation", None)
+
+    @classmethod
+    def compile(cls, serializer):
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        model = getattr(getattr(serializer, "Meta", None), "model", None)
+        if model is None:
+            return None
+        # A custom to_representation has to say how to finish a flat row
+        custom = (
+            type(serializer).to_representation
+            is not serializers.Serializer.to_representation
+        )
+        if custom and not hasattr(serializer, "to_flat_representation"):
+            return None
+
+        steps, lookups = [], {}
+        for field in serializer._readable_fields:
+            step = compile_field(model, field)
+            if step is None:
+                return None
+            name, lookup, relations, convert, on_missing = step
+            # Several lookups (see loaded_fields) are passed as a tuple
+            columns = lookup if isinstance(lookup, tuple) else (lookup,)
+            steps.append((name, itemgetter(*columns), relations, convert, on_missing))
+            lookups.update(dict.fromkeys((*columns, *relations)))
+        annotations = tuple(getattr(serializer, "flat_annotations", ()))
+        return cls(serializer, steps, tuple(lookups), annotations)
+
+    def values(self, queryset):
+        """``queryset`` as the rows this serializer reads."""
+        lookups = list(self.lookups)
+        lookups += [
+            name for name in self.annotations if name in queryset.query.annotations
+        ]
+        return queryset.prefetch_related(None).values(*lookups)
+
+    def to_representation(self, row):
+        data = {}
+        for name, get, relations, convert, on_missing in self.steps:
+            if relations and any(row[relation] is None for relation in relations):
+                # Field.get_attribute() on an empty relation
+                if on_missing is MISSING:
+                    continue
+                data[name] = on_missing
+                continue
+            data[name] = convert(get(row))
+        if self.finish is not None:
+            data = self.finish(data, row)
+        return data
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
+
+
+def _skip_none(convert):
+    def converted(value):
+        return None if value is None else convert(value)
+
+    return converted
+
+
+def compile_field(model, field):
+    """
+    Return ``(name, lookup, relations, convert, on_missing)`` for ``field``
+    or None if it cannot be read from ``values()``. ``lookup`` is a tuple
+    when the field also reads its ``loaded_fields`` columns, ``convert``
+    then gets the tuple of values.
+
+    ``relations`` are the foreign keys crossed by a dotted source; when one
+    of them is null DRF's ``get_attribute`` fails over to ``on_missing``
+    (``MISSING`` to leave the key out).
+    """
+    if field.source == "*" or isinstance(
+        field, (serializers.BaseSerializer, serializers.ManyRelatedField)
+    ):
+        return None
+
+    attrs = field.source_attrs
+    relations, path = [], []
+    for attr in attrs[:-1]:
+        try:
+            relation = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not (relation.many_to_one or relation.one_to_one) or not relation.concrete:
+            return None
+        path.append(attr)
+        relations.append("__".join(path))
+        model = relation.related_model
+
+    on_missing = None
+    if relations:
+        if field.default is not empty:
+            return None
+        if not field.allow_null:
+            if field.required:
+                return None
+            on_missing = MISSING
+
+    attr = attrs[-1]
+    display = DISPLAY_RE.fullmatch(attr)
+    try:
+        model_field = model._meta.get_field(display.group(1) if display else attr)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or (display and not model_field.choices):
+        return None
+    lookup = "__".join(path + [model_field.name])
+
+    if isinstance(field, PrimaryKeyRelatedField):
+        if relations or not model_field.is_relation:
+            return None
+        convert = _skip_none(lambda pk: field.to_representation(PKOnlyObject(pk=pk)))
+        return field.field_name, lookup, (), convert, None
+    if model_field.is_relation or type(field).get_attribute is not Field.get_attribute:
+        # Related objects, SlugRelatedField, ModelField, ...
+        return None
+
+    if display:
+        choices = dict(model_field.flatchoices)
+        represent = field.to_representation
+
+        def convert(value):
+            label = force_str(choices.get(value, value), strings_only=True)
+            return None if label is None else represent(label)
+
+    elif isinstance(model_field, FileField):
+        # FieldFile only needs the name and storage to build the URL
+        attr_class = model_field.attr_class
+        loaded_fields = tuple(getattr(field, "loaded_fields", ()))
+        if loaded_fields:
+            # Columns the field reads next to the file, e.g. the derivative
+            # record of ImageDerivativesField, on a stand-in for the instance
+            lookup = (lookup, *("__".join(path + [name]) for name in loaded_fields))
+
+            def convert(values):
+                instance = SimpleNamespace(**dict(zip(loaded_fields, values[1:])))
+                file = attr_class(instance, model_field, values[0])
+                return field.to_representation(file)
+
+        else:
+
+            def convert(name):
+                return field.to_representation(attr_class(None, model_field, name))
+
+    else:
+        convert = _skip_none(FAST_CONVERSIONS.get(type(field), field.to_representation))
+    return field.field_name, lookup, tuple(relations), convert, on_missing
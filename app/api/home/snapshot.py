@@ -0,0 +1,110 @@
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from app.api.prefetch import optimize_queryset
+from app.cache import bump_generation, get_counters, get_generation, incr_counter
+from app.models.office import Branch, Company, Office
+from app.models.industry import Client, Industry, Testimonial
+from app.models.job import Job, JobApplication, JobCategory
+
+from app.api.office.serializers import CompanySerializer, OfficeSerializer
+from app.api.industry.serializers import (
+    ClientSerializer,
+    IndustryListSerializer,
+    TestimonialSerializer,
+)
+from app.api.job.serializers import JobListSerializer
+
+# Every model whose rows end up in the payload, including the ones only
+# reached through joined names (branch, category) or counts (applications).
+HOME_SNAPSHOT_MODELS = (
+    Company,
+    Client,
+    Industry,
+    Testimonial,
+    Job,
+    JobCategory,
+    JobApplication,
+    Office,
+    Branch,
+)
+
+GENERATION_KEY = "home:snapshot:generation"
+HITS_KEY = "home:snapshot:hits"
+MISSES_KEY = "home:snapshot:misses"
+
+# Snapshots of old generations are never read again, let them expire
+SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+
+def build_home_payload():
+    """Serialize all home page sections"""
+    company = Company.objects.first()
+    return {
+        # Company model
+        "company_info": CompanySerializer(company).data if company else None,
+        # Featured Clients
+        "featured_clients": ClientSerializer(
+            optimize_queryset(
+                Client.objects.filter(is_featured=True), ClientSerializer
+            )[:10],
+            many=True,
+        ).data,
+        # Featured Industries
+        "industries": IndustryListSerializer(
+            Industry.objects.filter(is_featured=True), many=True
+        ).data,
+        # Featured Testimonials
+        "testimonials": TestimonialSerializer(
+            optimize_queryset(
+                Testimonial.objects.filter(is_featured=True), TestimonialSerializer
+            )[:5],
+            many=True,
+        ).data,
+        # Featured Jobs
+        "featured_jobs": JobListSerializer(
+            optimize_queryset(
+                Job.objects.filter(status="open", is_featured=True), JobListSerializer
+            )[:6],
+            many=True,
+        ).data,
+        # Offices
+        "offices": OfficeSerializer(
+            optimize_queryset(Office.objects.filter(is_active=True), OfficeSerializer),
+            many=True,
+        ).data,
+    }
+
+
+def get_home_snapshot():
+    """
+    Return the rendered home payload as JSON bytes.
+
+    The snapshot is stored under the current generation, so a rebuild that
+    races with an invalidation lands on a key nobody reads anymore.
+    """
+    key = f"home:snapshot:{get_generation(GENERATION_KEY)}"
+    content = cache.get(key)
+    if content is not None:
+        incr_counter(HITS_KEY)
+        return content
+
+    incr_counter(MISSES_KEY)
+    content = JSONRenderer().render(build_home_payload())
+    cache.set(key, content, timeout=SNAPSHOT_TIMEOUT)
+    return content
+
+
+def invalidate_home_snapshot():
+    bump_generation(GENERATION_KEY)
+
+
+def snapshot_stats():
+    counters = get_counters(HITS_KEY, MISSES_KEY)
+    hits, misses = counters[HITS_KEY], counters[MISSES_KEY]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
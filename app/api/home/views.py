@@ -1,18 +1,12 @@
+import json
+
+from django.http import HttpResponse
 from rest_framework import viewsets
-from rest_framework.permissions import AllowAny
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
-from app.models.office import Company, Office
-from app.models.industry import Client, Industry, Testimonial
-from app.models.job import Job
-
-from app.api.office.serializers import CompanySerializer, OfficeSerializer
-from app.api.industry.serializers import (
-    ClientSerializer,
-    IndustryListSerializer,
-    TestimonialSerializer,
-)
-from app.api.job.serializers import JobListSerializer
+from app.api.home.snapshot import get_home_snapshot, snapshot_stats
 
 
 class HomeViewSet(viewsets.ViewSet):
@@ -22,30 +16,13 @@ class HomeViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """Get all home page data in single request"""
-        data = {
-            # Company model
-            "company_info": CompanySerializer(Company.objects.first()).data
-            if Company.objects.exists()
-            else None,
-            # Featured Clients
-            "featured_clients": ClientSerializer(
-                Client.objects.filter(is_featured=True)[:10], many=True
-            ).data,
-            # Featured Industries
-            "industries": IndustryListSerializer(
-                Industry.objects.filter(is_featured=True), many=True
-            ).data,
-            # Featured Testimonials
-            "testimonials": TestimonialSerializer(
-                Testimonial.objects.filter(is_featured=True)[:5], many=True
-            ).data,
-            # Featured Jobs
-            "featured_jobs": JobListSerializer(
-                Job.objects.filter(status="open", is_featured=True)[:6], many=True
-            ).data,
-            # Offices
-            "offices": OfficeSerializer(
-                Office.objects.filter(is_active=True), many=True
-            ).data,
-        }
-        return Response(data)
+        content = get_home_snapshot()
+        if request.accepted_renderer.format == "json":
+            return HttpResponse(content, content_type="application/json")
+        # Browsable API still needs the data to render its template
+        return Response(json.loads(content))
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAdminUser])
+    def stats(self, request):
+        """Get home snapshot hit/miss counters"""
+        return Response(snapshot_stats())
@@ -1,43 +1,53 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin, ImageDerivativesField, ImageMetaField
 from app.models.industry import Industry, Client, Testimonial
 
-class IndustryListSerializer(serializers.ModelSerializer):
+class IndustryListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for lists"""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         model = Industry
-        fields = ["id", "name", "slug", "icon", "description", "image", "is_featured"]
-
-
-class IndustryDetailSerializer(serializers.ModelSerializer):
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "icon",
+            "description",
+            "image",
+            "image_meta",
+            "is_featured",
+        ]
+
+
+class IndustryDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer with related data"""
 
-    job_count = serializers.SerializerMethodField()
-    client_count = serializers.SerializerMethodField()
+    job_count = serializers.IntegerField(source="open_job_count", read_only=True)
+    client_count = serializers.IntegerField(read_only=True)
+    image_meta = ImageMetaField()
 
     class Meta:
         model = Industry
-        fields = "__all__"
-
-    def get_job_count(self, obj):
-        # We need to import Job safely or use related name in a way that doesn't cycle
-        # Assuming 'jobs' related name exists.
-        # Filtering by status='open' requires knowing about Job model structure.
-        return obj.jobs.filter(status="open").count()
+        exclude = ["open_job_count"]
 
-    def get_client_count(self, obj):
-        return obj.clients.count()
 
+class ClientSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"industry": IndustryListSerializer}
 
-class ClientSerializer(serializers.ModelSerializer):
     industry_name = serializers.CharField(source="industry.name", read_only=True)
+    logo_srcset = ImageDerivativesField(source="logo")
 
     class Meta:
         model = Client
-        fields = "__all__"
+        exclude = ["derivatives"]
+
 
+class TestimonialSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"client": ClientSerializer}
 
-class TestimonialSerializer(serializers.ModelSerializer):
     client_name = serializers.CharField(
         source="client.name", read_only=True, allow_null=True
     )
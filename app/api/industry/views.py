@@ -5,6 +5,14 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from app.api.filters import FuzzyFilter
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    FlatListMixin,
+)
+from app.api.prefetch import optimize_queryset
 from app.models.industry import Industry, Client, Testimonial
 from app.models.job import Job  
 from app.api.industry.serializers import (
@@ -18,8 +26,16 @@ from app.api.job.serializers import JobListSerializer
 
 
 
-class IndustryViewSet(viewsets.ReadOnlyModelViewSet):
+class IndustryViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    FlatListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for industries"""
+    cache_dependencies = [Job, Client]
+    queryset = Industry.objects.all()
     permission_classes = [AllowAny]
     lookup_field = "slug"
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -28,7 +44,7 @@ class IndustryViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ["display_order"]
 
     def get_queryset(self):
-        queryset = Industry.objects.all()
+        queryset = super().get_queryset()
         if self.action == "list":
             queryset = queryset.defer("overview")
         return queryset
@@ -50,7 +66,9 @@ class IndustryViewSet(viewsets.ReadOnlyModelViewSet):
         """Get jobs for specific industry"""
         industry = self.get_object()
         if JobListSerializer:
-            jobs = Job.objects.filter(industry=industry, status="open")
+            jobs = optimize_queryset(
+                Job.objects.filter(industry=industry, status="open"), JobListSerializer
+            )
             serializer = JobListSerializer(jobs, many=True)
             return Response(serializer.data)
         return Response({"detail": "Job serializers not available"}, status=501)
@@ -59,22 +77,33 @@ class IndustryViewSet(viewsets.ReadOnlyModelViewSet):
     def clients(self, request, slug=None):
         """Get clients for specific industry"""
         industry = self.get_object()
-        clients = Client.objects.filter(industry=industry)
+        clients = optimize_queryset(
+            Client.objects.filter(industry=industry), ClientSerializer
+        )
         serializer = ClientSerializer(clients, many=True)
         return Response(serializer.data)
 
 
-class ClientViewSet(viewsets.ReadOnlyModelViewSet):
+class ClientViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    FlatListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for clients"""
+    cache_dependencies = [Industry]
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
     permission_classes = [AllowAny]
     filter_backends = [
         DjangoFilterBackend,
+        FuzzyFilter,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["industry", "country", "is_featured"]
+    filterset_fields = ["industry", "is_featured"]
+    fuzzy_filter_fields = ["country"]
     search_fields = ["name"]
     ordering_fields = ["display_order", "name"]
     ordering = ["display_order"]
@@ -82,13 +111,19 @@ class ClientViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def featured(self, request):
         """Get featured clients"""
-        clients = self.queryset.filter(is_featured=True)[:10]
+        clients = self.get_queryset().filter(is_featured=True)[:10]
         serializer = self.get_serializer(clients, many=True)
         return Response(serializer.data)
 
 
-class TestimonialViewSet(viewsets.ReadOnlyModelViewSet):
+class TestimonialViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for testimonials"""
+    cache_dependencies = [Client]
     queryset = Testimonial.objects.all()
     serializer_class = TestimonialSerializer
     permission_classes = [AllowAny]
@@ -99,6 +134,6 @@ class TestimonialViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def featured(self, request):
         """Get featured testimonials"""
-        testimonials = self.queryset.filter(is_featured=True)[:5]
+        testimonials = self.get_queryset().filter(is_featured=True)[:5]
         serializer = self.get_serializer(testimonials, many=True)
         return Response(serializer.data)
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.inquiry import EmployerInquiry
 
 
-class EmployerInquirySerializer(serializers.ModelSerializer):
+class EmployerInquirySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     industry_name = serializers.CharField(
         source="industry.name", read_only=True, allow_null=True
     )
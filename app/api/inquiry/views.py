@@ -3,18 +3,23 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from app.api.filters import FuzzyFilter
+from app.api.mixin import AutoPrefetchMixin
+from app.api.pagination import KeysetPagination
 from app.models.inquiry import EmployerInquiry
 from app.api.inquiry.serializers import EmployerInquirySerializer
 
 
-class EmployerInquiryViewSet(viewsets.ModelViewSet):
+class EmployerInquiryViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """API endpoint for employer inquiries"""
     queryset = EmployerInquiry.objects.all()
     serializer_class = EmployerInquirySerializer
     permission_classes = [AllowAny]  # Change to IsAuthenticated for admin access
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ["status", "industry", "country"]
+    filter_backends = [DjangoFilterBackend, FuzzyFilter, filters.OrderingFilter]
+    filterset_fields = ["status", "industry"]
+    fuzzy_filter_fields = ["country"]
     ordering = ["-created_at"]
+    pagination_class = KeysetPagination
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin, ImageDerivativesField
 from app.models.japan import (
     JapanLandingPage,
     JapanBulletPoint,
@@ -10,7 +12,7 @@ from app.models.japan import (
 )
 
 
-class JapanBulletPointSerializer(serializers.ModelSerializer):
+class JapanBulletPointSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     section_display = serializers.CharField(
         source="get_section_display", read_only=True
     )
@@ -20,13 +22,15 @@ class JapanBulletPointSerializer(serializers.ModelSerializer):
         fields = ["id", "section", "section_display", "title", "description", "order"]
 
 
-class JapanTeamMemberSerializer(serializers.ModelSerializer):
+class JapanTeamMemberSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    photo_srcset = ImageDerivativesField(source="photo")
+
     class Meta:
         model = JapanTeamMember
-        fields = ["id", "name", "role", "bio", "photo", "order"]
+        fields = ["id", "name", "role", "bio", "photo", "photo_srcset", "order"]
 
 
-class JapanLandingPageSerializer(serializers.ModelSerializer):
+class JapanLandingPageSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     bullet_points = JapanBulletPointSerializer(many=True, read_only=True)
     team_members = JapanTeamMemberSerializer(many=True, read_only=True)
 
@@ -53,7 +57,9 @@ class JapanLandingPageSerializer(serializers.ModelSerializer):
         ]
 
 
-class JapanProgramTrainingPointSerializer(serializers.ModelSerializer):
+class JapanProgramTrainingPointSerializer(
+    DynamicFieldsMixin, serializers.ModelSerializer
+):
     class Meta:
         model = JapanProgramTrainingPoint
         fields = (
@@ -63,7 +69,7 @@ class JapanProgramTrainingPointSerializer(serializers.ModelSerializer):
         )
 
 
-class WhyChooseJapanProgramSerializer(serializers.ModelSerializer):
+class WhyChooseJapanProgramSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = WhyChooseJapanProgram
         fields = (
@@ -73,7 +79,7 @@ class WhyChooseJapanProgramSerializer(serializers.ModelSerializer):
         )
 
 
-class JapanProgramSerializer(serializers.ModelSerializer):
+class JapanProgramSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     # Program type is FK. Maybe show name?
     program_type_name = serializers.CharField(source="program_type.name", read_only=True)
     training_points = JapanProgramTrainingPointSerializer(many=True, read_only=True)
@@ -2,34 +2,58 @@ from rest_framework import viewsets, filters
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from app.models.japan import JapanLandingPage, JapanProgram
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+)
+from app.api.prefetch import optimize_queryset
+from app.models.japan import (
+    JapanBulletPoint,
+    JapanLandingPage,
+    JapanProgram,
+    JapanProgramTrainingPoint,
+    JapanProgramType,
+    JapanTeamMember,
+    WhyChooseJapanProgram,
+)
 from app.api.japan.serializers import (
     JapanLandingPageSerializer,
     JapanProgramSerializer,
 )
 
 
-class JapanLandingViewSet(viewsets.ViewSet):
+class JapanLandingViewSet(CachedResponseMixin, viewsets.ViewSet):
     """Provides the single Japan landing page configuration with nested content."""
     permission_classes = [AllowAny]
+    cache_dependencies = [JapanLandingPage, JapanBulletPoint, JapanTeamMember]
 
     def list(self, request):
-        page = JapanLandingPage.objects.order_by("-created_at").first()
+        page = optimize_queryset(
+            JapanLandingPage.objects.order_by("-created_at"), JapanLandingPageSerializer
+        ).first()
         if not page:
             return Response({})
         serializer = JapanLandingPageSerializer(page)
         return Response(serializer.data)
 
 
-class JapanProgramViewSet(viewsets.ReadOnlyModelViewSet):
+class JapanProgramViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for Japan Training Programs"""
+    cache_dependencies = [
+        JapanProgramType,
+        JapanProgramTrainingPoint,
+        WhyChooseJapanProgram,
+    ]
+    # Program type joined, points prefetched by AutoPrefetchMixin
+    queryset = JapanProgram.objects.filter(is_active=True)
     serializer_class = JapanProgramSerializer
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["overview", "target_level"]
     ordering_fields = ["created_at", "program_type"]
-
-    def get_queryset(self):
-        return JapanProgram.objects.filter(is_active=True).prefetch_related(
-            "training_points", "why_choose_points"
-        )
@@ -0,0 +1,50 @@
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+from app.fts import (
+    JOB_FTS_TABLE,
+    JOB_FTS_WEIGHTS,
+    SNIPPET_END,
+    SNIPPET_START,
+    build_match_query,
+    fts_enabled,
+)
+
+
+class JobFullTextSearchFilter(filters.SearchFilter):
+    """
+    ``?search=`` backed by the SQLite FTS5 job index.
+
+    Matches are ranked by bm25 unless the request asks for an explicit
+    ``?ordering=``, and carry a highlighted ``search_snippet``. Falls back
+    to the regular ``search_fields`` LIKE search when the index is missing,
+    e.g. on other database backends. Must come after ``OrderingFilter``.
+    """
+
+    snippet_tokens = 16
+
+    def filter_queryset(self, request, queryset, view):
+        if not fts_enabled(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        match = build_match_query(" ".join(self.get_search_terms(request)))
+        if match is None:
+            return queryset
+
+        table = queryset.model._meta.db_table
+        matching = f"FROM {JOB_FTS_TABLE} WHERE {JOB_FTS_TABLE} MATCH %s"
+        row = f'{matching} AND rowid = "{table}"."id"'
+        weights = ", ".join(str(weight) for weight in JOB_FTS_WEIGHTS)
+        queryset = queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid {matching}", [match])
+        ).annotate(
+            search_rank=RawSQL(f"SELECT bm25({JOB_FTS_TABLE}, {weights}) {row}", [match]),
+            search_snippet=RawSQL(
+                f"SELECT snippet({JOB_FTS_TABLE}, -1, %s, %s, %s, %s) {row}",
+                [SNIPPET_START, SNIPPET_END, "…", self.snippet_tokens, match],
+            ),
+        )
+
+        if not request.query_params.get(filters.OrderingFilter.ordering_param):
+            queryset = queryset.order_by("search_rank", *queryset.query.order_by)
+        return queryset
@@ -1,10 +1,12 @@
 from rest_framework import serializers
 
+from app.api.mixin import DynamicFieldsMixin, ImageDerivativesField, ImageMetaField
+from app.fts import highlight_snippet
 from app.models.job import Job, JobCategory, JobApplication
 from app.api.industry.serializers import IndustryListSerializer, ClientSerializer
 
 
-class JobCategorySerializer(serializers.ModelSerializer):
+class JobCategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     industry_name = serializers.CharField(source="industry.name", read_only=True)
     skill_level_display = serializers.CharField(
         source="get_skill_level_display", read_only=True
@@ -15,16 +17,23 @@ class JobCategorySerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class JobListSerializer(serializers.ModelSerializer):
+class JobListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for job listings"""
 
+    expandable_fields = {
+        "category": JobCategorySerializer,
+        "industry": IndustryListSerializer,
+        "client": ClientSerializer,
+    }
+
     category_name = serializers.CharField(source="category.name", read_only=True)
     industry_name = serializers.CharField(source="industry.name", read_only=True)
     client_name = serializers.CharField(
         source="client.name", read_only=True, allow_null=True
     )
     status_display = serializers.CharField(source="get_status_display", read_only=True)
-    application_count = serializers.SerializerMethodField()
+    image_srcset = ImageDerivativesField(source="image")
+    image_meta = ImageMetaField()
 
     class Meta:
         model = Job
@@ -33,6 +42,8 @@ class JobListSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "image",
+            "image_srcset",
+            "image_meta",
             "category_name",
             "industry_name",
             "client_name",
@@ -49,28 +60,45 @@ class JobListSerializer(serializers.ModelSerializer):
             "application_count",
         ]
 
-    def get_application_count(self, obj):
-        return obj.applications.count()
+    # Annotations read below, fetched along with the columns by FlatSerializer
+    flat_annotations = ["search_snippet"]
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        return self.add_search_snippet(data, getattr(instance, "search_snippet", None))
+
+    def to_flat_representation(self, data, row):
+        return self.add_search_snippet(data, row.get("search_snippet"))
+
+    def add_search_snippet(self, data, snippet):
+        # Only present on full-text search results, see JobFullTextSearchFilter
+        requested = self.get_requested_paths("fields")
+        if snippet is not None and (
+            requested is None or ("search_snippet",) in requested
+        ):
+            data["search_snippet"] = highlight_snippet(snippet)
+        return data
 
 
-class JobDetailSerializer(serializers.ModelSerializer):
+class JobDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer with full information"""
 
     category = JobCategorySerializer(read_only=True)
     industry = IndustryListSerializer(read_only=True)
     client = ClientSerializer(read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
-    application_count = serializers.SerializerMethodField()
+    application_count = serializers.IntegerField(read_only=True)
+    image_srcset = ImageDerivativesField(source="image")
+    image_meta = ImageMetaField()
 
     class Meta:
         model = Job
-        fields = "__all__"
+        exclude = ["derivatives"]
 
-    def get_application_count(self, obj):
-        return obj.applications.count()
 
+class JobApplicationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"job": JobListSerializer}
 
-class JobApplicationSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source="job.title", read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
 
@@ -80,9 +108,18 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = ["status", "notes", "created_at", "updated_at"]
 
 
-class JobApplicationCreateSerializer(serializers.ModelSerializer):
+class JobApplicationCreateSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for creating applications"""
 
     class Meta:
         model = JobApplication
         exclude = ["status", "notes", "created_at", "updated_at"]
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(allow_blank=True, default="")
+    type = serializers.MultipleChoiceField(
+        choices=["job_title", "country", "location", "category", "industry"],
+        required=False,
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=10)
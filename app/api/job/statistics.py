@@ -0,0 +1,74 @@
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from app.cache import get_model_versions
+from app.models.industry import Industry
+from app.models.job import Job, JobCategory
+
+# Models whose rows or names appear in the statistics
+STATISTICS_MODELS = (Job, JobCategory, Industry)
+
+STATISTICS_TIMEOUT = 60 * 60 * 24
+
+
+def _grouped(rows, key, name):
+    totals = defaultdict(lambda: {"count": 0, "vacancies": 0})
+    for row in rows:
+        group = totals[row[key]]
+        group["count"] += row["count"]
+        group["vacancies"] += row["vacancies"]
+    return [
+        {name: value, **totals[value]}
+        for value in sorted(totals, key=lambda value: (value is None, value or ""))
+    ]
+
+
+def compute_job_statistics():
+    """
+    Open job statistics from a single grouped query.
+
+    Every breakdown is a roll-up of the (country, industry, category,
+    skill level) groups, so one round trip covers all of them.
+    """
+    rows = list(
+        Job.objects.filter(status="open")
+        .order_by()
+        .values(
+            "country",
+            "industry__name",
+            "category__name",
+            "category__skill_level",
+        )
+        .annotate(count=Count("id"), vacancies=Sum("vacancies"))
+    )
+    skill_levels = dict(JobCategory.SKILL_LEVEL)
+    by_skill_level = _grouped(rows, "category__skill_level", "skill_level")
+    for group in by_skill_level:
+        group["skill_level_display"] = skill_levels.get(
+            group["skill_level"], group["skill_level"]
+        )
+
+    return {
+        "total_open_jobs": sum(row["count"] for row in rows),
+        "total_vacancies": sum(row["vacancies"] for row in rows),
+        "jobs_by_country": _grouped(rows, "country", "country"),
+        "jobs_by_industry": _grouped(rows, "industry__name", "industry__name"),
+        "jobs_by_category": _grouped(rows, "category__name", "category__name"),
+        "jobs_by_skill_level": by_skill_level,
+    }
+
+
+def get_job_statistics():
+    """
+    Return the statistics snapshot for the current Job/JobCategory/Industry
+    generation, computing it only after one of them was written.
+    """
+    versions = get_model_versions(STATISTICS_MODELS)
+    key = "jobs:statistics:" + ":".join(str(versions[m]) for m in STATISTICS_MODELS)
+    statistics = cache.get(key)
+    if statistics is None:
+        statistics = compute_job_statistics()
+        cache.set(key, statistics, timeout=STATISTICS_TIMEOUT)
+    return statistics
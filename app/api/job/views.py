@@ -1,10 +1,24 @@
-from django.db.models import Count
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    FlatListMixin,
+    StreamingResponseMixin,
+)
+from app.api.pagination import KeysetPagination
+from app.api.renderers import StreamedList
+from app.api.filters import FuzzyFilter
+from app.api.job.filters import JobFullTextSearchFilter
+from app.api.job.statistics import get_job_statistics
+from app.api.prefetch import optimize_queryset
+from app.models.industry import Client, Industry
+from app.typeahead import typeahead_index
 from app.models.job import Job, JobCategory, JobApplication
 from app.api.job.serializers import (
     JobCategorySerializer,
@@ -12,11 +26,18 @@ from app.api.job.serializers import (
     JobDetailSerializer,
     JobApplicationSerializer,
     JobApplicationCreateSerializer,
+    AutocompleteQuerySerializer,
 )
 
 
-class JobCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class JobCategoryViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for job categories"""
+    cache_dependencies = [Industry]
     queryset = JobCategory.objects.all()
     serializer_class = JobCategorySerializer
     permission_classes = [AllowAny]
@@ -24,26 +45,35 @@ class JobCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ["skill_level", "industry"]
 
 
-class JobViewSet(viewsets.ReadOnlyModelViewSet):
+class JobViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    FlatListMixin,
+    StreamingResponseMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for jobs"""
+    cache_dependencies = [JobCategory, Industry, Client, JobApplication]
     permission_classes = [AllowAny]
     lookup_field = "slug"
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        FuzzyFilter,
         filters.OrderingFilter,
+        JobFullTextSearchFilter,
     ]
-    filterset_fields = ["status", "industry", "category", "country", "is_featured"]
+    filterset_fields = ["status", "industry", "category", "is_featured"]
+    fuzzy_filter_fields = ["country", "location"]
+    # Only used when the FTS index is unavailable, see app.fts
     search_fields = ["title", "description", "requirements"]
     ordering_fields = ["created_at", "application_deadline", "vacancies"]
     ordering = ["-created_at"]
 
+    queryset = Job.objects.filter(status="open")
+
     def get_queryset(self):
-        queryset = (
-            Job.objects.filter(status="open")
-            .select_related("category", "industry", "client")
-            .annotate(application_count=Count("applications"))
-        )
+        queryset = super().get_queryset()
         if self.action == "list":
             queryset = queryset.defer("description", "requirements", "responsibilities")
         return queryset
@@ -65,51 +95,50 @@ class JobViewSet(viewsets.ReadOnlyModelViewSet):
         """Get list of countries with jobs"""
         countries = (
             Job.objects.filter(status="open")
+            # Meta.ordering would add created_at to the DISTINCT
+            .order_by("country")
             .values_list("country", flat=True)
             .distinct()
         )
-        return Response(list(countries))
+        return self.streaming_response(StreamedList(countries))
 
     @action(detail=True, methods=["get"])
     def related(self, request, slug=None):
         """Get related jobs"""
         job = self.get_object()
-        related = Job.objects.filter(industry=job.industry, status="open").exclude(
-            id=job.id
+        related = optimize_queryset(
+            Job.objects.filter(industry=job.industry, status="open").exclude(id=job.id),
+            JobListSerializer,
         )[:3]
         serializer = JobListSerializer(related, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """Suggest job titles, countries, locations, categories and industries"""
+        params = AutocompleteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        return Response(
+            typeahead_index.suggest(
+                query["q"], kinds=query.get("type"), limit=query["limit"]
+            )
+        )
+
     @action(detail=False, methods=["get"])
     def statistics(self, request):
         """Get job statistics"""
-        stats = {
-            "total_open_jobs": Job.objects.filter(status="open").count(),
-            "total_vacancies": Job.objects.filter(status="open").aggregate(
-                total=Count("vacancies")
-            )["total"]
-            or 0,
-            "jobs_by_country": list(
-                Job.objects.filter(status="open")
-                .values("country")
-                .annotate(count=Count("id"))
-            ),
-            "jobs_by_industry": list(
-                Job.objects.filter(status="open")
-                .values("industry__name")
-                .annotate(count=Count("id"))
-            ),
-        }
-        return Response(stats)
-
-
-class JobApplicationViewSet(viewsets.ModelViewSet):
+        return Response(get_job_statistics())
+
+
+class JobApplicationViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """API endpoint for job applications"""
     queryset = JobApplication.objects.all().select_related("job")
     permission_classes = [AllowAny]  # Change to IsAuthenticated for production
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["job", "status", "nationality"]
     ordering = ["-created_at"]
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -1,26 +1,31 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin, ImageDerivativesField, ImageMetaField
 from app.models.medianews import MediaAlbum, MediaPhoto, NewsPost
 
 
-class UserLiteSerializer(serializers.ModelSerializer):
+class UserLiteSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         from django.contrib.auth.models import User
         model = User
         fields = ["id", "username", "first_name", "last_name"]
 
 
-class MediaPhotoSerializer(serializers.ModelSerializer):
+class MediaPhotoSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    image_srcset = ImageDerivativesField(source="image")
+    image_meta = ImageMetaField()
+
     class Meta:
         model = MediaPhoto
-        fields = "__all__"
+        exclude = ["derivatives"]
 
 
-class MediaAlbumListSerializer(serializers.ModelSerializer):
+class MediaAlbumListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """List serializer with photo count"""
     album_type_display = serializers.CharField(
         source="get_album_type_display", read_only=True
     )
-    photo_count = serializers.SerializerMethodField()
+    cover_image_meta = ImageMetaField()
 
     class Meta:
         model = MediaAlbum
@@ -32,27 +37,26 @@ class MediaAlbumListSerializer(serializers.ModelSerializer):
             "album_type_display",
             "description",
             "cover_image",
+            "cover_image_meta",
             "date",
             "photo_count",
         ]
 
-    def get_photo_count(self, obj):
-        return obj.photo.count()
-
 
-class MediaAlbumDetailSerializer(serializers.ModelSerializer):
+class MediaAlbumDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detail serializer with all photos"""
     photos = MediaPhotoSerializer(many=True, read_only=True, source="photo")
     album_type_display = serializers.CharField(
         source="get_album_type_display", read_only=True
     )
+    cover_image_meta = ImageMetaField()
 
     class Meta:
         model = MediaAlbum
-        fields = "__all__"
+        exclude = ["archive"]
 
 
-class NewsPostListSerializer(serializers.ModelSerializer):
+class NewsPostListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """List serializer for news"""
     author_name = serializers.CharField(
         source="author.username", read_only=True, allow_null=True
@@ -60,6 +64,8 @@ class NewsPostListSerializer(serializers.ModelSerializer):
     post_type_display = serializers.CharField(
         source="get_post_type_display", read_only=True
     )
+    featured_image_srcset = ImageDerivativesField(source="featured_image")
+    featured_image_meta = ImageMetaField()
 
     class Meta:
         model = NewsPost
@@ -70,6 +76,8 @@ class NewsPostListSerializer(serializers.ModelSerializer):
             "post_type",
             "post_type_display",
             "featured_image",
+            "featured_image_srcset",
+            "featured_image_meta",
             "summary",
             "author_name",
             "is_published",
@@ -79,13 +87,15 @@ class NewsPostListSerializer(serializers.ModelSerializer):
         ]
 
 
-class NewsPostDetailSerializer(serializers.ModelSerializer):
+class NewsPostDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detail serializer with full content"""
     author = UserLiteSerializer(read_only=True)
     post_type_display = serializers.CharField(
         source="get_post_type_display", read_only=True
     )
+    featured_image_srcset = ImageDerivativesField(source="featured_image")
+    featured_image_meta = ImageMetaField()
 
     class Meta:
         model = NewsPost
-        fields = "__all__"
+        exclude = ["derivatives"]
@@ -1,10 +1,28 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
-from app.models.medianews import MediaAlbum, NewsPost
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+)
+from app.api.pagination import KeysetPagination
+from app.archives import (
+    album_photos,
+    build_album_archive,
+    get_album_archive,
+    iter_zip,
+)
+from app.media import send_file
+from app.models.medianews import MediaAlbum, MediaPhoto, NewsPost
 from app.api.medianews.serializers import (
     MediaAlbumListSerializer,
     MediaAlbumDetailSerializer,
@@ -13,14 +31,23 @@ from app.api.medianews.serializers import (
 )
 
 
-class MediaAlbumViewSet(viewsets.ReadOnlyModelViewSet):
+class MediaAlbumViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for photo albums"""
+    cache_dependencies = [MediaPhoto]
     queryset = MediaAlbum.objects.all()
     permission_classes = [AllowAny]
     lookup_field = "slug"
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["album_type"]
     ordering = ["-date"]
+    # Actions export_static_api leaves out, the ZIP is not JSON
+    static_export_exclude = ["download"]
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -30,18 +57,48 @@ class MediaAlbumViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def by_type(self, request):
         """Get albums grouped by type"""
-        albums_by_type = {}
-        for album_type, label in MediaAlbum.ALBUM_TYPE:
-            albums = self.queryset.filter(album_type=album_type)
-            if albums.exists():
-                albums_by_type[album_type] = MediaAlbumListSerializer(
-                    albums, many=True
-                ).data
-        return Response(albums_by_type)
+        return self.grouped_response("album_type", MediaAlbum.ALBUM_TYPE)
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, slug=None):
+        """Download all photos of the album as a ZIP"""
+        album = self.get_object()
+        photos = album_photos(album)
+        archive = get_album_archive(album, photos)
+        if not archive and settings.TASKS_RUN_EAGERLY:
+            # The enqueue would build it on this thread anyway, build once
+            # and serve the result instead of zipping the photos twice
+            build_album_archive(album.pk)
+            album.refresh_from_db(fields=["archive"])
+            archive = get_album_archive(album, photos)
+        if archive:
+            # Ranges, ETag and proxy offload, see app.media
+            response = send_file(request._request, archive)
+            # The archive behind this URL changes with the photos
+            response.headers["Cache-Control"] = "public, no-cache"
+        else:
+            if not settings.TASKS_RUN_EAGERLY:
+                # Zipped on the fly this time, prebuilt for the next downloads
+                build_album_archive.enqueue(
+                    album.pk, dedupe_key=f"album_archive:{album.pk}"
+                )
+            response = StreamingHttpResponse(
+                iter_zip(photos), content_type="application/zip"
+            )
+        response.headers["Content-Disposition"] = content_disposition_header(
+            True, f"{album.slug}.zip"
+        )
+        return response
 
 
-class NewsPostViewSet(viewsets.ReadOnlyModelViewSet):
+class NewsPostViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for news posts"""
+    cache_dependencies = [User]
     queryset = NewsPost.objects.filter(is_published=True)
     permission_classes = [AllowAny]
     lookup_field = "slug"
@@ -53,6 +110,7 @@ class NewsPostViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ["post_type"]
     search_fields = ["title", "summary", "content"]
     ordering = ["-created_at"] # Use created_at as published_date is missing in model
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -66,7 +124,7 @@ class NewsPostViewSet(viewsets.ReadOnlyModelViewSet):
         # Let's check medianews.py again.
         # Lines 47-78. Only is_published.
         # So maybe just return latest?
-        posts = self.queryset[:5]
+        posts = self.get_queryset()[:5]
         serializer = NewsPostListSerializer(posts, many=True)
         return Response(serializer.data)
 
@@ -74,6 +132,8 @@ class NewsPostViewSet(viewsets.ReadOnlyModelViewSet):
     def related(self, request, slug=None):
         """Get related news posts"""
         post = self.get_object()
-        related = self.queryset.filter(post_type=post.post_type).exclude(id=post.id)[:5]
+        related = (
+            self.get_queryset().filter(post_type=post.post_type).exclude(id=post.id)[:5]
+        )
         serializer = NewsPostListSerializer(related, many=True)
         return Response(serializer.data)
@@ -1,21 +1,22 @@
 from rest_framework import serializers
 
+from app.api.mixin import DynamicFieldsMixin
 from app.models.misc import FAQ, PrivacyPolicy, TermsOfService
 
 
-class PrivacyPolicySerializer(serializers.ModelSerializer):
+class PrivacyPolicySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PrivacyPolicy
         fields = "__all__"
 
 
-class TermsOfServiceSerializer(serializers.ModelSerializer):
+class TermsOfServiceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TermsOfService
         fields = "__all__"
 
 
-class FAQSerializer(serializers.ModelSerializer):
+class FAQSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     category_display = serializers.CharField(
         source="get_category_display", read_only=True
     )
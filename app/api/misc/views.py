@@ -4,6 +4,12 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+)
 from app.api.misc.serializers import (
     FAQSerializer,
     PrivacyPolicySerializer,
@@ -12,7 +18,12 @@ from app.api.misc.serializers import (
 from app.models.misc import FAQ, PrivacyPolicy, TermsOfService
 
 
-class PrivacyPolicyViewSet(viewsets.ReadOnlyModelViewSet):
+class PrivacyPolicyViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for privacy policy"""
 
     queryset = PrivacyPolicy.objects.filter(is_active=True)
@@ -29,7 +40,12 @@ class PrivacyPolicyViewSet(viewsets.ReadOnlyModelViewSet):
         return Response({})
 
 
-class TermsOfServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class TermsOfServiceViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for terms of service"""
 
     queryset = TermsOfService.objects.filter(is_active=True)
@@ -46,7 +62,13 @@ class TermsOfServiceViewSet(viewsets.ReadOnlyModelViewSet):
         return Response({})
 
 
-class FAQViewSet(viewsets.ReadOnlyModelViewSet):
+class FAQViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for FAQs"""
 
     queryset = FAQ.objects.filter(is_active=True)
@@ -60,8 +82,4 @@ class FAQViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def by_category(self, request):
         """Get FAQs grouped by category"""
-        faqs_by_category = {}
-        for category, label in FAQ.CATEGORY:
-            faqs = self.queryset.filter(category=category)
-            faqs_by_category[category] = self.get_serializer(faqs, many=True).data
-        return Response(faqs_by_category)
+        return self.grouped_response("category", FAQ.CATEGORY, include_empty=True)
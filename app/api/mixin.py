@@ -1,8 +1,89 @@
+from hashlib import md5
+from itertools import groupby
+from operator import itemgetter
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Case, Count, Max, When
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag, urlencode
 from rest_framework import serializers
+from rest_framework.response import Response
+
+from app.api.flat import FlatSerializer
+from app.api.prefetch import infer_loaded_fields, optimize_queryset
+from app.api.renderers import (
+    StreamedList,
+    StreamedObject,
+    StreamingJSONRenderer,
+    materialize,
+)
+from app.cache import get_model_changed_at, get_model_versions, incr_counter
+from app.images import get_derivative_urls
+
+
+def _parse_paths(value):
+    return [tuple(path.split(".")) for path in value.split(",") if path.strip()]
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets and expandable relations for GET requests.
+
+    ``?fields=id,title,category.name`` keeps only the listed fields, dotted
+    paths select inside nested serializers. ``?expand=client`` replaces
+    the fields named in ``expandable_fields`` ({name: serializer class})
+    with the nested serializer, e.g. a primary key with the full object.
+    Pruned fields are never evaluated, see ``AutoPrefetchMixin`` for the
+    matching ``only()`` on the queryset.
+    """
+
+    expandable_fields = {}
+
+    def get_field_path(self):
+        path, node = [], self
+        while node.parent is not None:
+            # many=True children are bound without a name
+            if node.field_name:
+                path.insert(0, node.field_name)
+            node = node.parent
+        return tuple(path)
+
+    def get_requested_paths(self, param):
+        request = self.context.get("request")
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None
+        value = request.query_params.get(param)
+        return _parse_paths(value) if value else None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        prefix = self.get_field_path()
+        depth = len(prefix)
+
+        expand = self.get_requested_paths("expand") or []
+        expanded = {
+            path[depth]
+            for path in expand
+            if path[:depth] == prefix and len(path) > depth
+        } & set(self.expandable_fields)
+        for name in expanded:
+            fields[name] = self.expandable_fields[name](read_only=True)
 
+        requested = self.get_requested_paths("fields")
+        if requested is not None:
+            selected = [path[depth:] for path in requested if path[:depth] == prefix]
+            # No selection below this level, or the whole object was asked for
+            if selected and all(selected):
+                names = {path[0] for path in selected} | expanded
+                fields = {
+                    name: field for name, field in fields.items() if name in names
+                }
+        return fields
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["id", "username", "email", "first_name", "last_name"]
@@ -15,3 +96,385 @@ class ImageURLMixin(serializers.Serializer):
         if image and hasattr(image, "url"):
             return request.build_absolute_uri(image.url) if request else image.url
         return None
+
+
+class ImageDerivativesField(serializers.ReadOnlyField):
+    """
+    ``{size: url}`` of the resized copies of an ImageField (see
+    ``app.images``), for ``srcset``. Use with ``source`` set to the field.
+    """
+
+    # Sizes are recorded on the row, see app.images.update_derivative_records
+    loaded_fields = ("derivatives",)
+
+    def to_representation(self, value):
+        request = self.context.get("request")
+        return {
+            size: request.build_absolute_uri(url) if request else url
+            for size, url in get_derivative_urls(value).items()
+        }
+
+
+class ImageMetaField(serializers.ReadOnlyField):
+    """
+    Width, height, dominant colour and LQIP data URI of an image (see
+    ``app.images.image_metadata``), None until they are computed.
+    """
+
+    def to_representation(self, value):
+        if not value or "width" not in value:
+            return None
+        return {key: item for key, item in value.items() if key != "name"}
+
+
+class AutoPrefetchMixin:
+    """
+    Add the select_related/prefetch_related lookups inferred from the
+    serializer's fields (see ``app.api.prefetch``) to the queryset, and
+    load only the columns left by ``?fields=`` (see ``DynamicFieldsMixin``).
+    """
+
+    # Actions that serialize with get_serializer(), so ?fields= can narrow the SELECT
+    sparse_actions = ("list", "retrieve")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Viewsets built outside a request (export_static_api) have none
+        request = getattr(self, "request", None)
+        params = request.query_params if request is not None else {}
+        if self.action not in self.sparse_actions or not (
+            params.get("fields") or params.get("expand")
+        ):
+            return optimize_queryset(queryset, self.get_serializer_class())
+
+        serializer = self.get_serializer()
+        loaded = infer_loaded_fields(serializer) if params.get("fields") else None
+        if loaded is not None:
+            # Joins on relations that are no longer read would conflict with only()
+            queryset = queryset.select_related(None).only(*loaded)
+        return optimize_queryset(queryset, serializer)
+
+
+class FlatListMixin:
+    """
+    Serialize ``list`` from ``values()`` rows instead of model instances,
+    see ``app.api.flat.FlatSerializer``. The response is the same; lists
+    whose serializer cannot be compiled (method fields, nested objects,
+    ``?expand=``, ...) go through the serializer as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        flat = FlatSerializer.compile(self.get_serializer())
+        if flat is None:
+            return super().list(request, *args, **kwargs)
+
+        rows = flat.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(flat.serialize(page))
+        return Response(flat.serialize(rows))
+
+
+class StreamingResponseMixin:
+    streaming_renderer_class = StreamingJSONRenderer
+
+    def streaming_response(self, data):
+        """
+        Respond with ``data`` rendered as it is sent, for large unpaginated
+        responses built from ``StreamedList``/``StreamedObject`` values (see
+        ``app.api.renderers``). Other formats, like the browsable API, and
+        indented JSON get a regular response.
+        """
+        renderer = self.request.accepted_renderer
+        media_type = self.request.accepted_media_type
+        if renderer.format != "json" or renderer.get_indent(media_type, {}):
+            return Response(materialize(data))
+        return StreamingHttpResponse(
+            self.streaming_renderer_class().stream(data),
+            content_type=renderer.media_type,
+        )
+
+
+class GroupedListMixin(StreamingResponseMixin):
+    # Instances serialized at once while streaming groups
+    grouped_batch_size = 100
+
+    def grouped_response(self, field, choices, include_empty=False):
+        """
+        Respond with ``{choice: [serialized objects]}`` in ``choices`` order.
+
+        The filtered queryset is fetched once, ordered by group and then by
+        its own ordering, and streamed: instances are serialized in batches
+        as the response is written, so neither the cost nor the memory grows
+        with the number of choices or rows.
+        """
+        order = {value: index for index, (value, label) in enumerate(choices)}
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{f"{field}__in": list(order)}
+        )
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        group_order = Case(
+            *[When(**{field: value}, then=index) for value, index in order.items()]
+        )
+        queryset = queryset.order_by(group_order, *ordering)
+        groups = groupby(self.iter_serialized(queryset, field), key=itemgetter(0))
+
+        def items():
+            group = next(groups, None)
+            for value, label in choices:
+                if group is not None and group[0] == value:
+                    yield value, StreamedList(item for _, item in group[1])
+                    group = next(groups, None)
+                elif include_empty:
+                    yield value, []
+
+        return self.streaming_response(StreamedObject(items()))
+
+    def iter_serialized(self, queryset, field):
+        """Yield ``(instance.<field>, serialized instance)`` in queryset order."""
+        batch = []
+        for instance in queryset.iterator(chunk_size=self.grouped_batch_size):
+            batch.append(instance)
+            if len(batch) == self.grouped_batch_size:
+                yield from self.serialize_batch(batch, field)
+                batch = []
+        yield from self.serialize_batch(batch, field)
+
+    def serialize_batch(self, instances, field):
+        data = self.get_serializer(instances, many=True).data
+        return zip([getattr(instance, field) for instance in instances], data)
+
+
+class ShortCircuit(Exception):
+    """Raised from ``initial()`` to answer a request without running the handler."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ShortCircuitMixin:
+    def handle_exception(self, exc):
+        if isinstance(exc, ShortCircuit):
+            return exc.response
+        return super().handle_exception(exc)
+
+
+class ConditionalGetMixin(ShortCircuitMixin):
+    """
+    ETag / Last-Modified support for read-only viewsets.
+
+    Validators come from one aggregate over the filtered queryset
+    (latest ``updated_at``/``created_at`` and row count). Models without
+    ``updated_at`` and everything listed in ``cache_dependencies`` (models
+    whose data is joined into the response) contribute their change counter
+    instead. Last-Modified of lists also covers deletions through the
+    model's change time. A matching ``If-None-Match``/``If-Modified-Since``
+    is answered with 304 before the serializer runs. Under
+    ``CachedResponseMixin`` a cache hit provides the validators instead.
+    """
+
+    conditional_actions = ("list", "retrieve")
+    cache_dependencies = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.validators = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        if self.action not in self.conditional_actions:
+            return
+
+        self.validators = self.get_validators()
+        if self.validators is None:
+            return
+        etag, last_modified = self.validators
+        response = get_conditional_response(
+            request._request,
+            etag=etag,
+            last_modified=last_modified,
+            response=self.set_validators(HttpResponse()),
+        )
+        if response.status_code != 200:
+            raise ShortCircuit(response)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "validators", None) and response.status_code == 200:
+            self.set_validators(response)
+        return response
+
+    def set_validators(self, response):
+        etag, last_modified = self.validators
+        response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault("Last-Modified", http_date(last_modified))
+        return response
+
+    def get_timestamp_field(self, model):
+        field_names = {field.name for field in model._meta.concrete_fields}
+        for name in ("updated_at", "created_at"):
+            if name in field_names:
+                return name
+        return None
+
+    def get_validators(self):
+        """Return ``(etag, last_modified)`` or None when the object does not exist."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.detail:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+
+        model = queryset.model
+        parts = [self.request.get_full_path(), self.request.accepted_media_type]
+        last_modified = None
+
+        versioned = list(self.cache_dependencies)
+        timestamp_field = self.get_timestamp_field(model)
+        if timestamp_field:
+            state = queryset.order_by().aggregate(
+                last_modified=Max(timestamp_field), count=Count("pk")
+            )
+            if self.detail and not state["count"]:
+                # Let the handler raise the 404
+                return None
+            if state["last_modified"]:
+                last_modified = int(state["last_modified"].timestamp())
+            parts += [state["last_modified"], state["count"]]
+        if timestamp_field != "updated_at":
+            # created_at does not move on edits
+            versioned.insert(0, model)
+
+        if versioned:
+            versions = get_model_versions(versioned)
+            parts += [versions[m] for m in versioned]
+
+        # Deleting any row but the newest leaves the latest timestamp as it
+        # was, so lists also go by the model's own change time
+        changed_models = versioned
+        if not self.detail and model not in versioned:
+            changed_models = [model, *versioned]
+        changed_at = get_model_changed_at(changed_models) if changed_models else None
+        if changed_at and (last_modified is None or changed_at > last_modified):
+            last_modified = changed_at
+
+        etag = md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return quote_etag(etag), last_modified
+
+
+# Part of every response cache key, bumped when the cached tuple changes
+RESPONSE_CACHE_FORMAT = 2
+
+
+def response_cache_counter(basename, outcome):
+    return f"response:{basename}:{outcome}"
+
+
+class CachedResponseMixin(ShortCircuitMixin):
+    """
+    Cache rendered list/retrieve responses.
+
+    The key combines the change counter of the queryset model and of every
+    model in ``cache_dependencies`` with the normalized query string, so
+    each filter/search/ordering/page combination is served from cache until
+    one of those models is saved or deleted. Set ``response_cache = False``
+    on a viewset to opt out.
+
+    The ETag/Last-Modified of ``ConditionalGetMixin`` are stored with the
+    body, they only change along with the key, so a hit (or a 304 on one)
+    does not query the database.
+    """
+
+    response_cache = True
+    response_cache_actions = ("list", "retrieve")
+    response_cache_timeout = 60 * 60 * 24
+    cache_dependencies = ()
+
+    def initial(self, request, *args, **kwargs):
+        self.response_cache_key = None
+        self.response_cache_entry = None
+        self.response_cache_checked = False
+        super().initial(request, *args, **kwargs)
+        cached = self.get_cached_response()
+        if cached is None:
+            return
+        content, content_type, validators = cached
+        raise ShortCircuit(HttpResponse(content, content_type=content_type))
+
+    def get_cached_response(self):
+        """``(content, content_type, validators)`` cached for this request, or None."""
+        if self.response_cache_checked:
+            return self.response_cache_entry
+        self.response_cache_checked = True
+        request = self.request
+        if not self.response_cache or request.method != "GET":
+            return None
+        if self.action not in self.response_cache_actions:
+            return None
+        # The browsable API embeds the user and a CSRF token
+        if request.accepted_renderer.format != "json":
+            return None
+
+        self.response_cache_key = self.get_response_cache_key()
+        cached = cache.get(self.response_cache_key)
+        if cached is None:
+            incr_counter(self.get_response_cache_counter("misses"))
+            return None
+        incr_counter(self.get_response_cache_counter("hits"))
+        self.response_cache_entry = cached
+        return cached
+
+    def get_validators(self):
+        # Called from ConditionalGetMixin.initial(), after content negotiation
+        cached = self.get_cached_response()
+        if cached is not None and cached[2] is not None:
+            return cached[2]
+        return super().get_validators()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        if key and response.status_code == 200 and hasattr(response, "render"):
+            validators = getattr(self, "validators", None)
+            response.add_post_render_callback(
+                lambda rendered: cache.set(
+                    key,
+                    (rendered.content, rendered["Content-Type"], validators),
+                    timeout=self.response_cache_timeout,
+                )
+            )
+        return response
+
+    def get_cache_models(self):
+        models = list(self.cache_dependencies)
+        if hasattr(self, "get_queryset"):
+            models.insert(0, self.get_queryset().model)
+        return models
+
+    def get_response_cache_key(self):
+        request = self.request
+        query = urlencode(
+            sorted(
+                (name, value)
+                for name, values in request.query_params.lists()
+                for value in values
+                if value != ""
+            )
+        )
+        versions = get_model_versions(self.get_cache_models())
+        parts = [
+            RESPONSE_CACHE_FORMAT,
+            request.scheme,
+            request.get_host(),
+            request.path,
+            query,
+            request.accepted_media_type,
+            *versions.values(),
+        ]
+        digest = md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return f"response:{self.basename}:{self.action}:{digest}"
+
+    def get_response_cache_counter(self, outcome):
+        return response_cache_counter(self.basename, outcome)
@@ -1,15 +1,18 @@
 from rest_framework import serializers
 
+from app.api.mixin import DynamicFieldsMixin, ImageDerivativesField
 from app.models.office import Branch, Certification, Company, Leadership, Office
 
 
-class BranchSerializer(serializers.ModelSerializer):
+class BranchSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Branch
         fields = "__all__"
 
 
-class OfficeSerializer(serializers.ModelSerializer):
+class OfficeSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"branch": BranchSerializer}
+
     branch_name = serializers.CharField(source="branch.country", read_only=True)
 
     class Meta:
@@ -17,19 +20,26 @@ class OfficeSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    hero_image_srcset = ImageDerivativesField(source="hero_image")
+    hero_image1_srcset = ImageDerivativesField(source="hero_image1")
+    hero_image2_srcset = ImageDerivativesField(source="hero_image2")
+    hero_image3_srcset = ImageDerivativesField(source="hero_image3")
+
     class Meta:
         model = Company
-        fields = "__all__"
+        exclude = ["derivatives"]
 
 
-class LeadershipSerializer(serializers.ModelSerializer):
+class LeadershipSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    photo_srcset = ImageDerivativesField(source="photo")
+
     class Meta:
         model = Leadership
-        fields = "__all__"
+        exclude = ["derivatives"]
 
 
-class CertificationSerializer(serializers.ModelSerializer):
+class CertificationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Certification
         fields = "__all__"
@@ -3,6 +3,11 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+)
 from app.models.office import Office, Branch, Company, Leadership, Certification
 from app.api.office.serializers import (
     OfficeSerializer,
@@ -13,15 +18,26 @@ from app.api.office.serializers import (
 )
 
 
-class BranchViewSet(viewsets.ReadOnlyModelViewSet):
+class BranchViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for branches"""
     queryset = Branch.objects.all()
     serializer_class = BranchSerializer
     permission_classes = [AllowAny]
 
 
-class OfficeViewSet(viewsets.ReadOnlyModelViewSet):
+class OfficeViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for offices"""
+    cache_dependencies = [Branch]
     queryset = Office.objects.filter(is_active=True)
     serializer_class = OfficeSerializer
     permission_classes = [AllowAny]
@@ -30,14 +46,19 @@ class OfficeViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def headquarters(self, request):
         """Get headquarters office"""
-        hq = Office.objects.filter(is_headquarter=True, is_active=True).first()
+        hq = self.get_queryset().filter(is_headquarter=True).first()
         if hq:
             serializer = self.get_serializer(hq)
             return Response(serializer.data)
         return Response({"detail": "Headquarters not found"}, status=404)
 
 
-class CompanyViewSet(viewsets.ReadOnlyModelViewSet):
+class CompanyViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for company information"""
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
@@ -52,7 +73,12 @@ class CompanyViewSet(viewsets.ReadOnlyModelViewSet):
         return Response({})
 
 
-class LeadershipViewSet(viewsets.ReadOnlyModelViewSet):
+class LeadershipViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for leadership team"""
     queryset = Leadership.objects.all()
     serializer_class = LeadershipSerializer
@@ -60,7 +86,12 @@ class LeadershipViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ["display_order"]
 
 
-class CertificationViewSet(viewsets.ReadOnlyModelViewSet):
+class CertificationViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for certifications"""
     queryset = Certification.objects.all()
     serializer_class = CertificationSerializer
@@ -0,0 +1,102 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Page numbers by default, keyset pages on request.
+
+    Passing ``?cursor=`` (empty for the first page) walks the list on
+    ``(-created_at, id)`` instead: each page filters past the last row of
+    the previous one, so there is no OFFSET scan, no COUNT(*) and rows
+    inserted meanwhile never shift or repeat items. The cursor is opaque
+    to clients, follow the ``next`` link. ``?total=true`` adds an
+    ``approximate_count`` that is recomputed at most once per
+    ``total_timeout`` seconds per query.
+    """
+
+    cursor_query_param = "cursor"
+    total_query_param = "total"
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
+    total_timeout = 60
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        ordered = queryset.order_by("-created_at", "id")
+        if position is not None:
+            created_at, pk = position
+            ordered = ordered.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__gt=pk)
+            )
+        rows = list(ordered[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+
+        self.approximate_count = None
+        if request.query_params.get(self.total_query_param) in ("1", "true"):
+            self.approximate_count = self.get_approximate_count(queryset)
+        return self.page
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, pk = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance):
+        position = json.dumps([instance.created_at.isoformat(), instance.pk])
+        return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+    def get_approximate_count(self, queryset):
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.md5(
+            f"{sql}{params}".encode(), usedforsecurity=False
+        ).hexdigest()
+        key = f"pagination:count:{queryset.model._meta.label_lower}:{digest}"
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout=self.total_timeout)
+        return count
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        payload = {"next": self.get_next_link()}
+        if self.approximate_count is not None:
+            payload["approximate_count"] = self.approximate_count
+        payload["results"] = data
+        return Response(payload)
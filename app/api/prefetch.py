@@ -0,0 +1,143 @@
+import re
+from functools import cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField, RelatedField
+
+# Model.get_FOO_display() only needs the FOO column
+DISPLAY_RE = re.compile(r"get_(\w+)_display")
+
+
+def _walk_source(model, attrs):
+    """
+    Follow ``attrs`` across relations of ``model``.
+
+    Returns ``(select_path, prefetch_path)``: the forward FK/one-to-one
+    chain that can be joined, and the longer path (if any) that has to be
+    prefetched because it crosses a reverse or many-to-many relation.
+    """
+    select, prefetch = [], None
+    for index, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            # Methods like get_status_display, properties, ...
+            break
+        if not field.is_relation:
+            break
+        if field.many_to_one or field.one_to_one:
+            select.append(attr)
+            model = field.related_model
+            continue
+        # Reverse FK or many-to-many, everything from here is prefetched
+        prefetch = attrs[: index + 1]
+        break
+    return select, prefetch
+
+
+def _collect(serializer, model, prefix, in_prefetch, select, prefetch):
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+        attrs = field.source_attrs
+        if isinstance(field, serializers.ListSerializer):
+            path = prefix + attrs
+            prefetch.add("__".join(path))
+            child_model = getattr(field.child.Meta, "model", None)
+            if child_model is not None:
+                _collect(field.child, child_model, path, True, select, prefetch)
+            continue
+
+        if isinstance(field, ManyRelatedField):
+            prefetch.add("__".join(prefix + attrs))
+            continue
+
+        relation_attrs = attrs[:-1]
+        if isinstance(field, serializers.BaseSerializer) or (
+            isinstance(field, RelatedField)
+            and not isinstance(field, PrimaryKeyRelatedField)
+        ):
+            # The related object itself is read
+            relation_attrs = attrs
+
+        joined, crossed = _walk_source(model, relation_attrs)
+        if crossed:
+            prefetch.add("__".join(prefix + crossed))
+        elif joined:
+            target = prefetch if in_prefetch else select
+            target.add("__".join(prefix + joined))
+
+        if isinstance(field, serializers.BaseSerializer) and not crossed:
+            child_model = getattr(field.Meta, "model", None)
+            if child_model is not None:
+                _collect(field, child_model, prefix + attrs, in_prefetch, select, prefetch)
+
+
+def infer_serializer_lookups(serializer):
+    """``infer_related_lookups`` for a serializer instance with possibly pruned fields."""
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+    if model is None:
+        return (), ()
+    select, prefetch = set(), set()
+    _collect(serializer, model, [], False, select, prefetch)
+    # select_related("a__b") already covers "a"
+    select = {
+        path for path in select if not any(other.startswith(f"{path}__") for other in select)
+    }
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+@cache
+def infer_related_lookups(serializer_class):
+    """
+    Return ``(select_related, prefetch_related)`` lookups needed to serialize
+    instances with ``serializer_class`` without a query per row.
+
+    Dotted ``source`` paths and nested serializers over forward relations
+    are joined, nested ``many=True`` serializers and many-to-many fields
+    are prefetched. SerializerMethodFields are opaque and left alone.
+    """
+    return infer_serializer_lookups(serializer_class())
+
+
+def infer_loaded_fields(serializer):
+    """
+    Return the model fields ``serializer`` reads, for ``only()``, or None
+    when a field reads something that cannot be traced to a column (a
+    SerializerMethodField, a property, ...).
+    """
+    model = serializer.Meta.model
+    names = {model._meta.pk.name}
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == "*":
+            return None
+        attr = field.source_attrs[0]
+        display = DISPLAY_RE.fullmatch(attr)
+        if display:
+            attr = display.group(1)
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        # Reverse relations are prefetched through the primary key
+        if model_field.concrete:
+            names.add(attr)
+        # Columns read next to the source, e.g. ImageDerivativesField
+        names.update(getattr(field, "loaded_fields", ()))
+    return names
+
+
+def optimize_queryset(queryset, serializer):
+    """Join/prefetch for ``serializer``, a serializer class or a (pruned) instance."""
+    if isinstance(serializer, type):
+        select, prefetch = infer_related_lookups(serializer)
+    else:
+        select, prefetch = infer_serializer_lookups(serializer)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
@@ -0,0 +1,123 @@
+import orjson
+from django.db.models.query import QuerySet
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Serialized data is plain JSON types; datetimes and decimals that slip through
+# go to DRF's encoder so the output matches JSONRenderer
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+# Rendered chunks are buffered up to this size before being sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StreamedList:
+    """A JSON array rendered item by item from ``iterable``."""
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+
+    def __iter__(self):
+        if isinstance(self.iterable, QuerySet):
+            return self.iterable.iterator()
+        return iter(self.iterable)
+
+
+class StreamedObject:
+    """A JSON object rendered pair by pair from an iterable of ``(key, value)``."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def materialize(data):
+    """Replace streamed values in ``data`` by lists and dicts."""
+    if isinstance(data, StreamedList):
+        return [materialize(item) for item in data]
+    if isinstance(data, StreamedObject):
+        return {key: materialize(value) for key, value in data}
+    return data
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` backed by orjson.
+
+    The output is the same as DRF's compact rendering; indented responses
+    (``Accept: application/json; indent=4``) and non-default
+    ``UNICODE_JSON``/``COMPACT_JSON`` settings use the stdlib encoder.
+    """
+
+    def use_orjson(self, accepted_media_type, renderer_context):
+        return (
+            self.compact
+            and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+
+    def dumps(self, data):
+        if self.compact and not self.ensure_ascii:
+            ret = orjson.dumps(
+                data, default=JSONEncoder().default, option=ORJSON_OPTIONS
+            )
+            # Same strict javascript subset as JSONRenderer
+            return ret.replace(LINE_SEPARATOR, b"\\u2028").replace(
+                PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        return super().render(data)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.use_orjson(accepted_media_type, renderer_context):
+            return super().render(
+                materialize(data), accepted_media_type, renderer_context
+            )
+        return self.dumps(materialize(data))
+
+
+class StreamingJSONRenderer(FastJSONRenderer):
+    """
+    Renders ``StreamedList``/``StreamedObject`` values incrementally.
+
+    ``stream()`` walks the data and yields the document in chunks of about
+    ``STREAM_CHUNK_SIZE`` bytes, pulling items from querysets and
+    generators only as they are written, so the full list never has to be
+    held in memory. Everything else is dumped in one piece. See
+    ``StreamingResponseMixin`` for returning it from a view.
+    """
+
+    def stream(self, data):
+        buffer = bytearray()
+        for part in self.iter_parts(data):
+            buffer += part
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def iter_parts(self, data):
+        if isinstance(data, StreamedList):
+            yield b"["
+            for index, item in enumerate(data):
+                if index:
+                    yield b","
+                yield from self.iter_parts(item)
+            yield b"]"
+        elif isinstance(data, StreamedObject):
+            yield b"{"
+            for index, (key, value) in enumerate(data):
+                if index:
+                    yield b","
+                yield self.dumps(str(key))
+                yield b":"
+                yield from self.iter_parts(value)
+            yield b"}"
+        else:
+            yield self.dumps(data)
+
@@ -0,0 +1,10 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+from app.api.search.views import SearchViewSet
+
+router = DefaultRouter()
+router.register(r"search", SearchViewSet, basename="search")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
@@ -0,0 +1,45 @@
+from rest_framework import serializers, viewsets
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from app.api.mixin import CachedResponseMixin
+from app.search_index import ENTITY_TYPES, SEARCH_SOURCES, search
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(required=False, allow_blank=True, default="")
+    type = serializers.ChoiceField(choices=ENTITY_TYPES, required=False)
+    offset = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class SearchViewSet(CachedResponseMixin, viewsets.ViewSet):
+    """Site-wide search over jobs, careers, news, training, Japan programs, FAQs and documents"""
+    permission_classes = [AllowAny]
+    # The index is rebuilt from these, so their versions key the cached responses
+    cache_dependencies = list(
+        dict.fromkeys(
+            model
+            for source in SEARCH_SOURCES
+            for model in [source.get_model(), *source.get_related_models()]
+        )
+    )
+
+    def list(self, request):
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        results, facets, count = search(
+            query["q"],
+            entity_type=query.get("type"),
+            offset=query["offset"],
+            limit=query["limit"],
+        )
+        return Response(
+            {
+                "query": query["q"],
+                "count": count,
+                "facets": facets,
+                "results": results,
+            }
+        )
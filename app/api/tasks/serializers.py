@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
+from app.models.task import Task
+
+
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = Task
+        fields = "__all__"
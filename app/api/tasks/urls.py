@@ -0,0 +1,10 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+from app.api.tasks.views import TaskViewSet
+
+router = DefaultRouter()
+router.register(r"tasks", TaskViewSet, basename="task")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
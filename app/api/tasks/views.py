@@ -0,0 +1,23 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from app.api.tasks.serializers import TaskSerializer
+from app.models.task import Task
+from app.tasks import queue_stats
+
+
+class TaskViewSet(viewsets.ReadOnlyModelViewSet):
+    """Background task status for staff, see app.tasks"""
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    permission_classes = [IsAdminUser]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["status", "name"]
+
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        """Get task counts by status and the queue lag"""
+        return Response(queue_stats())
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from app.api.mixin import DynamicFieldsMixin
 from app.models.training import TrainingCourse, TrainingFacility
 
 
-class TrainingCourseSerializer(serializers.ModelSerializer):
+class TrainingCourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     course_type_display = serializers.CharField(
         source="get_course_type_display", read_only=True
     )
@@ -12,7 +14,7 @@ class TrainingCourseSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class TrainingFacilitySerializer(serializers.ModelSerializer):
+class TrainingFacilitySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TrainingFacility
         fields = "__all__"
@@ -1,14 +1,25 @@
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from app.api.mixin import (
+    AutoPrefetchMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+)
 from app.models.training import TrainingCourse, TrainingFacility
 from app.api.training.serializers import TrainingCourseSerializer, TrainingFacilitySerializer
 
 
-class TrainingCourseViewSet(viewsets.ReadOnlyModelViewSet):
+class TrainingCourseViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    GroupedListMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for training courses"""
     queryset = TrainingCourse.objects.filter(is_active=True)
     serializer_class = TrainingCourseSerializer
@@ -22,15 +33,15 @@ class TrainingCourseViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"])
     def by_type(self, request):
         """Get courses grouped by type"""
-        courses_by_type = {}
-        for course_type, label in TrainingCourse.COURSE_TYPE:
-            courses = self.queryset.filter(course_type=course_type)
-            if courses.exists():
-                courses_by_type[course_type] = self.get_serializer(courses, many=True).data
-        return Response(courses_by_type)
+        return self.grouped_response("course_type", TrainingCourse.COURSE_TYPE)
 
 
-class TrainingFacilityViewSet(viewsets.ReadOnlyModelViewSet):
+class TrainingFacilityViewSet(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    AutoPrefetchMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """API endpoint for training facilities"""
     queryset = TrainingFacility.objects.all()
     serializer_class = TrainingFacilitySerializer
@@ -14,6 +14,8 @@ from app.api.csr.urls import router as csr_router
 from app.api.career.urls import router as career_router
 from app.api.japan.urls import router as japan_router
 from app.api.home.urls import router as home_router
+from app.api.search.urls import router as search_router
+from app.api.tasks.urls import router as tasks_router
 
 router = DefaultRouter()
 router.registry.extend(office_router.registry)
@@ -29,6 +31,8 @@ router.registry.extend(csr_router.registry)
 router.registry.extend(career_router.registry)
 router.registry.extend(japan_router.registry)
 router.registry.extend(home_router.registry)
+router.registry.extend(search_router.registry)
+router.registry.extend(tasks_router.registry)
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -7,4 +7,5 @@ class AppConfig(AppConfig):
     
     def ready(self):
         from app import admin
+        from app import signals
         
\ No newline at end of file
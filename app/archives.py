@@ -0,0 +1,148 @@
+import io
+import posixpath
+import zipfile
+from hashlib import md5
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from loguru import logger
+
+from app.models.medianews import MediaAlbum
+from app.tasks import task
+
+ARCHIVES_DIR = "archives/albums"
+CHUNK_SIZE = 64 * 1024
+
+
+class ChunkBuffer:
+    """Write-only, unseekable file object collecting what ``zipfile`` writes."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+
+class IterStream(io.RawIOBase):
+    """Readable file object over an iterator of bytes, for ``storage.save()``."""
+
+    def __init__(self, iterator):
+        self.iterator = iterator
+        self.pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.pending:
+            self.pending = next(self.iterator, None)
+            if self.pending is None:
+                self.pending = b""
+                return 0
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+
+def album_photos(album):
+    """``[(storage name, uploaded_at)]`` of the album's photos, in display order."""
+    return list(
+        album.photo.exclude(image="")
+        .order_by("display_order", "pk")
+        .values_list("image", "uploaded_at")
+    )
+
+
+def album_archive_name(album, photos):
+    # Changes with the photo list, so an archive is never served for other photos
+    fingerprint = md5(
+        repr([name for name, uploaded_at in photos]).encode(), usedforsecurity=False
+    ).hexdigest()[:12]
+    return f"{ARCHIVES_DIR}/{album.slug}-{fingerprint}.zip"
+
+
+def iter_zip(photos, storage=default_storage):
+    """
+    Yield a ZIP of ``photos`` (see ``album_photos``) as it is written.
+
+    Entries are stored, not deflated: the images are compressed already.
+    ``zipfile`` writes to an unseekable buffer, so each entry is followed
+    by a data descriptor instead of being patched in place, and memory
+    stays at one chunk whatever the album size. Missing files are skipped.
+    """
+    buffer = ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for index, (name, uploaded_at) in enumerate(photos, start=1):
+            try:
+                size = storage.size(name)
+                source = storage.open(name)
+            except OSError as exc:
+                logger.warning(f"Skipping {name} in album archive: {exc}")
+                continue
+            info = zipfile.ZipInfo(
+                f"{index:03d}-{posixpath.basename(name)}",
+                date_time=timezone.localtime(uploaded_at).timetuple()[:6],
+            )
+            info.compress_type = zipfile.ZIP_STORED
+            # Lets zipfile decide on ZIP64 up front
+            info.file_size = size
+            with source, archive.open(info, "w") as target:
+                while chunk := source.read(CHUNK_SIZE):
+                    target.write(chunk)
+                    yield from buffer.drain()
+            yield from buffer.drain()
+    yield from buffer.drain()
+
+
+def get_album_archive(album, photos):
+    """Storage name of the prebuilt archive of ``photos``, None if not built yet."""
+    name = album_archive_name(album, photos)
+    if album.archive.name == name and default_storage.exists(name):
+        return name
+    return None
+
+
+@task(priority=-10)
+def build_album_archive(album_pk):
+    """Write the album's ZIP to storage for ``MediaAlbumViewSet.download``."""
+    album = MediaAlbum.objects.filter(pk=album_pk).first()
+    if album is None:
+        return
+    photos = album_photos(album)
+    if get_album_archive(album, photos):
+        return
+    name = album_archive_name(album, photos)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    saved = default_storage.save(name, File(IterStream(iter_zip(photos)), name=name))
+
+    previous = album.archive.name
+    # Written without save(), the receivers would clear it again
+    updated = MediaAlbum.objects.filter(pk=album_pk, archive=previous).update(
+        archive=saved
+    )
+    if not updated:
+        # Invalidated while building
+        default_storage.delete(saved)
+    elif previous and previous != saved:
+        default_storage.delete(previous)
+
+
+def clear_album_archive(album_pk):
+    """Drop the prebuilt archive of the album, after its photos changed."""
+    name = (
+        MediaAlbum.objects.filter(pk=album_pk).values_list("archive", flat=True).first()
+    )
+    if name and MediaAlbum.objects.filter(pk=album_pk, archive=name).update(archive=""):
+        default_storage.delete(name)
@@ -0,0 +1,68 @@
+import time
+
+from django.core.cache import cache
+
+
+def incr_counter(key, delta=1):
+    """Increment a cache backed counter, creating it on first use."""
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # The key was evicted between add() and incr()
+        cache.set(key, delta, timeout=None)
+        return delta
+
+
+def get_counters(*keys):
+    """Return the current value of each counter, defaulting to 0."""
+    values = cache.get_many(keys)
+    return {key: values.get(key, 0) for key in keys}
+
+
+def get_generation(key):
+    """
+    Return the current generation stored under ``key``.
+
+    Generations are seeded from the clock so that a counter lost to cache
+    eviction never comes back with a value that was already handed out.
+    """
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(key):
+    """Move ``key`` to a new generation, orphaning everything keyed on the old one."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+        return cache.get(key)
+
+
+def _model_key(model, suffix):
+    return f"model:{model._meta.label_lower}:{suffix}"
+
+
+def get_model_versions(models):
+    """Return ``{model: version}``, bumped on every save/delete of the model."""
+    keys = {model: _model_key(model, "version") for model in models}
+    found = cache.get_many(keys.values())
+    return {
+        model: found[key] if key in found else get_generation(key)
+        for model, key in keys.items()
+    }
+
+
+def get_model_changed_at(models):
+    """Return the latest time (epoch seconds) any of ``models`` was changed."""
+    found = cache.get_many([_model_key(model, "changed_at") for model in models])
+    return max(found.values(), default=None)
+
+
+def bump_model_version(model):
+    bump_generation(_model_key(model, "version"))
+    cache.set(_model_key(model, "changed_at"), int(time.time()), timeout=None)
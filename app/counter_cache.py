@@ -0,0 +1,113 @@
+from django.db.models import Count, F, Q
+
+from app.models.industry import Client
+from app.models.job import Job, JobApplication
+from app.models.medianews import MediaPhoto
+
+
+class CounterCache:
+    """
+    Keep ``parent.<counter_field>`` equal to the number of ``child`` rows
+    pointing at it through ``fk`` (and matching ``condition``, a dict of
+    exact field values).
+
+    Creates, deletes, FK moves and condition changes adjust the stored
+    column with a single ``F()`` update, so concurrent writers never lose
+    increments. The parent lists the column in ``counter_fields`` (see
+    ``CounterFieldsMixin``) so its own saves leave it alone. ``recount()``
+    repairs drift from bulk updates.
+    """
+
+    def __init__(self, child, fk, counter_field, condition=None):
+        self.child = child
+        self.fk = child._meta.get_field(fk)
+        self.parent = self.fk.related_model
+        self.counter_field = counter_field
+        self.condition = condition or {}
+        self.state_attr = f"_counter_cache_{fk}_{counter_field}"
+
+    def __str__(self):
+        return f"{self.parent.__name__}.{self.counter_field}"
+
+    @property
+    def tracked_fields(self):
+        return {self.fk.name, self.fk.attname, *self.condition}
+
+    def matches(self, values):
+        return all(values[name] == value for name, value in self.condition.items())
+
+    def current_state(self, instance):
+        values = {name: getattr(instance, name) for name in self.condition}
+        return getattr(instance, self.fk.attname), self.matches(values)
+
+    def adjust(self, parent_id, delta):
+        if parent_id is None:
+            return
+        self.parent.objects.filter(pk=parent_id).update(
+            **{self.counter_field: F(self.counter_field) + delta}
+        )
+
+    def pre_save(self, sender, instance, update_fields=None, **kwargs):
+        if instance._state.adding or instance.pk is None:
+            return
+        if update_fields is not None and not self.tracked_fields & set(update_fields):
+            return
+        values = (
+            self.child.objects.filter(pk=instance.pk)
+            .values(self.fk.attname, *self.condition)
+            .first()
+        )
+        if values is not None:
+            setattr(
+                instance,
+                self.state_attr,
+                (values[self.fk.attname], self.matches(values)),
+            )
+
+    def post_save(self, sender, instance, created, **kwargs):
+        new_parent, new_matches = self.current_state(instance)
+        if created:
+            if new_matches:
+                self.adjust(new_parent, 1)
+            return
+
+        previous = instance.__dict__.pop(self.state_attr, None)
+        if previous is None or previous == (new_parent, new_matches):
+            return
+        old_parent, old_matches = previous
+        if old_matches:
+            self.adjust(old_parent, -1)
+        if new_matches:
+            self.adjust(new_parent, 1)
+
+    def post_delete(self, sender, instance, **kwargs):
+        parent_id, matches = self.current_state(instance)
+        if matches:
+            self.adjust(parent_id, -1)
+
+    def recount(self):
+        """Recompute every counter from scratch, returns the number of rows fixed."""
+        related_name = self.fk.remote_field.get_accessor_name()
+        condition = Q(
+            **{
+                f"{related_name}__{name}": value
+                for name, value in self.condition.items()
+            }
+        )
+        fixed = 0
+        parents = self.parent.objects.annotate(
+            actual=Count(related_name, filter=condition or None)
+        ).values_list("pk", self.counter_field, "actual")
+        for pk, stored, actual in parents:
+            if stored != actual:
+                self.parent.objects.filter(pk=pk).update(**{self.counter_field: actual})
+                fixed += 1
+        return fixed
+
+
+COUNTER_CACHES = [
+    CounterCache(JobApplication, "job", "application_count"),
+    CounterCache(MediaPhoto, "album", "photo_count"),
+    CounterCache(Job, "industry", "open_job_count", condition={"status": "open"}),
+    CounterCache(Client, "industry", "client_count"),
+]
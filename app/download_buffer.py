@@ -0,0 +1,133 @@
+import atexit
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from loguru import logger
+
+from app.cache import bump_model_version
+from app.models.document import Document, DocumentDownloadDaily
+
+
+class DownloadCounterBuffer:
+    """
+    Collect document downloads in memory and write them in batches.
+
+    ``record()`` only touches a dict under a lock. The pending deltas are
+    written with ``F()`` updates in a single transaction once
+    ``flush_events`` downloads have piled up, ``flush_interval`` seconds
+    have passed, or the process exits. Each process keeps its own buffer,
+    the ``F()`` updates make the sums come out right across workers.
+    """
+
+    def __init__(self, flush_interval, flush_events):
+        self.flush_interval = flush_interval
+        self.flush_events = flush_events
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.totals = Counter()
+        self.daily = Counter()
+        self.events = 0
+        self.last_flush = time.monotonic()
+        self.timer = None
+
+    def record(self, document_id):
+        with self.lock:
+            self.totals[document_id] += 1
+            self.daily[document_id, timezone.localdate()] += 1
+            self.events += 1
+            due = (
+                self.events >= self.flush_events
+                or time.monotonic() - self.last_flush >= self.flush_interval
+            )
+            if not due:
+                self.schedule()
+        if due:
+            self.flush()
+
+    def pending(self, document_id):
+        """Downloads of ``document_id`` recorded but not written yet."""
+        with self.lock:
+            return self.totals[document_id]
+
+    def schedule(self):
+        # Called with self.lock held, makes sure a quiet period still flushes
+        if self.timer is None:
+            self.timer = threading.Timer(self.flush_interval, self.flush_in_thread)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own connections
+            connections.close_all()
+
+    def take(self):
+        with self.lock:
+            totals, daily = self.totals, self.daily
+            self.totals, self.daily = Counter(), Counter()
+            self.events = 0
+            self.last_flush = time.monotonic()
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        return totals, daily
+
+    def restore(self, totals, daily):
+        with self.lock:
+            self.totals.update(totals)
+            self.daily.update(daily)
+            self.events += sum(totals.values())
+            self.schedule()
+
+    def flush(self):
+        """Write the pending deltas, returns the number of downloads written."""
+        with self.flush_lock:
+            totals, daily = self.take()
+            if not totals:
+                return 0
+            try:
+                self.write(totals, daily)
+            except Exception:
+                logger.exception("Flushing document download counters failed")
+                self.restore(totals, daily)
+                return 0
+            return sum(totals.values())
+
+    def write(self, totals, daily):
+        with transaction.atomic():
+            for document_id, delta in totals.items():
+                Document.objects.filter(pk=document_id).update(
+                    download_count=F("download_count") + delta
+                )
+            for (document_id, date), delta in daily.items():
+                self.add_daily(document_id, date, delta)
+            # update() sends no signals, expire cached document responses once per batch
+            transaction.on_commit(lambda: bump_model_version(Document))
+
+    def add_daily(self, document_id, date, delta):
+        rows = DocumentDownloadDaily.objects.filter(document_id=document_id, date=date)
+        if rows.update(count=F("count") + delta):
+            return
+        try:
+            with transaction.atomic():
+                DocumentDownloadDaily.objects.create(
+                    document_id=document_id, date=date, count=delta
+                )
+        except IntegrityError:
+            # Another worker created the row first, or the document is gone
+            rows.update(count=F("count") + delta)
+
+
+download_buffer = DownloadCounterBuffer(
+    flush_interval=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL,
+    flush_events=settings.DOWNLOAD_COUNTER_FLUSH_EVENTS,
+)
+
+atexit.register(download_buffer.flush)
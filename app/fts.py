@@ -0,0 +1,115 @@
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.html import escape
+
+from app.models.job import Job
+
+# FTS5 mirror of the searchable Job text, rowid is the Job primary key
+JOB_FTS_TABLE = "app_job_fts"
+JOB_FTS_FIELDS = ("title", "description", "requirements")
+# bm25 column weights, in JOB_FTS_FIELDS order
+JOB_FTS_WEIGHTS = (10.0, 1.0, 2.0)
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_enabled = {}
+
+
+def fts_supported(connection):
+    """True when ``connection`` is SQLite compiled with FTS5."""
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return ("ENABLE_FTS5",) in cursor.fetchall()
+
+
+def fts_enabled(using=DEFAULT_DB_ALIAS):
+    """True when the FTS table exists on ``using``, checked once per process."""
+    if using not in _enabled:
+        connection = connections[using]
+        _enabled[using] = (
+            connection.vendor == "sqlite"
+            and JOB_FTS_TABLE in connection.introspection.table_names()
+        )
+    return _enabled[using]
+
+
+def create_job_fts_table(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {JOB_FTS_TABLE} USING fts5("
+            f"{', '.join(JOB_FTS_FIELDS)}, tokenize='porter unicode61')"
+        )
+    _enabled.pop(connection.alias, None)
+
+
+def drop_job_fts_table(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {JOB_FTS_TABLE}")
+    _enabled.pop(connection.alias, None)
+
+
+def _insert_rows(cursor, rows):
+    cursor.executemany(
+        f"INSERT INTO {JOB_FTS_TABLE} (rowid, {', '.join(JOB_FTS_FIELDS)}) "
+        f"VALUES (%s{', %s' * len(JOB_FTS_FIELDS)})",
+        rows,
+    )
+
+
+def index_job(job, using=DEFAULT_DB_ALIAS):
+    if not fts_enabled(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {JOB_FTS_TABLE} WHERE rowid = %s", [job.pk])
+        _insert_rows(
+            cursor, [(job.pk, *(getattr(job, field) or "" for field in JOB_FTS_FIELDS))]
+        )
+
+
+def unindex_job(pk, using=DEFAULT_DB_ALIAS):
+    if not fts_enabled(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {JOB_FTS_TABLE} WHERE rowid = %s", [pk])
+
+
+def rebuild_job_fts(jobs=None, using=DEFAULT_DB_ALIAS):
+    """Refill the FTS table from scratch, returns the number of jobs indexed."""
+    if jobs is None:
+        jobs = Job.objects.using(using)
+    jobs = jobs.order_by()
+    rows = list(jobs.values_list("pk", *JOB_FTS_FIELDS))
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {JOB_FTS_TABLE}")
+        _insert_rows(cursor, rows)
+    return len(rows)
+
+
+def build_match_query(text):
+    """
+    Turn free text into an FTS5 query where every word must match as a
+    prefix, so "maint tech" finds "Maintenance Technician".
+
+    Words are quoted, so FTS5 operators in user input are matched as text.
+    """
+    tokens = TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+# Snippet markers that cannot occur in the indexed text, swapped for <mark>
+# tags after the surrounding text has been escaped
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+
+
+def highlight_snippet(snippet):
+    return (
+        escape(snippet)
+        .replace(SNIPPET_START, "<mark>")
+        .replace(SNIPPET_END, "</mark>")
+    )
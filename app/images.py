@@ -0,0 +1,394 @@
+import base64
+import posixpath
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from loguru import logger
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from app.models.industry import Client, Industry
+from app.models.japan import JapanTeamMember
+from app.models.job import Job
+from app.models.medianews import MediaAlbum, MediaPhoto, NewsPost
+from app.models.office import Company, Leadership
+
+# Named bounding boxes, the aspect ratio is kept and images are never upscaled
+DERIVATIVE_SIZES = {
+    "thumb": (160, 160),
+    "card": (640, 640),
+    "hero": (1920, 1920),
+}
+DERIVATIVES_DIR = "derivatives"
+# get_thumbnail_url() remembers where a thumbnail is for this long
+THUMBNAIL_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Encoder options for derivatives kept in the original's format
+BASE_FORMATS = {
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "GIF": {"optimize": True},
+    "WEBP": {"quality": 80},
+}
+
+# Variants written next to JPEG/PNG originals and derivatives as
+# "<name><extension>", most preferred first. See app.media for the
+# Accept negotiation.
+MODERN_FORMATS = {
+    media_type: spec
+    for media_type, spec in {
+        "image/avif": ("AVIF", ".avif", {"quality": 55, "speed": 8}),
+        "image/webp": ("WEBP", ".webp", {"quality": 80, "method": 4}),
+    }.items()
+    # Pillow may be built without an encoder
+    if features.check(spec[0].lower())
+}
+TRANSCODED_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# ImageFields that get derivatives on upload
+DERIVATIVE_FIELDS = {
+    Job: ["image"],
+    Company: ["hero_image", "hero_image1", "hero_image2", "hero_image3"],
+    Client: ["logo"],
+    MediaPhoto: ["image"],
+    NewsPost: ["featured_image"],
+    Leadership: ["photo"],
+    JapanTeamMember: ["photo"],
+}
+
+# ImageFields whose size, dominant colour and placeholder are kept in a
+# JSONField next to them: {model: {image field: metadata field}}
+IMAGE_META_FIELDS = {
+    Job: {"image": "image_meta"},
+    NewsPost: {"featured_image": "featured_image_meta"},
+    MediaAlbum: {"cover_image": "cover_image_meta"},
+    MediaPhoto: {"image": "image_meta"},
+    Industry: {"image": "image_meta"},
+}
+# Inlined placeholder, scaled up and blurred by the client: (bounding box,
+# format, media type, encoder options). A lossy WebP this size is 100-200
+# bytes as a data URI, PNG is the fallback for Pillow builds without WebP.
+# Colour profiles are left out, they would outweigh the pixels.
+if features.check("webp"):
+    LQIP_FORMAT = (
+        (16, 16), "WEBP", "image/webp", {"quality": 50, "icc_profile": None}
+    )
+else:
+    LQIP_FORMAT = ((8, 8), "PNG", "image/png", {"optimize": True, "icc_profile": None})
+
+# EXIF orientations that swap width and height
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def derivative_name(name, size):
+    """Storage name of the ``size`` derivative of the file stored as ``name``."""
+    return posixpath.join(DERIVATIVES_DIR, size, name)
+
+
+def derivative_names(name):
+    return {size: derivative_name(name, size) for size in DERIVATIVE_SIZES}
+
+
+def variant_name(name, media_type):
+    """Storage name of ``name`` transcoded to ``media_type``, e.g. a.jpg.webp."""
+    return name + MODERN_FORMATS[media_type][1]
+
+
+def is_transcoded(name):
+    return name.lower().endswith(TRANSCODED_EXTENSIONS)
+
+
+def planned_files(name, sizes=None):
+    """
+    ``{box: [(storage name, media type)]}`` of every file generated from
+    the image stored as ``name``, or only of the ``sizes`` derivatives. A
+    ``None`` box is the original size, a ``None`` media type the
+    original's own format.
+    """
+    transcode = is_transcoded(name)
+    plan = {}
+    sources = [] if sizes else [(None, name)]
+    sources += [
+        (DERIVATIVE_SIZES[size], target)
+        for size, target in derivative_names(name).items()
+        if not sizes or size in sizes
+    ]
+    for box, base in sources:
+        files = [] if box is None else [(base, None)]
+        if transcode:
+            files += [
+                (variant_name(base, media_type), media_type)
+                for media_type in MODERN_FORMATS
+            ]
+        if files:
+            plan[box] = files
+    return plan
+
+
+def encode(image, image_format, options):
+    output = BytesIO()
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    image.save(output, image_format, **options)
+    return output.getvalue()
+
+
+def generate_derivatives(name, storage=default_storage, force=False, sizes=None):
+    """
+    Write the ``DERIVATIVE_SIZES`` versions of the image stored as ``name``,
+    and the ``MODERN_FORMATS`` variants of it and of each version, and
+    return the names of the files written. ``sizes`` limits the work to
+    those versions.
+
+    Existing files are kept unless ``force`` is set, so this is cheap to
+    call on every save. The original is decoded once, big JPEGs at a
+    reduced scale when only smaller sizes are missing.
+    """
+    if not name:
+        return []
+    plan = {}
+    for box, files in planned_files(name, sizes).items():
+        missing = [
+            (target, media_type)
+            for target, media_type in files
+            if force or not storage.exists(target)
+        ]
+        if missing:
+            plan[box] = missing
+    if not plan:
+        return []
+
+    try:
+        with storage.open(name) as file, Image.open(file) as original:
+            image_format = original.format
+            if None not in plan:
+                # Decode at 1/2, 1/4 or 1/8 scale, at least the largest box
+                original.draft("RGB", max(plan, key=max))
+            image = ImageOps.exif_transpose(original)
+            image.load()
+    except (FileNotFoundError, UnidentifiedImageError, OSError) as exc:
+        logger.warning(f"No derivatives for {name}: {exc}")
+        return []
+    if image_format not in BASE_FORMATS:
+        image_format = "PNG"
+    if image.mode in ("1", "P"):
+        # Palette images would be resized with nearest neighbour
+        image = image.convert("RGBA")
+
+    written = []
+    # Original size first, then each size shrunk from the previous one
+    for box in sorted(plan, key=lambda box: (box is not None, -max(box or (0,)))):
+        if box is not None:
+            image.thumbnail(box, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        for target, media_type in plan[box]:
+            if media_type is None:
+                content = encode(image, image_format, BASE_FORMATS[image_format])
+            else:
+                target_format, extension, options = MODERN_FORMATS[media_type]
+                content = encode(image, target_format, options)
+            if storage.exists(target):
+                storage.delete(target)
+            written.append(storage.save(target, ContentFile(content)))
+    return written
+
+
+def generate_instance_derivatives(instance, force=False):
+    written = []
+    for field_name in DERIVATIVE_FIELDS[type(instance)]:
+        file = getattr(instance, field_name)
+        if file:
+            written += generate_derivatives(file.name, file.storage, force=force)
+    return written
+
+
+def with_updated_at(model, values):
+    """
+    ``values`` plus a fresh ``updated_at`` when ``model`` has one, for rows
+    written with update(): conditional GET and the incremental static
+    export go by it.
+    """
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        values["updated_at"] = timezone.now()
+    return values
+
+
+def derivative_sizes(name, storage=default_storage):
+    """The ``DERIVATIVE_SIZES`` whose copy of the file stored as ``name`` exists."""
+    return [
+        size
+        for size, target in derivative_names(name).items()
+        if storage.exists(target)
+    ]
+
+
+def stale_derivative_records(instance):
+    """
+    ``DERIVATIVE_FIELDS`` of ``instance`` whose recorded derivatives are
+    missing, incomplete or describe another file.
+    """
+    records = instance.derivatives or {}
+    stale = []
+    for field_name in DERIVATIVE_FIELDS[type(instance)]:
+        file = getattr(instance, field_name)
+        record = records.get(field_name)
+        if not file:
+            if record:
+                stale.append(field_name)
+        elif (
+            record is None
+            or record["name"] != file.name
+            or len(record["sizes"]) < len(DERIVATIVE_SIZES)
+        ):
+            stale.append(field_name)
+    return stale
+
+
+def update_derivative_records(instance):
+    """
+    Record which derivatives exist for the ``DERIVATIVE_FIELDS`` of
+    ``instance`` in its ``derivatives`` field, ``{field: {"name", "sizes"}}``,
+    so serializers do not have to look at the storage. Returns whether the
+    record changed. The row is updated without save() (and its signals),
+    and only while it still holds the files that were checked.
+    """
+    model = type(instance)
+    names = {}
+    records = {}
+    for field_name in DERIVATIVE_FIELDS[model]:
+        file = getattr(instance, field_name)
+        names[field_name] = file.name if file else ""
+        if file:
+            records[field_name] = {
+                "name": file.name,
+                "sizes": derivative_sizes(file.name, file.storage),
+            }
+    if records == instance.derivatives:
+        return False
+    updated = model.objects.filter(pk=instance.pk, **names).update(
+        **with_updated_at(model, {"derivatives": records})
+    )
+    if updated:
+        instance.derivatives = records
+    return bool(updated)
+
+
+def get_derivative_urls(file):
+    """
+    ``{size: url}`` of the derivatives recorded for ``file`` (a FieldFile)
+    by ``update_derivative_records``, empty until they are written.
+    """
+    if not file:
+        return {}
+    records = getattr(file.instance, "derivatives", None) or {}
+    record = records.get(file.field.name) or {}
+    if record.get("name") != file.name:
+        return {}
+    return {
+        size: file.storage.url(derivative_name(file.name, size))
+        for size in record["sizes"]
+        if size in DERIVATIVE_SIZES
+    }
+
+
+def get_thumbnail_url(file, size="thumb"):
+    """
+    URL of the ``size`` derivative of ``file`` (a FieldFile), written on
+    first use when the upload has none yet. Falls back to the original's
+    URL for files Pillow cannot read, e.g. SVG logos.
+    """
+    if not file:
+        return None
+    key = f"thumbnail:{size}:{file.name}"
+    url = cache.get(key)
+    if url is None:
+        storage = file.storage
+        target = derivative_name(file.name, size)
+        if storage.exists(target) or generate_derivatives(
+            file.name, storage, sizes=[size]
+        ):
+            url = storage.url(target)
+        else:
+            url = file.url
+        cache.set(key, url, THUMBNAIL_CACHE_TIMEOUT)
+    return url
+
+
+def dominant_color(image):
+    """Hex colour of the largest cluster of a small RGB(A) image."""
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        # Transparent areas show the page background, assume white
+        background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+        image = Image.alpha_composite(background, image.convert("RGBA"))
+    quantized = image.convert("RGB").quantize(colors=5)
+    palette = quantized.getpalette()
+    count, index = max(quantized.getcolors())
+    red, green, blue = palette[index * 3 : index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def image_metadata(name, storage=default_storage):
+    """
+    ``{"name", "width", "height", "color", "lqip"}`` of the image stored as
+    ``name``: the size as displayed (EXIF orientation applied), the
+    dominant colour, and a tiny WebP (or PNG) as a data URI. Only ``name`` is set
+    for files Pillow cannot read, so they are not retried on every save.
+    """
+    metadata = {"name": name}
+    try:
+        with storage.open(name) as file, Image.open(file) as original:
+            width, height = original.size
+            if original.getexif().get(0x0112) in ROTATED_ORIENTATIONS:
+                width, height = height, width
+            original.draft("RGB", (64, 64))
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((64, 64))
+    except (FileNotFoundError, UnidentifiedImageError, OSError) as exc:
+        logger.warning(f"No metadata for {name}: {exc}")
+        return metadata
+    if image.mode not in ("RGB", "RGBA", "LA"):
+        image = image.convert("RGBA")
+    metadata.update(width=width, height=height, color=dominant_color(image))
+    box, image_format, media_type, options = LQIP_FORMAT
+    image.thumbnail(box)
+    placeholder = encode(image, image_format, options)
+    metadata["lqip"] = f"data:{media_type};base64," + base64.b64encode(
+        placeholder
+    ).decode()
+    return metadata
+
+
+def stale_image_metadata(instance, force=False):
+    """
+    ``(image field, metadata field)`` pairs of ``instance`` whose metadata
+    is missing or describes another file.
+    """
+    stale = []
+    for field_name, meta_field in IMAGE_META_FIELDS[type(instance)].items():
+        file = getattr(instance, field_name)
+        meta = getattr(instance, meta_field) or {}
+        if force or meta.get("name") != (file.name if file else None):
+            if file or meta:
+                stale.append((field_name, meta_field))
+    return stale
+
+
+def update_image_metadata(instance, force=False):
+    """
+    Compute and store the stale metadata of ``instance`` and return the
+    metadata fields written. Rows are updated without save() (and its
+    signals), and only while they still hold the file that was read.
+    """
+    model = type(instance)
+    written = []
+    for field_name, meta_field in stale_image_metadata(instance, force=force):
+        file = getattr(instance, field_name)
+        metadata = image_metadata(file.name, file.storage) if file else {}
+        updated = model.objects.filter(
+            pk=instance.pk, **{field_name: file.name if file else ""}
+        ).update(**with_updated_at(model, {meta_field: metadata}))
+        if updated:
+            setattr(instance, meta_field, metadata)
+            written.append(meta_field)
+    return written
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from app.api.home.snapshot import invalidate_home_snapshot
+from app.cache import bump_model_version
+from app.images import IMAGE_META_FIELDS, update_image_metadata
+
+
+class Command(BaseCommand):
+    help = "Stores the size, dominant colour and placeholder of existing images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute metadata that is already stored",
+        )
+
+    def handle(self, *args, **options):
+        for model, fields in IMAGE_META_FIELDS.items():
+            columns = [*fields, *fields.values()]
+            written = 0
+            for instance in model.objects.only("pk", *columns).iterator():
+                written += len(update_image_metadata(instance, force=options["force"]))
+            if written:
+                bump_model_version(model)
+            self.stdout.write(f"{model.__name__}: {written} image(s) updated")
+        invalidate_home_snapshot()
+        self.stdout.write(self.style.SUCCESS("Image metadata stored"))
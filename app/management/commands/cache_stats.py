@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from app.api.home.snapshot import snapshot_stats
+from app.api.mixin import CachedResponseMixin, response_cache_counter
+from app.api.urls import router
+from app.cache import get_counters
+
+
+class Command(BaseCommand):
+    help = "Shows hit/miss counters of the API response caches"
+
+    def handle(self, *args, **kwargs):
+        home = snapshot_stats()
+        self.print_row("home (snapshot)", home["hits"], home["misses"])
+
+        for prefix, viewset, basename in router.registry:
+            if not issubclass(viewset, CachedResponseMixin):
+                continue
+            if not viewset.response_cache:
+                self.stdout.write(f"{basename:<24} disabled")
+                continue
+            hits_key = response_cache_counter(basename, "hits")
+            misses_key = response_cache_counter(basename, "misses")
+            counters = get_counters(hits_key, misses_key)
+            self.print_row(basename, counters[hits_key], counters[misses_key])
+
+    def print_row(self, name, hits, misses):
+        total = hits + misses
+        ratio = f"{hits / total:.1%}" if total else "-"
+        self.stdout.write(f"{name:<24} hits={hits:<8} misses={misses:<8} ratio={ratio}")
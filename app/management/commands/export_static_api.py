@@ -0,0 +1,252 @@
+import gzip
+import json
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import brotli
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.utils import timezone
+from rest_framework import mixins
+from rest_framework.permissions import AllowAny
+
+from app.api.urls import router
+from app.cache import get_model_versions
+
+MANIFEST = "manifest.json"
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports every public read-only API endpoint (lists and their pages, "
+        "details and GET actions) as gzip/brotli precompressed JSON files. "
+        "/api/jobs/ is written to api/jobs/index.json and /api/jobs/?page=2 "
+        "to api/jobs/page/2/index.json."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output_dir",
+            nargs="?",
+            default=str(settings.BASE_DIR / "static_api"),
+        )
+        parser.add_argument(
+            "--base-url",
+            default="http://localhost",
+            help="Scheme and host used for absolute URLs inside the payloads",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only re-export endpoints and objects changed since the last run",
+        )
+
+    def handle(self, *args, **options):
+        self.output_dir = Path(options["output_dir"])
+        self.verbosity = options["verbosity"]
+        base_url = urlsplit(options["base_url"])
+        self.client = Client(
+            HTTP_HOST=base_url.netloc, secure=base_url.scheme == "https"
+        )
+
+        manifest = self.load_manifest()
+        self.previous_files = manifest.get("files", {})
+        previous_versions = manifest.get("versions", {})
+        since = manifest.get("exported_at") if options["incremental"] else None
+        if since:
+            since = datetime.fromisoformat(since)
+
+        exported_at = timezone.now()
+        self.files = {}
+        self.written = 0
+        versions = {}
+
+        for prefix, viewset, basename in router.registry:
+            if issubclass(viewset, mixins.CreateModelMixin):
+                # Form endpoints stay on Django
+                continue
+            if not self.is_public(viewset):
+                # Admin endpoints (task queue, ...)
+                continue
+
+            models = self.get_models(viewset)
+            current = {}
+            if models is not None:
+                current = {
+                    model._meta.label_lower: version
+                    for model, version in get_model_versions(models).items()
+                }
+                versions.update(current)
+
+            changed = {
+                label
+                for label, version in current.items()
+                if previous_versions.get(label) != version
+            }
+            if since and models is not None and not changed:
+                self.keep_previous(prefix)
+                continue
+
+            # Details of untouched objects can be kept when only the primary
+            # model changed and it records its own updates.
+            detail_since = None
+            if since and models and changed == {models[0]._meta.label_lower}:
+                detail_since = since
+
+            self.stdout.write(f"Exporting /api/{prefix}/")
+            self.export_viewset(prefix, viewset, detail_since)
+
+        self.prune()
+        self.save_manifest(
+            {
+                "exported_at": exported_at.isoformat(),
+                "versions": versions,
+                "files": self.files,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(self.files)} endpoints to {self.output_dir} "
+                f"({self.written} written)"
+            )
+        )
+
+    def get_models(self, viewset):
+        """Models the viewset's responses are built from, None when unknown."""
+        view = viewset(action="list", kwargs={}, format_kwarg=None)
+        if not hasattr(view, "get_cache_models"):
+            return None
+        return view.get_cache_models()
+
+    def export_viewset(self, prefix, viewset, detail_since):
+        base = f"/api/{prefix}/"
+        # File downloads and other non-JSON actions stay on Django
+        excluded = getattr(viewset, "static_export_exclude", ())
+        extra_actions = [
+            action
+            for action in viewset.get_extra_actions()
+            if "get" in action.mapping
+            and action.__name__ not in excluded
+            and self.is_public(viewset, action)
+        ]
+
+        if hasattr(viewset, "list"):
+            self.export_list(base)
+        for action in extra_actions:
+            if not action.detail:
+                self.export_url(f"{base}{action.url_path}/")
+
+        if not hasattr(viewset, "retrieve"):
+            return
+        view = viewset(action="retrieve", kwargs={}, format_kwarg=None)
+        queryset = view.get_queryset()
+        lookups = list(queryset.values_list(view.lookup_field, flat=True))
+        changed = None
+        field_names = {field.name for field in queryset.model._meta.fields}
+        if detail_since and "updated_at" in field_names:
+            changed = set(
+                queryset.filter(updated_at__gt=detail_since).values_list(
+                    view.lookup_field, flat=True
+                )
+            )
+
+        for lookup in lookups:
+            url = f"{base}{lookup}/"
+            if changed is not None and lookup not in changed:
+                self.keep_previous_file(url)
+            else:
+                self.export_url(url)
+            # Detail actions (related jobs, ...) depend on sibling objects too
+            for action in extra_actions:
+                if action.detail:
+                    self.export_url(f"{url}{action.url_path}/")
+
+    def is_public(self, viewset, action=None):
+        permission_classes = viewset.permission_classes
+        if action is not None:
+            permission_classes = action.kwargs.get(
+                "permission_classes", permission_classes
+            )
+        return all(permission is AllowAny for permission in permission_classes)
+
+    def export_list(self, url):
+        data = self.export_url(url)
+        page = 1
+        while isinstance(data, dict) and data.get("next"):
+            page += 1
+            data = self.export_url(f"{url}?page={page}")
+
+    def export_url(self, url):
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        if response.status_code != 200:
+            if self.verbosity > 1:
+                self.stdout.write(f"  skipped {url} ({response.status_code})")
+            return None
+        if response["Content-Type"].split(";")[0] != "application/json":
+            response.close()
+            if self.verbosity > 1:
+                self.stdout.write(f"  skipped {url} ({response['Content-Type']})")
+            return None
+        if response.streaming:
+            content = b"".join(response.streaming_content)
+        else:
+            content = response.content
+        self.write(url, content)
+        return json.loads(content)
+
+    def path_for(self, url):
+        parts = urlsplit(url)
+        path = parts.path.strip("/")
+        if parts.query.startswith("page="):
+            path = f"{path}/page/{parts.query[len('page='):]}"
+        return f"{path}/index.json"
+
+    def write(self, url, content):
+        relative = self.path_for(url)
+        digest = sha256(content).hexdigest()
+        self.files[relative] = digest
+
+        path = self.output_dir / relative
+        if self.previous_files.get(relative) == digest and path.exists():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        Path(f"{path}.gz").write_bytes(gzip.compress(content, 9, mtime=0))
+        Path(f"{path}.br").write_bytes(brotli.compress(content))
+        self.written += 1
+
+    def keep_previous(self, prefix):
+        """Carry over every file of an unchanged endpoint from the last run."""
+        for relative, digest in self.previous_files.items():
+            if relative.startswith(f"api/{prefix}/"):
+                self.files[relative] = digest
+
+    def keep_previous_file(self, url):
+        relative = self.path_for(url)
+        if relative in self.previous_files:
+            self.files[relative] = self.previous_files[relative]
+        else:
+            self.export_url(url)
+
+    def prune(self):
+        """Remove files of objects that no longer exist."""
+        for relative in set(self.previous_files) - set(self.files):
+            path = self.output_dir / relative
+            path.unlink(missing_ok=True)
+            for suffix in COMPRESSED_SUFFIXES:
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    def load_manifest(self):
+        path = self.output_dir / MANIFEST
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def save_manifest(self, manifest):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / MANIFEST).write_text(json.dumps(manifest, indent=2))
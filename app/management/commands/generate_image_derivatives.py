@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from app.api.home.snapshot import invalidate_home_snapshot
+from app.cache import bump_model_version
+from app.images import (
+    DERIVATIVE_FIELDS,
+    generate_instance_derivatives,
+    update_derivative_records,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the resized image copies (thumb/card/hero) for existing "
+        "uploads and records which ones exist"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate derivatives that already exist",
+        )
+
+    def handle(self, *args, **options):
+        for model, field_names in DERIVATIVE_FIELDS.items():
+            written = 0
+            recorded = 0
+            queryset = model.objects.only("pk", "derivatives", *field_names)
+            for instance in queryset.iterator():
+                written += len(
+                    generate_instance_derivatives(instance, force=options["force"])
+                )
+                recorded += update_derivative_records(instance)
+            if recorded:
+                bump_model_version(model)
+            self.stdout.write(
+                f"{model.__name__}: {written} file(s) written, "
+                f"{recorded} record(s) updated"
+            )
+        invalidate_home_snapshot()
+        self.stdout.write(self.style.SUCCESS("Image derivatives generated"))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from app.api.mixin import AutoPrefetchMixin
+from app.api.prefetch import infer_related_lookups
+from app.api.urls import router
+
+
+class Command(BaseCommand):
+    help = "Lists the select_related/prefetch_related lookups added to each API endpoint"
+
+    def handle(self, *args, **kwargs):
+        for prefix, viewset, basename in router.registry:
+            if not issubclass(viewset, AutoPrefetchMixin):
+                continue
+
+            actions = ["list"]
+            if hasattr(viewset, "retrieve"):
+                actions.append("retrieve")
+            for action in actions:
+                view = viewset(action=action, kwargs={}, format_kwarg=None)
+                serializer_class = view.get_serializer_class()
+                select, prefetch = infer_related_lookups(serializer_class)
+                if not select and not prefetch:
+                    if kwargs["verbosity"] > 1:
+                        self.stdout.write(f"/api/{prefix}/ {action}: nothing to join")
+                    continue
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"/api/{prefix}/ {action} ({serializer_class.__name__})"
+                    )
+                )
+                if select:
+                    self.stdout.write(f"    select_related: {', '.join(select)}")
+                if prefetch:
+                    self.stdout.write(f"    prefetch_related: {', '.join(prefetch)}")
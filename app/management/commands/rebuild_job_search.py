@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from app.fts import create_job_fts_table, fts_supported, rebuild_job_fts
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the SQLite FTS5 index behind the job search"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **kwargs):
+        using = kwargs["database"]
+        connection = connections[using]
+        if not fts_supported(connection):
+            raise CommandError(
+                f"Database '{using}' has no FTS5 support, job search uses LIKE queries"
+            )
+
+        with transaction.atomic(using=using):
+            create_job_fts_table(connection)
+            indexed = rebuild_job_fts(using=using)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} job(s)"))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from app.search_index import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the site-wide search index behind /api/search/"
+
+    def handle(self, *args, **kwargs):
+        for entity_type, count in rebuild_search_index().items():
+            self.stdout.write(f"{entity_type}: {count} indexed")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
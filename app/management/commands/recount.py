@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from app.counter_cache import COUNTER_CACHES
+
+
+class Command(BaseCommand):
+    help = "Recomputes the stored counter caches (application, photo, job and client counts)"
+
+    def handle(self, *args, **kwargs):
+        for counter in COUNTER_CACHES:
+            fixed = counter.recount()
+            style = self.style.WARNING if fixed else self.style.SUCCESS
+            self.stdout.write(style(f"{counter}: {fixed} row(s) fixed"))
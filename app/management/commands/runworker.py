@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from loguru import logger
+
+from app.tasks import claim, execute, prune_finished, requeue_stale
+
+# How often the worker looks for tasks lost with a dead worker and prunes old ones
+MAINTENANCE_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = "Runs queued background tasks (app.tasks) in a thread or process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Number of tasks run at the same time",
+        )
+        parser.add_argument(
+            "--pool",
+            choices=["thread", "process"],
+            default="thread",
+            help="Run tasks in threads (I/O bound work) or processes (CPU bound work)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before looking for new tasks when idle",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no task is ready instead of waiting for more",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(options["concurrency"], 1)
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        if options["pool"] == "process":
+            # Fresh interpreters, forked children would share the parent's
+            # database connections
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        else:
+            executor = ThreadPoolExecutor(concurrency, thread_name_prefix="task")
+
+        if settings.TASKS_RUN_EAGERLY:
+            self.stdout.write(
+                self.style.WARNING(
+                    "TASKS_RUN_EAGERLY is on, new tasks run in the web processes "
+                    "and only tasks queued before are left for this worker"
+                )
+            )
+        self.stdout.write(
+            f"Worker {worker_id} running {concurrency} {options['pool']}(s)"
+        )
+        running = set()
+        last_maintenance = 0
+        with executor:
+            while not self.stopping:
+                if time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                    requeue_stale()
+                    prune_finished()
+                    last_maintenance = time.monotonic()
+
+                while len(running) < concurrency and not self.stopping:
+                    task = claim(worker_id)
+                    if task is None:
+                        break
+                    logger.info(f"Task {task.pk} {task.name} started")
+                    running.add(executor.submit(execute, task.pk))
+
+                if not running:
+                    if options["burst"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+                done, running = wait(
+                    running, timeout=options["poll_interval"], return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is not None:
+                        # The task stays running until requeue_stale() picks it up
+                        logger.error(f"Task runner crashed: {future.exception()!r}")
+            if running:
+                self.stdout.write(f"Waiting for {len(running)} running task(s)")
+        self.stdout.write(self.style.SUCCESS("Worker stopped"))
+
+    def stop(self, signum, frame):
+        self.stopping = True
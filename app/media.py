@@ -0,0 +1,223 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from app.images import MODERN_FORMATS, is_transcoded, variant_name
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+def accepted_image_types(request):
+    """
+    Media types listed explicitly in the Accept header with q > 0.
+
+    Wildcards are ignored on purpose: ``*/*`` says nothing about AVIF or
+    WebP support, browsers that decode them name them.
+    """
+    accepted = set()
+    for part in request.headers.get("Accept", "").split(","):
+        media_type, *params = (item.strip() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(media_type.lower())
+    return accepted
+
+
+def negotiate_variant(request, path):
+    """
+    Name of the best variant of the image stored as ``path`` for
+    ``request``, or ``path`` itself when no accepted variant exists or
+    none is smaller.
+    """
+    accepted = accepted_image_types(request)
+    try:
+        size = default_storage.size(path)
+    except (OSError, ValueError):
+        return path
+    for media_type in MODERN_FORMATS:
+        if media_type not in accepted:
+            continue
+        variant = variant_name(path, media_type)
+        try:
+            if default_storage.size(variant) < size:
+                return variant
+        except (OSError, ValueError):
+            continue
+    return path
+
+
+def get_cache_control(path):
+    folders = settings.MEDIA_CACHE_CONTROL
+    prefix = max(
+        (folder for folder in folders if path.startswith(folder)), key=len, default=None
+    )
+    return folders[prefix] if prefix is not None else None
+
+
+def file_etag(stat):
+    # Like nginx: a new upload or an edit in place changes size or mtime,
+    # and stat() is all it costs
+    return quote_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` (inclusive) of a single ``bytes=`` range, None when
+    the header should be ignored, or ``False`` when it cannot be satisfied.
+    Multiple ranges are answered with the whole file.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range, the last N bytes
+        length = int(last)
+        if not length:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        return False
+    return start, end
+
+
+def if_range_matches(request, etag, mtime):
+    if_range = request.headers.get("If-Range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        # Strong comparison
+        return if_range == etag
+    date = parse_http_date_safe(if_range)
+    return date is not None and int(mtime) <= date
+
+
+def iter_file_range(path, start, length):
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def offload_response(fullpath):
+    """An empty response telling the front proxy to send the file, if configured."""
+    offload = settings.MEDIA_OFFLOAD
+    if offload == "x-accel-redirect":
+        response = HttpResponse()
+        relative = os.path.relpath(fullpath, default_storage.location)
+        location = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + relative
+        response.headers["X-Accel-Redirect"] = quote(location)
+        return response
+    if offload == "x-sendfile":
+        response = HttpResponse()
+        response.headers["X-Sendfile"] = fullpath
+        return response
+    return None
+
+
+def send_file(request, path):
+    """
+    Respond with the file stored as ``path``.
+
+    Validators come from ``stat()`` alone: a strong ETag (the content hash
+    for deduplicated uploads, see ``app.storage``) and Last-Modified,
+    answered with 304/412 before the file is opened. ``Range`` requests
+    for a single range get a 206 (honouring ``If-Range``), and with
+    ``MEDIA_OFFLOAD`` set the transfer itself, ranges included, is left to
+    the front proxy through ``X-Accel-Redirect``/``X-Sendfile``.
+    """
+    fullpath = default_storage.path(path)
+    try:
+        stat = os.stat(fullpath)
+    except (OSError, ValueError):
+        raise Http404(f"“{path}” does not exist")
+    if not os.path.isfile(fullpath):
+        raise Http404(f"“{path}” does not exist")
+
+    digest = getattr(default_storage, "digest", lambda name: None)(path)
+    etag = quote_etag(digest) if digest else file_etag(stat)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat.st_mtime),
+        "Accept-Ranges": "bytes",
+    }
+    cache_control = get_cache_control(path)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    # Blobs have no extension, the requested name tells the type
+    content_type, encoding = mimetypes.guess_type(path)
+    content_type = content_type or "application/octet-stream"
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if response is None:
+        response = offload_response(fullpath)
+    if response is None:
+        byte_range = None
+        if "Range" in request.headers and if_range_matches(
+            request, etag, stat.st_mtime
+        ):
+            byte_range = parse_range(request.headers["Range"], stat.st_size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response.headers["Content-Range"] = f"bytes */{stat.st_size}"
+        elif byte_range is not None:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                iter_file_range(fullpath, start, length), status=206
+            )
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            response.headers["Content-Length"] = str(length)
+        else:
+            # FileResponse lets the WSGI server use sendfile() when it can
+            response = FileResponse(open(fullpath, "rb"))
+
+    if response.status_code in (200, 206):
+        response.headers["Content-Type"] = content_type
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+    for header, value in headers.items():
+        response.headers[header] = value
+    return response
+
+
+def serve_media(request, path):
+    """
+    Serve uploads from the default storage, see ``send_file``. JPEG/PNG
+    images are sent as AVIF or WebP when the client accepts it and a
+    smaller variant was generated (see ``app.images``); those responses
+    vary on Accept.
+    """
+    if not is_transcoded(path):
+        return send_file(request, path)
+    response = send_file(request, negotiate_variant(request, path))
+    patch_vary_headers(response, ["Accept"])
+    return response
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-18 13:41
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counters(apps, schema_editor):
+    Industry = apps.get_model("app", "Industry")
+    Job = apps.get_model("app", "Job")
+    MediaAlbum = apps.get_model("app", "MediaAlbum")
+
+    for industry in Industry.objects.annotate(
+        open_jobs=Count("jobs", filter=Q(jobs__status="open"), distinct=True),
+        clients_total=Count("clients", distinct=True),
+    ):
+        Industry.objects.filter(pk=industry.pk).update(
+            open_job_count=industry.open_jobs, client_count=industry.clients_total
+        )
+    for job in Job.objects.annotate(applications_total=Count("applications")):
+        Job.objects.filter(pk=job.pk).update(application_count=job.applications_total)
+    for album in MediaAlbum.objects.annotate(photos_total=Count("photo")):
+        MediaAlbum.objects.filter(pk=album.pk).update(photo_count=album.photos_total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0004_allowedemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="industry",
+            name="client_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="industry",
+            name="open_job_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="application_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="mediaalbum",
+            name="photo_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
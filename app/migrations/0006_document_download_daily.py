@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 13:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_counter_caches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentDownloadDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_downloads', to='app.document')),
+            ],
+            options={
+                'verbose_name_plural': 'Document Daily Downloads',
+                'ordering': ['-date', 'document'],
+                'unique_together': {('document', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+from app import fts
+
+
+def create_job_fts(apps, schema_editor):
+    connection = schema_editor.connection
+    # Other backends keep using the LIKE based SearchFilter
+    if not fts.fts_supported(connection):
+        return
+    fts.create_job_fts_table(connection)
+    Job = apps.get_model("app", "Job")
+    fts.rebuild_job_fts(Job.objects.using(connection.alias), using=connection.alias)
+
+
+def drop_job_fts(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        fts.drop_job_fts_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0006_document_download_daily"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_job_fts, drop_job_fts),
+    ]
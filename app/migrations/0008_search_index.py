@@ -0,0 +1,49 @@
+# Generated by Django 6.0 on 2026-10-18 13:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from app.search_index import rebuild_search_index
+
+
+def populate_search_index(apps, schema_editor):
+    rebuild_search_index(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_job_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(max_length=50)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=300)),
+                ('summary', models.TextField(blank=True)),
+                ('slug', models.CharField(blank=True, max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Search Entries',
+                'unique_together': {('entity_type', 'object_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='app.searchentry')),
+            ],
+            options={
+                'unique_together': {('term', 'entry')},
+            },
+        ),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
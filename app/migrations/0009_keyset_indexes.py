@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-18 13:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at', 'id'], name='contact_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employerinquiry',
+            index=models.Index(fields=['-created_at', 'id'], name='inquiry_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['-created_at', 'id'], name='jobapplication_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(fields=['-created_at', 'id'], name='newspost_keyset_idx'),
+        ),
+    ]
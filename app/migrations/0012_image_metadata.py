@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-18 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_task_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='industry',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='mediaalbum',
+            name='cover_image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='mediaphoto',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='featured_image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaalbum',
+            name='archive',
+            field=models.FileField(blank=True, editable=False, upload_to='archives/albums/'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0 on 2026-10-18 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0013_album_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='japanteammember',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='leadership',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='mediaphoto',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
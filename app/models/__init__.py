@@ -3,7 +3,7 @@
 from .career import Career
 from .contact import ContactMessage
 from .csr import CSRProject
-from .document import Document
+from .document import Document, DocumentDownloadDaily
 from .industry import Client, Industry, Testimonial
 from .inquiry import EmployerInquiry
 from .japan import (
@@ -21,3 +21,6 @@ from .misc import FAQ, PrivacyPolicy, TermsOfService
 from .office import Branch, Certification, Company, Leadership, Office
 from .training import TrainingCourse, TrainingFacility
 from .sso import AllowedEmail
+from .search import SearchEntry, SearchPosting
+from .storage import Blob, BlobReference
+from .task import Task
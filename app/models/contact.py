@@ -25,6 +25,10 @@ class ContactMessage(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        # Keyset pagination, see app.api.pagination
+        indexes = [
+            models.Index(fields=["-created_at", "id"], name="contact_keyset_idx")
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.inquiry_type}"
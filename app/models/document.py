@@ -1,7 +1,9 @@
 from django.db import models
 
+from app.models.mixins import CounterFieldsMixin
 
-class Document(models.Model):
+
+class Document(CounterFieldsMixin, models.Model):
     DOCUMENT_TYPE = [
         ("employer_form", "Employer Form"),
         ("candidate_form", "Candidate Form"),
@@ -18,6 +20,8 @@ class Document(models.Model):
     file = models.FileField(upload_to="documents/")
     file_size = models.CharField(max_length=50, blank=True)
     download_count = models.IntegerField(default=0)
+    # Maintained by app.download_buffer
+    counter_fields = ("download_count",)
 
     is_active = models.BooleanField(default=True)
     display_order = models.IntegerField(default=0)
@@ -28,3 +32,21 @@ class Document(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class DocumentDownloadDaily(models.Model):
+    """Downloads per document per day, written by app.download_buffer"""
+
+    document = models.ForeignKey(
+        Document, on_delete=models.CASCADE, related_name="daily_downloads"
+    )
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-date", "document"]
+        unique_together = ["document", "date"]
+        verbose_name_plural = "Document Daily Downloads"
+
+    def __str__(self):
+        return f"{self.document} - {self.date}: {self.count}"
@@ -1,15 +1,23 @@
 from django.db import models
 
+from app.models.mixins import CounterFieldsMixin
 
-class Industry(models.Model):
+
+class Industry(CounterFieldsMixin, models.Model):
     name = models.CharField(max_length=255)
     slug = models.SlugField(unique=True, blank=True)
     icon = models.CharField(max_length=50, help_text="CSS icon class or emoji")
     description = models.TextField()
     overview = models.TextField(blank=True)
     image = models.ImageField(upload_to="industries/", blank=True)
+    # Size, colour and placeholder, maintained by app.images
+    image_meta = models.JSONField(default=dict, blank=True, editable=False)
     display_order = models.IntegerField(default=0)
     is_featured = models.BooleanField(default=False)
+    # Maintained by app.counter_cache
+    open_job_count = models.PositiveIntegerField(default=0, editable=False)
+    client_count = models.PositiveIntegerField(default=0, editable=False)
+    counter_fields = ("open_job_count", "client_count")
 
     class Meta:
         ordering = ["display_order"]
@@ -27,6 +35,8 @@ class Industry(models.Model):
 class Client(models.Model):
     name = models.CharField(max_length=255)
     logo = models.ImageField(upload_to="clients/", blank=True)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     website = models.URLField(blank=True)
     industry = models.ForeignKey(
         Industry, on_delete=models.SET_NULL, null=True, related_name="clients"
@@ -41,6 +41,10 @@ class EmployerInquiry(models.Model):
     class Meta:
         ordering = ["-created_at"]
         verbose_name_plural = "Employer Inquiries"
+        # Keyset pagination, see app.api.pagination
+        indexes = [
+            models.Index(fields=["-created_at", "id"], name="inquiry_keyset_idx")
+        ]
 
     def __str__(self):
         return f"{self.company_name} - {self.number_of_workers} workers"
@@ -68,6 +68,8 @@ class JapanTeamMember(models.Model):
     role = models.CharField(max_length=200, blank=True)
     bio = models.TextField(blank=True)
     photo = models.ImageField(upload_to="japan/team/", blank=True)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     order = models.IntegerField(default=0)
 
     class Meta:
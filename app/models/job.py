@@ -3,6 +3,7 @@ from django.db import models
 from django.utils.text import slugify
 
 from app.models.industry import Client, Industry
+from app.models.mixins import CounterFieldsMixin
 
 
 class JobCategory(models.Model):
@@ -28,7 +29,7 @@ class JobCategory(models.Model):
         return f"{self.name}({self.get_skill_level_display()})"
 
 
-class Job(models.Model):
+class Job(CounterFieldsMixin, models.Model):
     STATUS_CHOICES = [
         ("open", "Open"),
         ("closed", "Closed"),
@@ -39,6 +40,10 @@ class Job(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
     image = models.ImageField(upload_to="jobs/", blank=True)
+    # Size, colour and placeholder, maintained by app.images
+    image_meta = models.JSONField(default=dict, blank=True, editable=False)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     category = models.ForeignKey(
         JobCategory, on_delete=models.CASCADE, related_name="jobs"
     )
@@ -59,6 +64,9 @@ class Job(models.Model):
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="open")
     is_featured = models.BooleanField(default=False)
     application_deadline = models.DateField(null=True, blank=True)
+    # Maintained by app.counter_cache
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+    counter_fields = ("application_count",)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -69,10 +77,16 @@ class Job(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.title)
+            # Ensure slug uniqueness in case multiple jobs share the same title,
+            # the candidates are fetched in one query
+            taken = set(
+                Job.objects.filter(slug__startswith=base_slug)
+                .exclude(pk=self.pk)
+                .values_list("slug", flat=True)
+            )
             slug = base_slug
             counter = 1
-            # Ensure slug uniqueness in case multiple jobs share the same title
-            while Job.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+            while slug in taken:
                 slug = f"{base_slug}-{counter}"
                 counter += 1
             self.slug = slug
@@ -124,6 +138,10 @@ class JobApplication(models.Model):
     class Meta:
         verbose_name_plural = "Job Applications"
         ordering = ["-created_at"]
+        # Keyset pagination, see app.api.pagination
+        indexes = [
+            models.Index(fields=["-created_at", "id"], name="jobapplication_keyset_idx")
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.job.title}"
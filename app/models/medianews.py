@@ -2,7 +2,9 @@ from django.contrib.auth.models import User
 from django.db import models
 from django.utils.text import slugify
 
-class MediaAlbum(models.Model):
+from app.models.mixins import CounterFieldsMixin
+
+class MediaAlbum(CounterFieldsMixin, models.Model):
     ALBUM_TYPE = [
         ("office", "Office"),
         ("training", "Training"),
@@ -17,8 +19,17 @@ class MediaAlbum(models.Model):
     album_type = models.CharField(max_length=50, choices=ALBUM_TYPE)
     description = models.TextField(blank=True)
     cover_image = models.ImageField(upload_to="gallery/covers/")
+    # Size, colour and placeholder, maintained by app.images
+    cover_image_meta = models.JSONField(default=dict, blank=True, editable=False)
     date = models.DateField()
     display_order = models.IntegerField(default=0)
+    # Maintained by app.counter_cache
+    photo_count = models.PositiveIntegerField(default=0, editable=False)
+    counter_fields = ("photo_count",)
+    # Prebuilt ZIP of the photos, maintained by app.archives
+    archive = models.FileField(
+        upload_to="archives/albums/", blank=True, editable=False
+    )
 
     class Meta:
         ordering = ['-date']
@@ -34,6 +45,10 @@ class MediaAlbum(models.Model):
 class MediaPhoto(models.Model):
     album = models.ForeignKey(MediaAlbum, on_delete=models.CASCADE, related_name="photo")
     image = models.ImageField(upload_to="gallery/photos/")
+    # Size, colour and placeholder, maintained by app.images
+    image_meta = models.JSONField(default=dict, blank=True, editable=False)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     caption = models.CharField(max_length=255, blank=True)
     display_order = models.IntegerField(default=0)
     uploaded_at = models.DateTimeField(auto_now_add=True)
@@ -58,6 +73,10 @@ class NewsPost(models.Model):
     slug = models.SlugField(unique=True, blank=True)
     post_type = models.CharField(max_length=50, choices=POST_TYPE)
     featured_image = models.ImageField(upload_to="news/")
+    # Size, colour and placeholder, maintained by app.images
+    featured_image_meta = models.JSONField(default=dict, blank=True, editable=False)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     summary = models.TextField(max_length=300)
     content = models.TextField()
 
@@ -71,6 +90,10 @@ class NewsPost(models.Model):
 
     class Meta:
         ordering = ["-published_date"]
+        # Keyset pagination, see app.api.pagination
+        indexes = [
+            models.Index(fields=["-created_at", "id"], name="newspost_keyset_idx")
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -0,0 +1,24 @@
+class CounterFieldsMixin:
+    """
+    Leave ``counter_fields`` out of the UPDATE of a plain ``save()``.
+
+    app.counter_cache and app.download_buffer adjust them with ``F()``,
+    writing back the values loaded with the instance would undo the
+    increments made since. ``save(update_fields=[...])`` still writes them.
+    """
+
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if (
+            self.counter_fields
+            and not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
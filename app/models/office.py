@@ -23,6 +23,8 @@ class Company(models.Model):
     hero_image1 = models.ImageField(upload_to="hero/", blank=True)
     hero_image2 = models.ImageField(upload_to="hero/", blank=True)
     hero_image3 = models.ImageField(upload_to="hero/", blank=True)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     hero_headline = models.CharField(
         max_length=200, default="Trusted International Recruitment Partner Since 2023"
     )
@@ -77,6 +79,8 @@ class Leadership(models.Model):
     position = models.CharField(max_length=255)
     bio = models.TextField()
     photo = models.ImageField(upload_to="leadership/", blank=True)
+    # Sizes of the resized copies on storage, maintained by app.images
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     email = models.URLField(blank=True)
     display_order = models.IntegerField(default=0)
 
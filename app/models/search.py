@@ -0,0 +1,35 @@
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """One searchable object in the site-wide index, see app.search_index"""
+
+    entity_type = models.CharField(max_length=50)
+    object_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=300)
+    summary = models.TextField(blank=True)
+    slug = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["entity_type", "object_id"]
+        verbose_name_plural = "Search Entries"
+
+    def __str__(self):
+        return f"{self.entity_type}: {self.title}"
+
+
+class SearchPosting(models.Model):
+    """A term occurring in an entry, ``weight`` sums its field-weighted occurrences"""
+
+    term = models.CharField(max_length=100)
+    entry = models.ForeignKey(
+        SearchEntry, on_delete=models.CASCADE, related_name="postings"
+    )
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ["term", "entry"]
+
+    def __str__(self):
+        return f"{self.term} -> {self.entry_id}"
@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class Blob(models.Model):
+    """A unique upload stored once under its content hash, see app.storage"""
+
+    digest = models.CharField(max_length=64, primary_key=True)
+    size = models.PositiveBigIntegerField()
+    # Number of BlobReference rows pointing here
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.digest
+
+
+class BlobReference(models.Model):
+    """A storage name, as kept in FileField values, and the blob holding its content"""
+
+    name = models.CharField(max_length=255, unique=True)
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name="references")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
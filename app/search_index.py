@@ -0,0 +1,336 @@
+import math
+import re
+from collections import Counter
+
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from app.models.search import SearchEntry, SearchPosting
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from in is it of on or the to with".split()
+)
+MAX_TERM_LENGTH = 100
+SUMMARY_LENGTH = 200
+
+
+def tokenize(text):
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in TOKEN_RE.findall(str(text).lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class SearchSource:
+    """
+    How one model feeds the site-wide search index.
+
+    Everything is described with field paths rather than methods, so the
+    same definition works on the historical models in migrations.
+    """
+
+    def __init__(self, entity_type, label, fields, title, summary, visible, lookup):
+        self.entity_type = entity_type
+        self.label = label
+        # {field path: weight}, a path may follow foreign keys ("program_type.name")
+        self.fields = fields
+        self.title = title
+        self.summary = summary
+        self.visible = visible
+        self.lookup = lookup
+
+    def __str__(self):
+        return self.entity_type
+
+    def get_model(self, apps=global_apps):
+        return apps.get_model(self.label)
+
+    @staticmethod
+    def resolve(instance, path):
+        value = instance
+        for name in path.split("."):
+            value = getattr(value, name, None)
+            if value is None:
+                return ""
+        return value
+
+    def is_visible(self, instance):
+        return all(
+            getattr(instance, name) == value for name, value in self.visible.items()
+        )
+
+    def get_related_models(self, apps=global_apps):
+        """``{model: [lookup]}`` of the foreign keys followed by ``fields``."""
+        related = {}
+        for path in self.fields:
+            if "." not in path:
+                continue
+            names = path.split(".")[:-1]
+            model = self.get_model(apps)
+            for name in names:
+                model = model._meta.get_field(name).related_model
+            related.setdefault(model, []).append("__".join(names))
+        return related
+
+    def get_queryset(self, apps=global_apps):
+        related = [path.rsplit(".", 1)[0] for path in self.fields if "." in path]
+        return (
+            self.get_model(apps)
+            .objects.filter(**self.visible)
+            .select_related(*{path.replace(".", "__") for path in related})
+        )
+
+    def build_entry(self, instance):
+        parts = (self.resolve(instance, path) for path in self.title)
+        title = " - ".join(str(part) for part in parts if part)
+        summary = strip_tags(str(self.resolve(instance, self.summary)))
+        entry = {
+            "entity_type": self.entity_type,
+            "object_id": instance.pk,
+            "title": title[:300],
+            "summary": Truncator(" ".join(summary.split())).chars(SUMMARY_LENGTH),
+            "slug": self.resolve(instance, self.lookup) if self.lookup != "id" else "",
+        }
+        weights = Counter()
+        for path, weight in self.fields.items():
+            for token in tokenize(strip_tags(str(self.resolve(instance, path)))):
+                weights[token] += weight
+        return entry, weights
+
+
+SEARCH_SOURCES = [
+    SearchSource(
+        "job",
+        "app.Job",
+        fields={
+            "title": 5,
+            "country": 3,
+            "location": 2,
+            "category.name": 3,
+            "description": 1,
+            "requirements": 1,
+        },
+        title=("title",),
+        summary="description",
+        visible={"status": "open"},
+        lookup="slug",
+    ),
+    SearchSource(
+        "career",
+        "app.Career",
+        fields={
+            "title": 5,
+            "department": 2,
+            "location": 2,
+            "summary": 1,
+            "responsibilities": 1,
+            "requirements": 1,
+        },
+        title=("title",),
+        summary="summary",
+        visible={"is_active": True},
+        lookup="slug",
+    ),
+    SearchSource(
+        "news",
+        "app.NewsPost",
+        fields={"title": 5, "summary": 2, "content": 1},
+        title=("title",),
+        summary="summary",
+        visible={"is_published": True},
+        lookup="slug",
+    ),
+    SearchSource(
+        "training",
+        "app.TrainingCourse",
+        fields={"name": 5, "description": 1, "syllabus": 1, "prerequisites": 1},
+        title=("name",),
+        summary="description",
+        visible={"is_active": True},
+        lookup="slug",
+    ),
+    SearchSource(
+        "japan_program",
+        "app.JapanProgram",
+        fields={
+            "program_type.name": 5,
+            "subtitle": 4,
+            "target_level": 2,
+            "overview": 1,
+            "objective": 1,
+        },
+        title=("program_type.name", "subtitle"),
+        summary="overview",
+        visible={"is_active": True},
+        lookup="id",
+    ),
+    SearchSource(
+        "faq",
+        "app.FAQ",
+        fields={"question": 5, "answer": 1},
+        title=("question",),
+        summary="answer",
+        visible={"is_active": True},
+        lookup="id",
+    ),
+    SearchSource(
+        "document",
+        "app.Document",
+        fields={"title": 5, "description": 1},
+        title=("title",),
+        summary="description",
+        visible={"is_active": True},
+        lookup="id",
+    ),
+]
+
+ENTITY_TYPES = [source.entity_type for source in SEARCH_SOURCES]
+
+
+def _write_entry(Entry, Posting, source, instance):
+    fields, weights = source.build_entry(instance)
+    entry, _ = Entry.objects.update_or_create(
+        entity_type=source.entity_type, object_id=instance.pk, defaults=fields
+    )
+    Posting.objects.filter(entry=entry).delete()
+    Posting.objects.bulk_create(
+        Posting(term=term, entry=entry, weight=weight)
+        for term, weight in weights.items()
+    )
+
+
+def index_object(source, instance):
+    """Add, refresh or drop ``instance`` depending on whether it is visible."""
+    with transaction.atomic():
+        if source.is_visible(instance):
+            _write_entry(SearchEntry, SearchPosting, source, instance)
+        else:
+            unindex_object(source, instance.pk)
+
+
+def unindex_object(source, pk):
+    # Postings go with it through the cascade
+    SearchEntry.objects.filter(entity_type=source.entity_type, object_id=pk).delete()
+
+
+def reindex_objects(source, pks):
+    """Refresh the objects of ``source`` with primary keys ``pks``, after update()."""
+    visible = source.get_queryset().filter(pk__in=pks)
+    indexed = set()
+    for obj in visible.iterator():
+        index_object(source, obj)
+        indexed.add(obj.pk)
+    SearchEntry.objects.filter(
+        entity_type=source.entity_type, object_id__in=set(pks) - indexed
+    ).delete()
+
+
+def reindex_related(source, instance):
+    """Refresh the objects of ``source`` whose indexed fields follow ``instance``."""
+    lookups = source.get_related_models()[type(instance)]
+    condition = Q.create([(lookup, instance) for lookup in lookups], connector=Q.OR)
+    for obj in source.get_queryset().filter(condition).iterator():
+        index_object(source, obj)
+
+
+def rebuild_search_index(apps=global_apps):
+    """Index every visible object from scratch, returns {entity_type: count}."""
+    Entry = apps.get_model("app", "SearchEntry")
+    Posting = apps.get_model("app", "SearchPosting")
+    counts = {}
+    with transaction.atomic():
+        Posting.objects.all().delete()
+        Entry.objects.all().delete()
+        for source in SEARCH_SOURCES:
+            counts[source.entity_type] = 0
+            for instance in source.get_queryset(apps).iterator():
+                _write_entry(Entry, Posting, source, instance)
+                counts[source.entity_type] += 1
+    return counts
+
+
+def _prefix(token):
+    # A range instead of LIKE so the (term, entry) index is used
+    return Q(term__gte=token, term__lt=token + "\uffff")
+
+
+def search(text, entity_type=None, offset=0, limit=20):
+    """
+    Rank entries containing every word of ``text`` (as a prefix).
+
+    Each word contributes its field-weighted occurrences scaled by its
+    inverse document frequency. Returns ``(results, facets, count)``, the
+    facets count matches per entity type before ``entity_type`` filtering.
+    """
+    tokens = list(dict.fromkeys(tokenize(text)))
+    facets = dict.fromkeys(ENTITY_TYPES, 0)
+    if not tokens:
+        return [], facets, 0
+
+    conditions = [_prefix(token) for token in tokens]
+    # One index range per word instead of an aggregate over every posting
+    frequencies = [
+        SearchPosting.objects.filter(condition).values("entry").distinct().count()
+        for condition in conditions
+    ]
+    if not all(frequencies):
+        return [], facets, 0
+    total = SearchEntry.objects.count()
+    idf = [math.log(1 + total / frequency) for frequency in frequencies]
+
+    matches = (
+        SearchPosting.objects.filter(Q.create(conditions, connector=Q.OR))
+        .values("entry")
+        .annotate(
+            score=Sum(
+                Case(
+                    *(
+                        When(condition, then=F("weight") * Value(weight))
+                        for condition, weight in zip(conditions, idf)
+                    ),
+                )
+            ),
+            **{
+                f"hit{i}": Count("pk", filter=condition)
+                for i, condition in enumerate(conditions)
+            },
+        )
+        .filter(**{f"hit{i}__gt": 0 for i in range(len(tokens))})
+    )
+
+    for row in (
+        SearchEntry.objects.filter(pk__in=matches.values("entry"))
+        .values("entity_type")
+        .annotate(count=Count("pk"))
+    ):
+        facets[row["entity_type"]] = row["count"]
+
+    if entity_type:
+        matches = matches.filter(entry__entity_type=entity_type)
+        count = facets.get(entity_type, 0)
+    else:
+        count = sum(facets.values())
+
+    page = list(
+        matches.order_by("-score", "entry").values_list("entry", "score")[
+            offset : offset + limit
+        ]
+    )
+    entries = SearchEntry.objects.in_bulk([entry_id for entry_id, _ in page])
+    results = [
+        {
+            "type": entries[entry_id].entity_type,
+            "id": entries[entry_id].object_id,
+            "slug": entries[entry_id].slug or None,
+            "title": entries[entry_id].title,
+            "summary": entries[entry_id].summary,
+            "score": round(score, 4),
+        }
+        for entry_id, score in page
+    ]
+    return results, facets, count
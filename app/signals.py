@@ -0,0 +1,253 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from app.api.home.snapshot import HOME_SNAPSHOT_MODELS, invalidate_home_snapshot
+from app.archives import clear_album_archive
+from app.cache import bump_model_version
+from app.counter_cache import COUNTER_CACHES
+from app.fts import index_job, unindex_job
+from app.images import (
+    DERIVATIVE_FIELDS,
+    IMAGE_META_FIELDS,
+    generate_instance_derivatives,
+    stale_derivative_records,
+    stale_image_metadata,
+    update_derivative_records,
+    update_image_metadata,
+    with_updated_at,
+)
+from app.models.job import Job
+from app.models.medianews import MediaAlbum, MediaPhoto
+from app.models.search import SearchEntry, SearchPosting
+from app.models.storage import Blob, BlobReference
+from app.models.task import Task
+from app.search_index import (
+    SEARCH_SOURCES,
+    index_object,
+    reindex_objects,
+    reindex_related,
+    unindex_object,
+)
+from app.tasks import task
+
+# Apps whose models carry a change counter (auth for NewsPost authors)
+VERSIONED_APP_LABELS = {"app", "auth"}
+# Derived from other models, which are versioned themselves, or storage and
+# task bookkeeping (app.storage, app.tasks). Leaving them without delete
+# receivers also lets Django delete their rows in bulk.
+UNVERSIONED_MODELS = {SearchEntry, SearchPosting, Blob, BlobReference, Task}
+
+
+def bump_model_version_receiver(sender, **kwargs):
+    transaction.on_commit(partial(bump_model_version, sender))
+
+
+for model in apps.get_models():
+    if model._meta.app_label not in VERSIONED_APP_LABELS:
+        continue
+    if model in UNVERSIONED_MODELS:
+        continue
+    label = model._meta.label_lower
+    post_save.connect(
+        bump_model_version_receiver,
+        sender=model,
+        dispatch_uid=f"model_version_save_{label}",
+    )
+    post_delete.connect(
+        bump_model_version_receiver,
+        sender=model,
+        dispatch_uid=f"model_version_delete_{label}",
+    )
+
+
+def invalidate_home_snapshot_receiver(sender, **kwargs):
+    # Wait for the commit, otherwise a concurrent request could rebuild the
+    # snapshot from data that is about to change.
+    transaction.on_commit(invalidate_home_snapshot)
+
+
+for model in HOME_SNAPSHOT_MODELS:
+    label = model._meta.label_lower
+    post_save.connect(
+        invalidate_home_snapshot_receiver,
+        sender=model,
+        dispatch_uid=f"home_snapshot_save_{label}",
+    )
+    post_delete.connect(
+        invalidate_home_snapshot_receiver,
+        sender=model,
+        dispatch_uid=f"home_snapshot_delete_{label}",
+    )
+
+
+def update_queryset(queryset, **values):
+    """
+    ``queryset.update(**values)`` for admin bulk actions, followed by what
+    the save receivers would have done: update() sends no signals, so the
+    cached responses keyed on the model version would stay stale and
+    unpublished rows would stay searchable.
+    """
+    model = queryset.model
+    with transaction.atomic():
+        pks = list(queryset.values_list("pk", flat=True))
+        updated = model.objects.filter(pk__in=pks).update(
+            **with_updated_at(model, values)
+        )
+        if model in SOURCES_BY_MODEL:
+            reindex_objects(SOURCES_BY_MODEL[model], pks)
+        transaction.on_commit(partial(bump_model_version, model))
+        if model in HOME_SNAPSHOT_MODELS:
+            transaction.on_commit(invalidate_home_snapshot)
+    return updated
+
+
+for counter in COUNTER_CACHES:
+    uid = f"counter_cache_{counter.child._meta.label_lower}_{counter.counter_field}"
+    pre_save.connect(counter.pre_save, sender=counter.child, dispatch_uid=f"{uid}_pre")
+    post_save.connect(counter.post_save, sender=counter.child, dispatch_uid=f"{uid}_save")
+    post_delete.connect(
+        counter.post_delete, sender=counter.child, dispatch_uid=f"{uid}_delete"
+    )
+
+
+def index_job_receiver(sender, instance, using=None, **kwargs):
+    # Written in the same transaction as the job row itself
+    index_job(instance, using=using)
+
+
+def unindex_job_receiver(sender, instance, using=None, **kwargs):
+    unindex_job(instance.pk, using=using)
+
+
+post_save.connect(index_job_receiver, sender=Job, dispatch_uid="job_fts_save")
+post_delete.connect(unindex_job_receiver, sender=Job, dispatch_uid="job_fts_delete")
+
+
+def index_search_receiver(sender, instance, **kwargs):
+    index_object(SOURCES_BY_MODEL[sender], instance)
+
+
+def unindex_search_receiver(sender, instance, **kwargs):
+    unindex_object(SOURCES_BY_MODEL[sender], instance.pk)
+
+
+SOURCES_BY_MODEL = {source.get_model(): source for source in SEARCH_SOURCES}
+
+for model in SOURCES_BY_MODEL:
+    label = model._meta.label_lower
+    post_save.connect(
+        index_search_receiver, sender=model, dispatch_uid=f"search_index_save_{label}"
+    )
+    post_delete.connect(
+        unindex_search_receiver,
+        sender=model,
+        dispatch_uid=f"search_index_delete_{label}",
+    )
+
+
+def reindex_related_search_receiver(sender, instance, **kwargs):
+    # Renaming a category changes the terms of its jobs. Deletes cascade to
+    # (or are protected by) the indexed rows, which unindex themselves.
+    for source in RELATED_SOURCES[sender]:
+        reindex_related(source, instance)
+
+
+RELATED_SOURCES = {}
+for source in SEARCH_SOURCES:
+    for model in source.get_related_models():
+        RELATED_SOURCES.setdefault(model, []).append(source)
+
+for model in RELATED_SOURCES:
+    post_save.connect(
+        reindex_related_search_receiver,
+        sender=model,
+        dispatch_uid=f"search_index_related_save_{model._meta.label_lower}",
+    )
+
+
+@task(priority=-10)
+def generate_derivatives(label, pk):
+    model = apps.get_model(label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return
+    # Existing derivatives are skipped, so only new uploads cost a resize
+    generate_instance_derivatives(instance)
+    if not update_derivative_records(instance):
+        return
+    # Responses cached since the commit were rendered without them
+    bump_model_version(model)
+    if model in HOME_SNAPSHOT_MODELS:
+        invalidate_home_snapshot()
+
+
+def generate_derivatives_receiver(sender, instance, **kwargs):
+    if not stale_derivative_records(instance):
+        return
+    # Queued in the same transaction, the worker picks it up after the commit
+    label = sender._meta.label_lower
+    generate_derivatives.enqueue(
+        label, instance.pk, dedupe_key=f"image_derivatives:{label}:{instance.pk}"
+    )
+
+
+for model in DERIVATIVE_FIELDS:
+    post_save.connect(
+        generate_derivatives_receiver,
+        sender=model,
+        dispatch_uid=f"image_derivatives_{model._meta.label_lower}",
+    )
+
+
+@task(priority=-5)
+def store_image_metadata(label, pk):
+    model = apps.get_model(label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not update_image_metadata(instance):
+        return
+    # Written with update(), so the save receivers did not run
+    bump_model_version(model)
+    if model in HOME_SNAPSHOT_MODELS:
+        invalidate_home_snapshot()
+
+
+def store_image_metadata_receiver(sender, instance, **kwargs):
+    # Nothing to queue unless an image was added, replaced or removed
+    if not stale_image_metadata(instance):
+        return
+    label = sender._meta.label_lower
+    store_image_metadata.enqueue(
+        label, instance.pk, dedupe_key=f"image_metadata:{label}:{instance.pk}"
+    )
+
+
+for model in IMAGE_META_FIELDS:
+    post_save.connect(
+        store_image_metadata_receiver,
+        sender=model,
+        dispatch_uid=f"image_metadata_{model._meta.label_lower}",
+    )
+
+
+def clear_album_archive_receiver(sender, instance, **kwargs):
+    transaction.on_commit(partial(clear_album_archive, instance.album_id))
+
+
+def delete_album_archive_receiver(sender, instance, **kwargs):
+    archive = instance.archive
+    if archive:
+        transaction.on_commit(partial(archive.storage.delete, archive.name))
+
+
+post_save.connect(
+    clear_album_archive_receiver, sender=MediaPhoto, dispatch_uid="album_archive_save"
+)
+post_delete.connect(
+    clear_album_archive_receiver, sender=MediaPhoto, dispatch_uid="album_archive_delete"
+)
+post_delete.connect(
+    delete_album_archive_receiver, sender=MediaAlbum, dispatch_uid="album_archive_album"
+)
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+from cachetools import TTLCache
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from app.models.storage import Blob, BlobReference
+
+BLOBS_DIR = "blobs"
+# name -> digest (None for files stored before deduplication), missing
+# names are not cached. Entries expire so deletes made by other processes
+# are picked up.
+MAPPING_CACHE_SIZE = 10000
+MAPPING_CACHE_TTL = 300
+
+
+class DedupFileSystemStorage(FileSystemStorage):
+    """
+    Content-addressed file system storage.
+
+    Uploads are hashed (SHA-256) while they are written to a temporary
+    file, and each distinct content is kept once under
+    ``blobs/<ab>/<cd>/<digest>``. The name Django asked for, the value kept
+    in the FileField, becomes a ``BlobReference`` to that blob, and blobs
+    count their references so the file goes away with the last one. URLs
+    and FileField values are the same as with ``FileSystemStorage``;
+    ``app.media`` resolves names to blobs through ``path()``. Files saved
+    before this storage was installed are read from their own path.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mapping = TTLCache(maxsize=MAPPING_CACHE_SIZE, ttl=MAPPING_CACHE_TTL)
+        self.mapping_lock = threading.Lock()
+
+    def blob_name(self, digest):
+        return "/".join([BLOBS_DIR, digest[:2], digest[2:4], digest])
+
+    def digest(self, name):
+        """Digest of the content stored as ``name``, None if it is not deduplicated."""
+        name = str(name).replace("\\", "/")
+        with self.mapping_lock:
+            if name in self.mapping:
+                return self.mapping[name]
+        digest = (
+            BlobReference.objects.filter(name=name)
+            .values_list("blob_id", flat=True)
+            .first()
+        )
+        # A missing file may be written any moment by another process (the
+        # task worker), only files that are there are remembered
+        if digest is not None or os.path.lexists(super().path(name)):
+            with self.mapping_lock:
+                self.mapping[name] = digest
+        return digest
+
+    def forget(self, name):
+        with self.mapping_lock:
+            self.mapping.pop(name, None)
+
+    def path(self, name):
+        digest = self.digest(name)
+        if digest is None:
+            return super().path(name)
+        return super().path(self.blob_name(digest))
+
+    def exists(self, name):
+        return self.digest(name) is not None or super().exists(name)
+
+    def _save(self, name, content):
+        name = name.replace("\\", "/")
+        directory = super().path(BLOBS_DIR)
+        os.makedirs(directory, exist_ok=True)
+
+        hasher = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as temporary:
+            try:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    hasher.update(chunk)
+                    temporary.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                os.unlink(temporary.name)
+                raise
+        digest = hasher.hexdigest()
+
+        blob_path = super().path(self.blob_name(digest))
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        if self.file_permissions_mode is not None:
+            os.chmod(temporary.name, self.file_permissions_mode)
+
+        try:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        Blob.objects.create(digest=digest, size=size)
+                except IntegrityError:
+                    pass
+                Blob.objects.filter(digest=digest).update(
+                    ref_count=F("ref_count") + 1
+                )
+                BlobReference.objects.create(name=name, blob_id=digest)
+                # Only once the row is written: a delete_orphan() of this
+                # digest now waits for the commit or has finished removing
+                # the file. Replaced even when it exists (same bytes).
+                os.replace(temporary.name, blob_path)
+        except BaseException:
+            if os.path.exists(temporary.name):
+                os.unlink(temporary.name)
+            raise
+        self.forget(name)
+        return name
+
+    def delete(self, name):
+        if not name:
+            raise ValueError("The name must be given to delete().")
+        digest = self.digest(name)
+        if digest is None:
+            return super().delete(name)
+        with transaction.atomic():
+            deleted, _ = BlobReference.objects.filter(name=name).delete()
+            if deleted:
+                Blob.objects.filter(digest=digest).update(
+                    ref_count=F("ref_count") - 1
+                )
+                Blob.objects.filter(digest=digest, ref_count=0).delete()
+            transaction.on_commit(lambda: self.delete_orphan(digest))
+        self.forget(name)
+
+    def delete_orphan(self, digest):
+        """
+        Remove the file of ``digest`` unless the content was stored again.
+
+        A placeholder row claims the digest while the file is removed: a
+        concurrent ``_save()`` of the same content either committed its row
+        first, and the insert fails, or waits on the row and moves its file
+        in after the removal.
+        """
+        try:
+            with transaction.atomic():
+                Blob.objects.create(digest=digest, size=0)
+                try:
+                    os.remove(super().path(self.blob_name(digest)))
+                except FileNotFoundError:
+                    pass
+                Blob.objects.filter(digest=digest).delete()
+        except IntegrityError:
+            pass
@@ -0,0 +1,221 @@
+import random
+import traceback
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from loguru import logger
+
+from app.models.task import Task
+
+# name -> TaskFunction, filled in by @task as modules are imported
+TASKS = {}
+
+
+class TaskFunction:
+    """A function registered with ``@task``, still callable directly."""
+
+    def __init__(self, func, name, priority, max_attempts):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, priority=None, dedupe_key=None, delay=None, **kwargs):
+        return enqueue(
+            self.name,
+            args,
+            kwargs,
+            priority=self.priority if priority is None else priority,
+            dedupe_key=dedupe_key,
+            delay=delay,
+            max_attempts=self.max_attempts,
+        )
+
+
+def task(func=None, *, name=None, priority=0, max_attempts=3):
+    """
+    Register ``func`` so it can be queued with ``func.enqueue(*args, **kwargs)``.
+
+    Arguments are stored as JSON, pass primary keys rather than instances.
+    The worker looks tasks up by name, so the defining module has to be
+    imported when the app loads (``app.signals`` is).
+    """
+    if func is None:
+        return partial(task, name=name, priority=priority, max_attempts=max_attempts)
+    name = name or f"{func.__module__}.{func.__qualname__}"
+    TASKS[name] = TaskFunction(func, name, priority, max_attempts)
+    return TASKS[name]
+
+
+def enqueue(
+    name,
+    args=(),
+    kwargs=None,
+    priority=0,
+    dedupe_key=None,
+    delay=None,
+    max_attempts=3,
+):
+    """
+    Queue a call of the task registered as ``name`` and return its ``Task``.
+
+    The row is written in the caller's transaction, so workers only see it
+    once that commits. With a ``dedupe_key`` already queued the existing
+    task is returned instead. ``delay`` (seconds or a timedelta) postpones
+    the first run. With ``TASKS_RUN_EAGERLY`` the task runs in-process
+    after the commit and None is returned.
+    """
+    kwargs = kwargs or {}
+    if settings.TASKS_RUN_EAGERLY:
+        transaction.on_commit(partial(TASKS[name].func, *args, **kwargs), robust=True)
+        return None
+    if isinstance(delay, (int, float)):
+        delay = timedelta(seconds=delay)
+    fields = {
+        "name": name,
+        "args": list(args),
+        "kwargs": kwargs,
+        "priority": priority,
+        "dedupe_key": dedupe_key,
+        "max_attempts": max_attempts,
+        "run_at": timezone.now() + (delay or timedelta()),
+    }
+    if dedupe_key is None:
+        return Task.objects.create(**fields)
+    try:
+        with transaction.atomic():
+            return Task.objects.create(**fields)
+    except IntegrityError:
+        existing = Task.objects.filter(dedupe_key=dedupe_key, status="queued").first()
+        if existing is None:
+            # Claimed in between, queue a fresh run
+            return Task.objects.create(**fields)
+        return existing
+
+
+def claim(worker_id):
+    """
+    Mark the next ready task as running for ``worker_id`` and return it,
+    or None when nothing is due.
+
+    The status check in the UPDATE makes the claim atomic on every
+    backend, a task lost to another worker just moves on to the next one.
+    """
+    now = timezone.now()
+    candidates = (
+        Task.objects.filter(status="queued", run_at__lte=now)
+        .order_by("-priority", "run_at")
+        .values_list("pk", flat=True)[:10]
+    )
+    for pk in candidates:
+        claimed = Task.objects.filter(pk=pk, status="queued").update(
+            status="running",
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+        if claimed:
+            return Task.objects.get(pk=pk)
+    return None
+
+
+def retry_delay(attempts):
+    """Exponential backoff with jitter, in seconds, before attempt ``attempts + 1``."""
+    delay = min(
+        settings.TASKS_RETRY_BACKOFF * 2 ** (attempts - 1),
+        settings.TASKS_RETRY_BACKOFF_MAX,
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+def finish(task, error=None):
+    now = timezone.now()
+    if error is None:
+        task.status = "succeeded"
+        task.last_error = ""
+        task.finished_at = now
+    elif task.attempts < task.max_attempts:
+        task.status = "queued"
+        task.last_error = error
+        task.run_at = now + timedelta(seconds=retry_delay(task.attempts))
+    else:
+        task.status = "failed"
+        task.last_error = error
+        task.finished_at = now
+    task.locked_by = ""
+    task.locked_at = None
+    try:
+        with transaction.atomic():
+            task.save()
+    except IntegrityError:
+        # The same work was queued again while this run failed, that one retries
+        task.status = "failed"
+        task.finished_at = now
+        task.save()
+
+
+def execute(pk):
+    """Run the claimed task ``pk`` and record the outcome, for worker threads/processes."""
+    close_old_connections()
+    try:
+        task = Task.objects.get(pk=pk)
+        error = None
+        try:
+            TASKS[task.name].func(*task.args, **task.kwargs)
+        except Exception:
+            error = traceback.format_exc()
+            logger.warning(f"Task {task.pk} {task.name} failed: {error}")
+        finish(task, error)
+        return task.status
+    finally:
+        close_old_connections()
+
+
+def requeue_stale():
+    """
+    Put tasks whose worker died back in the queue, or fail them when they
+    have used up their attempts. Returns the number of tasks touched.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT)
+    stale = Task.objects.filter(status="running", locked_at__lt=cutoff)
+    touched = 0
+    for task in stale:
+        touched += 1
+        finish(task, f"Worker {task.locked_by} did not finish the task")
+    return touched
+
+
+def prune_finished():
+    """Delete finished tasks older than ``TASKS_KEEP_FINISHED_DAYS``."""
+    cutoff = timezone.now() - timedelta(days=settings.TASKS_KEEP_FINISHED_DAYS)
+    deleted, _ = Task.objects.filter(
+        status__in=["succeeded", "failed"], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def queue_stats():
+    """Task counts by status plus the lag of the oldest ready task."""
+    now = timezone.now()
+    counts = dict.fromkeys((status for status, _ in Task.STATUS_CHOICES), 0)
+    rows = Task.objects.order_by().values_list("status").annotate(count=Count("pk"))
+    counts.update(rows)
+    oldest = (
+        Task.objects.filter(status="queued", run_at__lte=now)
+        .order_by("run_at")
+        .values_list("run_at", flat=True)
+        .first()
+    )
+    return {
+        "counts": counts,
+        "ready": Task.objects.filter(status="queued", run_at__lte=now).count(),
+        "oldest_ready_seconds": (now - oldest).total_seconds() if oldest else None,
+        "registered": sorted(TASKS),
+    }
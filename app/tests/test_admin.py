@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+
+from app.models.career import Career
+from app.models.medianews import NewsPost
+from app.tests.utils import AppTestCase
+
+
+class BulkActionTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_superuser("admin", "admin@example.com", "x")
+        self.client.force_login(admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts = [
+                NewsPost.objects.create(
+                    title=f"Deployment {i}",
+                    post_type="news",
+                    summary="Workers deployed",
+                    content="Details",
+                    is_published=True,
+                )
+                for i in range(3)
+            ]
+
+    def run_action(self, url, action, objects):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                url,
+                {"action": action, ACTION_CHECKBOX_NAME: [obj.pk for obj in objects]},
+            )
+        self.assertEqual(response.status_code, 302)
+
+    def count(self, url):
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["count"]
+
+    def test_unpublish_expires_cached_list(self):
+        self.assertEqual(self.count("/api/news/"), 3)
+        self.run_action("/app/newspost/", "unpublish_posts", self.posts[:1])
+        self.assertEqual(self.count("/api/news/"), 2)
+        self.run_action("/app/newspost/", "publish_posts", self.posts[:1])
+        self.assertEqual(self.count("/api/news/"), 3)
+
+    def test_updated_at_moves(self):
+        before = NewsPost.objects.get(pk=self.posts[0].pk).updated_at
+        self.run_action("/app/newspost/", "unpublish_posts", self.posts[:1])
+        self.assertGreater(NewsPost.objects.get(pk=self.posts[0].pk).updated_at, before)
+
+    def test_deactivate_expires_cached_careers(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            career = Career.objects.create(
+                title="HR Officer",
+                department="HR",
+                location="Kathmandu",
+                employment_type="full_time",
+                summary="People",
+                responsibilities="Hiring",
+                requirements="Degree",
+            )
+        self.assertEqual(self.count("/api/careers/"), 1)
+        self.run_action("/app/career/", "mark_as_inactive", [career])
+        self.assertEqual(self.count("/api/careers/"), 0)
+
+    def test_unpublish_drops_search_entries(self):
+        self.assertEqual(self.count("/api/search/?q=deployment&type=news"), 3)
+        self.run_action("/app/newspost/", "unpublish_posts", self.posts[:2])
+        self.assertEqual(self.count("/api/search/?q=deployment&type=news"), 1)
+        self.run_action("/app/newspost/", "publish_posts", self.posts[:2])
+        self.assertEqual(self.count("/api/search/?q=deployment&type=news"), 3)
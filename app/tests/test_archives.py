@@ -0,0 +1,108 @@
+import io
+import os
+import zipfile
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.utils import timezone
+
+from app import archives
+from app.api.medianews import views
+from app.archives import album_photos, build_album_archive, iter_zip
+from app.models.medianews import MediaAlbum, MediaPhoto
+from app.models.task import Task
+from app.tests.utils import AppTestCase, image_file
+
+
+class AlbumArchiveTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.album = MediaAlbum.objects.create(
+            title="Interview Day", album_type="interviews", date=timezone.localdate()
+        )
+        self.contents = []
+        for index, color in enumerate([(255, 0, 0), (0, 255, 0)]):
+            file = image_file(color=color)
+            self.contents.append(file.read())
+            file.seek(0)
+            MediaPhoto.objects.create(
+                album=self.album,
+                image=default_storage.save("gallery/photos/photo.jpg", file),
+                display_order=index,
+            )
+        self.url = f"/api/media-albums/{self.album.slug}/download/"
+
+    def read_zip(self, content):
+        archive = zipfile.ZipFile(io.BytesIO(content))
+        self.assertIsNone(archive.testzip())
+        return archive
+
+    def test_stream_stores_photos_in_order(self):
+        content = b"".join(iter_zip(album_photos(self.album)))
+        archive = self.read_zip(content)
+        infos = archive.infolist()
+        self.assertEqual([info.compress_type for info in infos], [zipfile.ZIP_STORED] * 2)
+        self.assertEqual([archive.read(info) for info in infos], self.contents)
+        # Same base name twice, the index keeps the entries apart
+        self.assertEqual(len({info.filename for info in infos}), 2)
+
+    def test_stream_skips_missing_files(self):
+        photos = album_photos(self.album) + [("gallery/photos/gone.jpg", timezone.now())]
+        archive = self.read_zip(b"".join(iter_zip(photos)))
+        self.assertEqual(len(archive.infolist()), 2)
+
+    @override_settings(TASKS_RUN_EAGERLY=False)
+    def test_download_streams_until_prebuilt(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertIn("interview-day.zip", response["Content-Disposition"])
+        streamed = b"".join(response.streaming_content)
+        self.assertEqual(
+            list(Task.objects.values_list("dedupe_key", flat=True)),
+            [f"album_archive:{self.album.pk}"],
+        )
+
+        build_album_archive(self.album.pk)
+        self.album.refresh_from_db()
+        self.assertTrue(self.album.archive.name.endswith(".zip"))
+
+        response = self.client.get(self.url)
+        self.assertEqual(response["Cache-Control"], "public, no-cache")
+        self.assertEqual(b"".join(response.streaming_content), streamed)
+        self.assertEqual(
+            self.client.get(self.url, HTTP_RANGE="bytes=0-3").status_code, 206
+        )
+
+    def test_eager_download_builds_once(self):
+        build = mock.Mock(wraps=iter_zip)
+        with (
+            mock.patch.object(archives, "iter_zip", build),
+            mock.patch.object(views, "iter_zip", build),
+        ):
+            response = self.client.get(self.url)
+            content = b"".join(response.streaming_content)
+            self.assertEqual(build.call_count, 1)
+            self.assertEqual(response["Cache-Control"], "public, no-cache")
+            self.assertEqual(len(self.read_zip(content).infolist()), 2)
+
+            response = self.client.get(self.url)
+            self.assertEqual(b"".join(response.streaming_content), content)
+            self.assertEqual(build.call_count, 1)
+        self.assertFalse(Task.objects.exists())
+
+    def test_photo_change_clears_archive(self):
+        build_album_archive(self.album.pk)
+        self.album.refresh_from_db()
+        name = self.album.archive.name
+        path = default_storage.path(name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MediaPhoto.objects.filter(album=self.album).first().delete()
+        self.album.refresh_from_db()
+        self.assertEqual(self.album.archive.name, "")
+        self.assertFalse(default_storage.exists(name))
+        self.assertFalse(os.path.exists(path))
+        archive = self.read_zip(b"".join(self.client.get(self.url).streaming_content))
+        self.assertEqual(len(archive.infolist()), 1)
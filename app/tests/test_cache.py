@@ -0,0 +1,100 @@
+import json
+
+from django.core.cache import cache
+
+from app.api.home.snapshot import snapshot_stats
+from app.api.mixin import response_cache_counter
+from app.models.industry import Testimonial
+from app.tests.utils import AppTestCase, make_client, make_job
+
+
+class HomeSnapshotTests(AppTestCase):
+    def get_home(self):
+        response = self.client.get("/api/home/", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_served_from_snapshot(self):
+        self.get_home()
+        with self.assertNumQueries(0):
+            self.get_home()
+        self.assertEqual(snapshot_stats()["hits"], 1)
+        self.assertEqual(snapshot_stats()["misses"], 1)
+
+    def test_rebuilt_after_commit(self):
+        self.assertEqual(self.get_home()["featured_clients"], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            make_client(is_featured=True)
+        clients = self.get_home()["featured_clients"]
+        self.assertEqual([client["name"] for client in clients], ["Acme"])
+
+    def test_rebuilt_on_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            testimonial = Testimonial.objects.create(
+                person_name="Ram",
+                person_position="Mason",
+                testimonial_text="Good",
+                is_featured=True,
+            )
+        self.assertEqual(len(self.get_home()["testimonials"]), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            testimonial.delete()
+        self.assertEqual(self.get_home()["testimonials"], [])
+
+    def test_kept_until_commit(self):
+        self.get_home()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            make_client(is_featured=True)
+            self.assertEqual(self.get_home()["featured_clients"], [])
+        self.assertTrue(callbacks)
+
+
+class ResponseCacheTests(AppTestCase):
+    url = "/api/jobs/"
+
+    def get_jobs(self, query=""):
+        response = self.client.get(
+            f"{self.url}{query}", HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def counters(self):
+        return (
+            cache.get(response_cache_counter("job", "hits"), 0),
+            cache.get(response_cache_counter("job", "misses"), 0),
+        )
+
+    def test_hits_per_query_string(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job()
+        self.get_jobs()
+        self.get_jobs("?search=")
+        self.assertEqual(self.counters(), (1, 1))
+        self.get_jobs("?ordering=vacancies")
+        self.assertEqual(self.counters(), (1, 2))
+
+    def test_invalidated_by_own_model(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = make_job()
+        self.assertEqual(self.get_jobs()["results"][0]["title"], "Mason")
+        with self.captureOnCommitCallbacks(execute=True):
+            job.title = "Carpenter"
+            job.save()
+        self.assertEqual(self.get_jobs()["results"][0]["title"], "Carpenter")
+        self.assertEqual(self.counters(), (0, 2))
+
+    def test_invalidated_by_dependency(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = make_job()
+        detail = f"{job.slug}/"
+        self.assertEqual(self.get_jobs(detail)["category"]["name"], "Mason")
+        with self.captureOnCommitCallbacks(execute=True):
+            job.category.name = "Masonry"
+            job.category.save()
+        self.assertEqual(self.get_jobs(detail)["category"]["name"], "Masonry")
+        self.assertEqual(self.counters(), (0, 2))
+
+    def test_browsable_api_not_cached(self):
+        self.client.get(self.url, HTTP_ACCEPT="text/html")
+        self.assertEqual(self.counters(), (0, 0))
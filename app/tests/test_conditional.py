@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.http import http_date
+
+from app.models.job import Job
+from app.tests.utils import AppTestCase, make_industry, make_job
+
+
+class ConditionalGetTests(AppTestCase):
+    url = "/api/jobs/"
+
+    def setUp(self):
+        super().setUp()
+        industry = make_industry()
+        self.older = make_job("Mason", industry)
+        self.newer = make_job("Welder", industry)
+        yesterday = timezone.now() - timedelta(days=1)
+        Job.objects.filter(pk=self.older.pk).update(
+            updated_at=yesterday - timedelta(hours=1)
+        )
+        Job.objects.filter(pk=self.newer.pk).update(updated_at=yesterday)
+
+    def get(self, url=None, **headers):
+        return self.client.get(url or self.url, HTTP_ACCEPT="application/json", **headers)
+
+    def test_validators(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"])
+        newer = Job.objects.get(pk=self.newer.pk)
+        self.assertEqual(
+            response["Last-Modified"], http_date(newer.updated_at.timestamp())
+        )
+
+    def test_not_modified(self):
+        response = self.get()
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(
+            self.get(HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304
+        )
+        # Validators are per query string
+        self.assertEqual(
+            self.get(f"{self.url}?ordering=vacancies", HTTP_IF_NONE_MATCH=etag).status_code,
+            200,
+        )
+
+    def test_modified_after_update(self):
+        etag = self.get()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.older.vacancies = 5
+            self.older.save()
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_modified_after_deleting_older_row(self):
+        response = self.get()
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.older.delete()
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        response = self.get(HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_detail(self):
+        url = f"{self.url}{self.older.slug}/"
+        etag = self.get(url)["ETag"]
+        self.assertEqual(self.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Other rows do not touch the detail validators
+        with self.captureOnCommitCallbacks(execute=True):
+            self.newer.vacancies = 5
+            self.newer.save()
+        self.assertEqual(self.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.get(f"{self.url}missing/").status_code, 404)
+
+    def test_cache_hit_skips_aggregate(self):
+        response = self.get()
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        with self.assertNumQueries(0):
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Last-Modified"], last_modified)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.older.vacancies = 5
+            self.older.save()
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 200)
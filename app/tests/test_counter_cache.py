@@ -0,0 +1,92 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.models.industry import Industry
+from app.models.job import Job
+from app.tests.utils import AppTestCase, make_client, make_industry, make_job
+
+
+class CounterCacheTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.industry = make_industry()
+
+    def counts(self, industry=None):
+        industry = industry or self.industry
+        return tuple(
+            Industry.objects.filter(pk=industry.pk)
+            .values_list("open_job_count", "client_count")
+            .get()
+        )
+
+    def test_create_and_delete(self):
+        job = make_job("Mason", industry=self.industry)
+        client = make_client(industry=self.industry)
+        self.assertEqual(self.counts(), (1, 1))
+        job.delete()
+        client.delete()
+        self.assertEqual(self.counts(), (0, 0))
+
+    def test_condition_change(self):
+        job = make_job("Mason", industry=self.industry, status="closed")
+        self.assertEqual(self.counts(), (0, 0))
+        job.status = "open"
+        job.save()
+        self.assertEqual(self.counts(), (1, 0))
+        job.status = "closed"
+        job.save()
+        self.assertEqual(self.counts(), (0, 0))
+        # Unchanged state, nothing to adjust
+        job.save()
+        self.assertEqual(self.counts(), (0, 0))
+
+    def test_parent_change(self):
+        other = make_industry("Hospitality")
+        job = make_job("Mason", industry=self.industry)
+        job.industry = other
+        job.save()
+        self.assertEqual(self.counts(), (0, 0))
+        self.assertEqual(self.counts(other), (1, 0))
+
+    def test_untracked_update_fields_skip_lookup(self):
+        job = make_job("Mason", industry=self.industry)
+        job.title = "Stone Mason"
+        with CaptureQueriesContext(connection) as queries:
+            job.save(update_fields=["title"])
+        # No read of the stored industry and status
+        self.assertFalse(
+            [query for query in queries if '"app_job"."industry_id"' in query["sql"]]
+        )
+        self.assertEqual(self.counts(), (1, 0))
+        job.status = "closed"
+        job.save(update_fields=["status"])
+        self.assertEqual(self.counts(), (0, 0))
+
+    def test_parent_save_keeps_counters(self):
+        industry = Industry.objects.get(pk=self.industry.pk)
+        make_job("Mason", industry=self.industry)
+        make_client(industry=self.industry)
+        # Loaded before the children were added, the stale values stay out
+        industry.description = "Builders"
+        industry.save()
+        self.assertEqual(self.counts(), (1, 1))
+        self.assertEqual(
+            Industry.objects.get(pk=industry.pk).description, "Builders"
+        )
+
+    def test_recount(self):
+        make_job("Mason", industry=self.industry)
+        make_job("Welder", industry=self.industry)
+        Job.objects.update(status="closed")
+        Industry.objects.update(client_count=5)
+        out = StringIO()
+        call_command("recount", stdout=out)
+        self.assertIn("Industry.open_job_count: 1 row(s) fixed", out.getvalue())
+        self.assertIn("Industry.client_count: 1 row(s) fixed", out.getvalue())
+        self.assertEqual(self.counts(), (0, 0))
+        out = StringIO()
+        call_command("recount", stdout=out)
+        self.assertNotIn("1 row(s) fixed", out.getvalue())
@@ -0,0 +1,114 @@
+from unittest import mock
+
+from django.db import DatabaseError
+from django.utils import timezone
+
+from app.cache import get_model_versions
+from app.download_buffer import DownloadCounterBuffer
+from app.models.document import Document, DocumentDownloadDaily
+from app.tests.utils import AppTestCase
+
+
+class DownloadCounterBufferTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.buffer = DownloadCounterBuffer(flush_interval=3600, flush_events=10)
+        # Drops the quiet period timer
+        self.addCleanup(self.buffer.take)
+        self.documents = [
+            Document.objects.create(
+                title=f"Form {i}",
+                document_type="policy",
+                file=f"documents/form-{i}.pdf",
+                download_count=10,
+            )
+            for i in range(2)
+        ]
+
+    def stored(self):
+        return list(
+            Document.objects.order_by("pk").values_list("download_count", flat=True)
+        )
+
+    def daily(self):
+        return dict(
+            DocumentDownloadDaily.objects.filter(date=timezone.localdate()).values_list(
+                "document_id", "count"
+            )
+        )
+
+    def record(self, document, times=1):
+        for _ in range(times):
+            self.buffer.record(document.pk)
+
+    def test_buffered_until_flush(self):
+        first, second = self.documents
+        self.record(first, 3)
+        self.record(second)
+        self.assertEqual(self.buffer.pending(first.pk), 3)
+        self.assertEqual(self.stored(), [10, 10])
+
+        self.assertEqual(self.buffer.flush(), 4)
+        self.assertEqual(self.stored(), [13, 11])
+        self.assertEqual(self.daily(), {first.pk: 3, second.pk: 1})
+        self.assertEqual(self.buffer.pending(first.pk), 0)
+        self.assertEqual(self.buffer.flush(), 0)
+
+    def test_flush_writes_deltas(self):
+        first = self.documents[0]
+        self.record(first, 2)
+        # Written by another process in the meantime
+        Document.objects.filter(pk=first.pk).update(download_count=100)
+        DocumentDownloadDaily.objects.create(
+            document=first, date=timezone.localdate(), count=5
+        )
+        self.buffer.flush()
+        self.assertEqual(self.stored()[0], 102)
+        self.assertEqual(self.daily(), {first.pk: 7})
+
+    def test_document_save_keeps_count(self):
+        document = Document.objects.get(pk=self.documents[0].pk)
+        self.record(document, 2)
+        self.buffer.flush()
+        document.title = "Renamed"
+        document.save()
+        self.assertEqual(self.stored()[0], 12)
+
+    def test_flushes_after_enough_events(self):
+        self.record(self.documents[0], 9)
+        self.assertEqual(self.stored()[0], 10)
+        self.record(self.documents[0])
+        self.assertEqual(self.stored()[0], 20)
+        self.assertEqual(self.buffer.pending(self.documents[0].pk), 0)
+
+    def test_failed_flush_keeps_downloads(self):
+        first, second = self.documents
+        self.record(first, 2)
+        self.record(second)
+        with mock.patch.object(
+            Document.objects, "filter", side_effect=DatabaseError("locked")
+        ):
+            self.assertEqual(self.buffer.flush(), 0)
+        self.assertEqual(self.stored(), [10, 10])
+        self.assertEqual(self.daily(), {})
+        self.assertEqual(self.buffer.pending(first.pk), 2)
+
+        self.record(first)
+        self.assertEqual(self.buffer.flush(), 4)
+        self.assertEqual(self.stored(), [13, 11])
+        self.assertEqual(self.daily(), {first.pk: 3, second.pk: 1})
+
+    def test_flush_expires_cached_documents(self):
+        version = get_model_versions([Document])[Document]
+        self.record(self.documents[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.buffer.flush()
+        self.assertNotEqual(get_model_versions([Document])[Document], version)
+
+    def test_download_endpoint(self):
+        first = self.documents[0]
+        with mock.patch("app.api.document.views.download_buffer", self.buffer):
+            response = self.client.post(f"/api/documents/{first.pk}/download/")
+            response = self.client.post(f"/api/documents/{first.pk}/download/")
+        self.assertEqual(response.json()["download_count"], 12)
+        self.assertEqual(self.buffer.pending(first.pk), 2)
@@ -0,0 +1,78 @@
+import gzip
+import json
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import brotli
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.utils import timezone
+
+from app.api.office.views import BranchViewSet
+from app.management.commands.export_static_api import Command
+from app.models.medianews import MediaAlbum, MediaPhoto
+from app.models.office import Branch
+from app.tests.utils import AppTestCase, image_file, make_job
+
+
+class ExportStaticAPITests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output_dir, ignore_errors=True)
+
+    def export(self, *args):
+        call_command("export_static_api", str(self.output_dir), *args, stdout=StringIO())
+
+    def test_queryset_without_request(self):
+        Branch.objects.create(country="Nepal")
+        view = BranchViewSet(action="list", kwargs={}, format_kwarg=None)
+        self.assertEqual(view.get_queryset().count(), 1)
+
+    def test_exports_lists_and_details(self):
+        job = make_job()
+        Branch.objects.create(country="Nepal")
+        self.export()
+
+        listing = json.loads((self.output_dir / "api/jobs/index.json").read_text())
+        self.assertEqual([item["slug"] for item in listing["results"]], [job.slug])
+        detail = self.output_dir / f"api/jobs/{job.slug}/index.json"
+        self.assertEqual(json.loads(detail.read_text())["id"], job.pk)
+        content = detail.read_bytes()
+        self.assertEqual(gzip.decompress(Path(f"{detail}.gz").read_bytes()), content)
+        self.assertEqual(brotli.decompress(Path(f"{detail}.br").read_bytes()), content)
+        manifest = json.loads((self.output_dir / "manifest.json").read_text())
+        self.assertIn("api/jobs/index.json", manifest["files"])
+
+    def test_skips_admin_endpoints(self):
+        self.export()
+        self.assertFalse((self.output_dir / "api/tasks").exists())
+        self.assertFalse((self.output_dir / "api/home/stats").exists())
+        self.assertTrue((self.output_dir / "api/home/index.json").exists())
+
+    def test_skips_non_json_actions(self):
+        album = MediaAlbum.objects.create(
+            title="Interviews", album_type="interviews", date=timezone.localdate()
+        )
+        MediaPhoto.objects.create(
+            album=album, image=default_storage.save("gallery/photos/a.jpg", image_file())
+        )
+        self.export()
+
+        album_dir = self.output_dir / f"api/media-albums/{album.slug}"
+        self.assertTrue((album_dir / "index.json").exists())
+        self.assertFalse((album_dir / "download").exists())
+
+    def test_export_url_ignores_non_json_responses(self):
+        album = MediaAlbum.objects.create(
+            title="Visits", album_type="client_visits", date=timezone.localdate()
+        )
+        command = Command(stdout=StringIO())
+        command.client = self.client
+        command.verbosity = 1
+        command.output_dir = self.output_dir
+        command.files, command.previous_files, command.written = {}, {}, 0
+        self.assertIsNone(command.export_url(f"/api/media-albums/{album.slug}/download/"))
+        self.assertEqual(command.files, {})
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+from app.api.flat import FlatSerializer
+from app.models.industry import Client
+from app.tests.utils import (
+    AppTestCase,
+    image_file,
+    make_client,
+    make_industry,
+    make_job,
+)
+
+# Every list served through FlatListMixin, with the options changing what it reads
+URLS = [
+    "/api/jobs/",
+    "/api/jobs/?is_featured=true",
+    "/api/jobs/?search=mason",
+    "/api/jobs/?search=mason&fields=id,search_snippet",
+    "/api/jobs/?fields=id,title,status_display",
+    "/api/jobs/?country=Quatar&ordering=vacancies",
+    "/api/clients/",
+    "/api/clients/?fields=industry_name,logo,logo_srcset",
+    "/api/industries/",
+    "/api/industries/?search=con",
+]
+
+
+class FlatListTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            construction = make_industry("Construction")
+            make_industry("Hospitality", is_featured=True)
+            acme = make_client("Acme", construction, country="Qatar")
+            # No industry, no logo
+            make_client("Globex")
+            make_job("Mason", construction, client=acme, vacancies=4)
+            make_job("Stone Mason", construction, vacancies=2, country="Oman")
+            make_job("Tiler", construction, is_featured=True)
+            make_job("Welder", construction, status="closed")
+        with self.captureOnCommitCallbacks(execute=True):
+            acme.logo = default_storage.save("clients/acme.jpg", image_file())
+            acme.save()
+        self.assertTrue(Client.objects.get(pk=acme.pk).derivatives)
+
+    def get(self, url):
+        cache.clear()
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.content
+
+    def test_same_output_as_serializer(self):
+        for url in URLS:
+            with self.subTest(url=url):
+                with mock.patch.object(
+                    FlatSerializer,
+                    "serialize",
+                    autospec=True,
+                    side_effect=FlatSerializer.serialize,
+                ) as serialize:
+                    flat = self.get(url)
+                self.assertTrue(serialize.called)
+                with mock.patch.object(FlatSerializer, "compile", return_value=None):
+                    plain = self.get(url)
+                self.assertEqual(flat, plain)
+                self.assertNotIn(b'"results":[]', flat)
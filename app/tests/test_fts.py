@@ -0,0 +1,89 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+
+from app.fts import JOB_FTS_TABLE, build_match_query, fts_enabled
+from app.tests.utils import AppTestCase, make_industry, make_job
+
+
+class JobFullTextSearchTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        if not fts_enabled():
+            self.skipTest("SQLite without FTS5")
+        self.industry = make_industry()
+
+    def indexed(self, text):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {JOB_FTS_TABLE} WHERE {JOB_FTS_TABLE} MATCH %s "
+                "ORDER BY rowid",
+                [build_match_query(text)],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def search(self, text):
+        response = self.client.get(
+            "/api/jobs/", {"search": text}, HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_index_follows_saves_and_deletes(self):
+        job = make_job("Scaffolder", self.industry)
+        self.assertEqual(self.indexed("scaffolder"), [job.pk])
+        job.title = "Rigger"
+        job.description = "Rigging work"
+        job.save()
+        self.assertEqual(self.indexed("scaffolder"), [])
+        self.assertEqual(self.indexed("rigger"), [job.pk])
+        job.delete()
+        self.assertEqual(self.indexed("rigger"), [])
+
+    def test_prefix_match_ranked_with_snippet(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Welder", self.industry, description="Maintenance technician role")
+            make_job("Maintenance Technician", self.industry)
+            make_job("Driver", self.industry)
+        results = self.search("maint tech")
+        # Title hits weigh more than description hits
+        self.assertEqual(
+            [result["title"] for result in results],
+            ["Maintenance Technician", "Welder"],
+        )
+        self.assertIn("<mark>", results[0]["search_snippet"])
+
+    def test_operators_are_plain_text(self):
+        self.assertEqual(
+            build_match_query('mason OR "welder" NEAR(x'),
+            '"mason"* "OR"* "welder"* "NEAR"* "x"*',
+        )
+        self.assertIsNone(build_match_query('"*^-'))
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Mason", self.industry)
+            make_job("Welder", self.industry)
+        self.assertEqual(self.search("mason OR welder"), [])
+        self.assertEqual(len(self.search('mason"')), 1)
+        self.assertEqual(len(self.search('"*^-')), 2)
+
+    def test_like_fallback_without_index(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Mason", self.industry, description="<b>Stone</b> work")
+            make_job("Welder", self.industry)
+        with mock.patch("app.api.job.filters.fts_enabled", return_value=False):
+            results = self.search("ston")
+        self.assertEqual([result["title"] for result in results], ["Mason"])
+        self.assertNotIn("search_snippet", results[0])
+
+    def test_rebuild_command(self):
+        jobs = [make_job("Mason", self.industry), make_job("Welder", self.industry)]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {JOB_FTS_TABLE}")
+        self.assertEqual(self.indexed("mason"), [])
+        out = StringIO()
+        call_command("rebuild_job_search", stdout=out)
+        self.assertIn("Indexed 2 job(s)", out.getvalue())
+        self.assertEqual(self.indexed("mason"), [jobs[0].pk])
+        self.assertEqual(self.indexed("welder"), [jobs[1].pk])
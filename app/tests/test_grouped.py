@@ -0,0 +1,92 @@
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.api.document.views import DocumentViewSet
+from app.models.document import Document
+from app.models.misc import FAQ
+from app.tests.utils import AppTestCase
+
+
+class GroupedListTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        for order, (document_type, title) in enumerate(
+            [("policy", "Leave"), ("employer_form", "Demand"), ("policy", "Travel")]
+        ):
+            Document.objects.create(
+                title=title,
+                document_type=document_type,
+                file=f"documents/{title.lower()}.pdf",
+                display_order=order,
+            )
+        Document.objects.create(
+            title="Old",
+            document_type="policy",
+            file="documents/old.pdf",
+            is_active=False,
+        )
+        for order, (category, question) in enumerate(
+            [("visa", "Which visa?"), ("general", "Who are you?"), ("visa", "How long?")]
+        ):
+            FAQ.objects.create(
+                category=category, question=question, answer="…", display_order=order
+            )
+
+    def get(self, url):
+        cache.clear()
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        if response.streaming:
+            return json.loads(b"".join(response.streaming_content))
+        return response.json()
+
+    def grouped(self, url, field, choices, include_empty=False):
+        """The payload of the per-choice implementation, from the list endpoint."""
+        items = self.get(url)["results"]
+        groups = {
+            value: [item for item in items if item[field] == value]
+            for value, label in choices
+        }
+        return {
+            value: group for value, group in groups.items() if group or include_empty
+        }
+
+    def test_documents_by_type(self):
+        expected = self.grouped(
+            "/api/documents/", "document_type", Document.DOCUMENT_TYPE
+        )
+        self.assertEqual(list(expected), ["employer_form", "policy"])
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get("/api/documents/by_type/")
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(list(data), list(expected))
+        self.assertEqual(data, expected)
+
+    def test_faqs_by_category_keeps_empty_groups(self):
+        expected = self.grouped(
+            "/api/faqs/", "category", FAQ.CATEGORY, include_empty=True
+        )
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get("/api/faqs/by_category/")
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(list(data), [value for value, label in FAQ.CATEGORY])
+        self.assertEqual(data, expected)
+        self.assertEqual(
+            [item["question"] for item in data["visa"]], ["Which visa?", "How long?"]
+        )
+
+    def test_filters_apply(self):
+        data = self.get("/api/documents/by_type/?search=travel")
+        self.assertEqual(
+            {key: [item["title"] for item in group] for key, group in data.items()},
+            {"policy": ["Travel"]},
+        )
+
+    def test_batches(self):
+        expected = self.get("/api/documents/by_type/")
+        with mock.patch.object(DocumentViewSet, "grouped_batch_size", 1):
+            self.assertEqual(self.get("/api/documents/by_type/"), expected)
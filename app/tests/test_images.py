@@ -0,0 +1,121 @@
+import random
+from io import BytesIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from PIL import Image, ImageFilter
+
+from app.api.flat import FlatSerializer
+from app.images import (
+    DERIVATIVE_SIZES,
+    derivative_name,
+    get_derivative_urls,
+    image_metadata,
+)
+from app.models.industry import Client
+from app.signals import generate_derivatives
+from app.tests.utils import AppTestCase, image_file, make_client
+
+
+class DerivativeTests(AppTestCase):
+    def make_client(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_client(
+                name, logo=default_storage.save("clients/logo.png", image_file())
+            )
+
+    def test_records_derivatives_on_the_row(self):
+        client = self.make_client("Acme")
+        client.refresh_from_db()
+        record = client.derivatives["logo"]
+        self.assertEqual(record["name"], client.logo.name)
+        self.assertEqual(record["sizes"], list(DERIVATIVE_SIZES))
+        for size in DERIVATIVE_SIZES:
+            target = derivative_name(client.logo.name, size)
+            self.assertTrue(default_storage.exists(target))
+        self.assertEqual(
+            get_derivative_urls(client.logo)["thumb"],
+            f"/media/{derivative_name(client.logo.name, 'thumb')}",
+        )
+
+    def test_record_of_replaced_file_is_ignored(self):
+        client = self.make_client("Acme")
+        client.refresh_from_db()
+        client.logo = default_storage.save("clients/other.png", image_file())
+        self.assertEqual(get_derivative_urls(client.logo), {})
+
+    def test_list_does_not_query_storage_per_row(self):
+        for name in ["Acme", "Globex", "Initech"]:
+            self.make_client(name)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                "/api/clients/?page_size=50", HTTP_ACCEPT="application/json"
+            )
+        results = response.json()["results"]
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertEqual(set(result["logo_srcset"]), set(DERIVATIVE_SIZES))
+            self.assertNotIn("derivatives", result)
+        tables = " ".join(query["sql"] for query in queries.captured_queries)
+        self.assertNotIn("blobreference", tables)
+        self.assertLessEqual(len(queries), 3)
+
+    def test_flat_list_matches_serializer(self):
+        self.make_client("Acme")
+        make_client("Globex")
+        url = "/api/clients/"
+        flat = self.client.get(url, HTTP_ACCEPT="application/json").content
+        cache.clear()
+        with mock.patch.object(FlatSerializer, "compile", return_value=None):
+            plain = self.client.get(url, HTTP_ACCEPT="application/json").content
+        self.assertEqual(flat, plain)
+
+    def test_sparse_fields_load_the_record(self):
+        self.make_client("Acme")
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                "/api/clients/?fields=id,logo_srcset", HTTP_ACCEPT="application/json"
+            )
+        self.assertEqual(
+            set(response.json()["results"][0]["logo_srcset"]), set(DERIVATIVE_SIZES)
+        )
+
+    def test_saving_without_changes_queues_nothing(self):
+        client = self.make_client("Acme")
+        client = Client.objects.get(pk=client.pk)
+        with self.captureOnCommitCallbacks() as callbacks:
+            client.name = "Acme Corp"
+            client.save()
+        queued = [getattr(callback, "func", None) for callback in callbacks]
+        self.assertNotIn(generate_derivatives.func, queued)
+
+
+class ImageMetadataTests(AppTestCase):
+    def save_photo(self, size=(1200, 800)):
+        # Noise, so the placeholder is not flattered by a plain colour
+        rng = random.Random(1)
+        image = Image.frombytes("RGB", size, rng.randbytes(size[0] * size[1] * 3))
+        image = image.filter(ImageFilter.GaussianBlur(8))
+        output = BytesIO()
+        image.save(output, "JPEG", quality=90, icc_profile=b"\0" * 3000)
+        return default_storage.save("jobs/photo.jpg", ContentFile(output.getvalue()))
+
+    def test_metadata(self):
+        name = self.save_photo()
+        metadata = image_metadata(name)
+        self.assertEqual(metadata["name"], name)
+        self.assertEqual((metadata["width"], metadata["height"]), (1200, 800))
+        self.assertRegex(metadata["color"], r"^#[0-9a-f]{6}$")
+
+    def test_placeholder_is_tiny(self):
+        lqip = image_metadata(self.save_photo())["lqip"]
+        self.assertTrue(lqip.startswith("data:image/webp;base64,"))
+        self.assertLess(len(lqip), 300)
+
+    def test_unreadable_file(self):
+        name = default_storage.save("jobs/logo.svg", ContentFile(b"<svg/>"))
+        self.assertEqual(image_metadata(name), {"name": name})
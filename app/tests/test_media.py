@@ -0,0 +1,136 @@
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from app.images import MODERN_FORMATS, generate_derivatives, variant_name
+from app.tests.utils import AppTestCase, image_file
+
+
+class NegotiationTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.name = default_storage.save("gallery/photos/photo.jpg", image_file())
+        generate_derivatives(self.name)
+        self.url = f"/media/{self.name}"
+
+    def get(self, accept):
+        response = self.client.get(self.url, HTTP_ACCEPT=accept)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Accept", response["Vary"].split(", "))
+        return response
+
+    def test_best_accepted_format(self):
+        response = self.get("image/avif,image/webp,*/*")
+        self.assertEqual(response["Content-Type"], next(iter(MODERN_FORMATS)))
+        response = self.get("image/webp,*/*")
+        self.assertEqual(response["Content-Type"], "image/webp")
+        content = b"".join(response.streaming_content)
+        self.assertEqual(
+            content, default_storage.open(variant_name(self.name, "image/webp")).read()
+        )
+
+    def test_wildcards_get_the_original(self):
+        response = self.get("*/*")
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(self.get("image/*")["Content-Type"], "image/jpeg")
+
+    def test_refused_formats(self):
+        response = self.get("image/avif;q=0,image/webp;q=0.8")
+        self.assertEqual(response["Content-Type"], "image/webp")
+
+    def test_larger_variant_is_not_sent(self):
+        webp = variant_name(self.name, "image/webp")
+        default_storage.delete(webp)
+        default_storage.save(webp, ContentFile(b"x" * 100_000))
+        response = self.get("image/webp")
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+
+    def test_other_files_are_not_negotiated(self):
+        name = default_storage.save("documents/guide.pdf", ContentFile(b"%PDF-1.4"))
+        response = self.client.get(f"/media/{name}", HTTP_ACCEPT="image/webp")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertNotIn("Accept", response.get("Vary", "").split(", "))
+
+
+class SendFileTests(AppTestCase):
+    content = bytes(range(256)) * 4
+
+    def setUp(self):
+        super().setUp()
+        self.name = default_storage.save("documents/guide.pdf", ContentFile(self.content))
+        self.url = f"/media/{self.name}"
+
+    def get(self, **headers):
+        return self.client.get(self.url, **headers)
+
+    def read(self, response):
+        if response.streaming:
+            return b"".join(response.streaming_content)
+        return response.content
+
+    def test_headers(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read(response), self.content)
+        self.assertEqual(response["ETag"], f'"{default_storage.digest(self.name)}"')
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Cache-Control"], "public, max-age=3600")
+        self.assertTrue(response.has_header("Last-Modified"))
+
+    def test_cache_control_by_folder(self):
+        name = default_storage.save("applications/cv.pdf", ContentFile(b"cv"))
+        response = self.client.get(f"/media/{name}")
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+
+    def test_conditional_requests(self):
+        response = self.get()
+        etag = response["ETag"]
+        last_modified = response["Last-Modified"]
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.get(HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.get(HTTP_IF_MATCH='"other"').status_code, 412)
+        self.assertEqual(self.get(HTTP_IF_MATCH=etag).status_code, 200)
+
+    def test_ranges(self):
+        response = self.get(HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 10-19/{len(self.content)}")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(self.read(response), self.content[10:20])
+
+        response = self.get(HTTP_RANGE="bytes=-5")
+        self.assertEqual(self.read(response), self.content[-5:])
+        response = self.get(HTTP_RANGE="bytes=1000-")
+        self.assertEqual(self.read(response), self.content[1000:])
+
+    def test_unsatisfiable_and_ignored_ranges(self):
+        response = self.get(HTTP_RANGE=f"bytes={len(self.content)}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(self.content)}")
+        # Multiple and malformed ranges get the whole file
+        self.assertEqual(self.get(HTTP_RANGE="bytes=0-1,5-6").status_code, 200)
+        self.assertEqual(self.get(HTTP_RANGE="bytes=9-2").status_code, 200)
+
+    def test_if_range(self):
+        etag = self.get()["ETag"]
+        response = self.get(HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        response = self.get(HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read(response), self.content)
+
+    def test_offload(self):
+        blob = default_storage.blob_name(default_storage.digest(self.name))
+        with self.settings(
+            MEDIA_OFFLOAD="x-accel-redirect", MEDIA_ACCEL_REDIRECT_PREFIX="/protected/"
+        ):
+            response = self.get()
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected/{blob}")
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        with self.settings(MEDIA_OFFLOAD="x-sendfile"):
+            response = self.get()
+        self.assertEqual(response["X-Sendfile"], default_storage.path(self.name))
+
+    def test_missing_file(self):
+        self.assertEqual(self.client.get("/media/documents/missing.pdf").status_code, 404)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from app.models.medianews import NewsPost
+from app.tests.utils import AppTestCase
+
+
+def make_post(title, created_at):
+    post = NewsPost.objects.create(
+        title=title,
+        post_type="news",
+        summary=f"{title} summary",
+        content=f"{title} content",
+        is_published=True,
+    )
+    NewsPost.objects.filter(pk=post.pk).update(created_at=created_at)
+    return post
+
+
+class KeysetPaginationTests(AppTestCase):
+    url = "/api/news/"
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        # Two posts share a timestamp, the id breaks the tie
+        self.posts = [
+            make_post("Fifth", now),
+            make_post("Fourth", now - timedelta(hours=1)),
+            make_post("Third", now - timedelta(hours=1)),
+            make_post("Second", now - timedelta(hours=2)),
+            make_post("First", now - timedelta(hours=3)),
+        ]
+
+    def get(self, url):
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def walk(self, url):
+        titles = []
+        while url:
+            data = self.get(url)
+            self.assertNotIn("count", data)
+            titles += [item["title"] for item in data["results"]]
+            url = data["next"]
+        return titles
+
+    def test_walks_every_row_once(self):
+        titles = self.walk(f"{self.url}?cursor=&page_size=2")
+        self.assertEqual(titles, [post.title for post in self.posts])
+
+    def test_inserted_rows_do_not_shift_pages(self):
+        data = self.get(f"{self.url}?cursor=&page_size=2")
+        make_post("Newest", timezone.now() + timedelta(hours=1))
+        self.assertEqual(
+            self.walk(data["next"]), [post.title for post in self.posts[2:]]
+        )
+
+    def test_keeps_filters_in_next_link(self):
+        data = self.get(f"{self.url}?cursor=&page_size=1&post_type=news")
+        self.assertIn("post_type=news", data["next"])
+        self.assertIn("page_size=1", data["next"])
+
+    def test_approximate_count(self):
+        data = self.get(f"{self.url}?cursor=&page_size=2&total=true")
+        self.assertEqual(data["approximate_count"], 5)
+        self.assertNotIn("approximate_count", self.get(f"{self.url}?cursor="))
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_numbers_by_default(self):
+        data = self.get(f"{self.url}?page_size=2&page=3")
+        self.assertEqual(data["count"], 5)
+        self.assertEqual([item["title"] for item in data["results"]], ["First"])
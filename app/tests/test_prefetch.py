@@ -0,0 +1,91 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.api.japan.serializers import JapanProgramSerializer
+from app.api.prefetch import infer_related_lookups
+from app.api.job.serializers import JobDetailSerializer
+from app.models.japan import (
+    JapanProgram,
+    JapanProgramTrainingPoint,
+    JapanProgramType,
+    WhyChooseJapanProgram,
+)
+from app.models.industry import Testimonial
+from app.tests.utils import AppTestCase, make_client
+
+
+def make_program(name):
+    program = JapanProgram.objects.create(
+        program_type=JapanProgramType.objects.create(name=name),
+        subtitle="N4 level",
+        overview="Care work",
+    )
+    for order in range(2):
+        JapanProgramTrainingPoint.objects.create(
+            program=program, point=f"Point {order}", order=order
+        )
+        WhyChooseJapanProgram.objects.create(
+            program=program, why_choose=f"Reason {order}", order=order
+        )
+    return program
+
+
+class PrefetchTests(AppTestCase):
+    def count_queries(self, url):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assert_constant_queries(self, url, add_row):
+        add_row(0)
+        single = self.count_queries(url)
+        for index in range(1, 4):
+            add_row(index)
+        self.assertEqual(self.count_queries(url), single)
+        # Without the inferred lookups every row costs more queries
+        with mock.patch(
+            "app.api.mixin.optimize_queryset", lambda queryset, serializer: queryset
+        ):
+            self.assertGreater(self.count_queries(url), single)
+
+    def test_inferred_lookups(self):
+        self.assertEqual(
+            infer_related_lookups(JapanProgramSerializer),
+            (("program_type",), ("training_points", "why_choose_points")),
+        )
+        self.assertEqual(
+            infer_related_lookups(JobDetailSerializer),
+            (("category__industry", "client__industry", "industry"), ()),
+        )
+
+    def test_nested_list(self):
+        self.assert_constant_queries(
+            "/api/japan-programs/", lambda index: make_program(f"Type {index}")
+        )
+
+    def test_dotted_source_list(self):
+        def add_testimonial(index):
+            Testimonial.objects.create(
+                client=make_client(f"Client {index}"),
+                person_name="Ram",
+                person_position="Manager",
+                testimonial_text="Good workers",
+                rating=5,
+            )
+
+        self.assert_constant_queries("/api/testimonials/", add_testimonial)
+
+    def test_prefetch_report(self):
+        out = StringIO()
+        call_command("prefetch_report", stdout=out)
+        report = out.getvalue()
+        self.assertIn("/api/japan-programs/ list (JapanProgramSerializer)", report)
+        self.assertIn("select_related: program_type", report)
+        self.assertIn("prefetch_related: training_points, why_choose_points", report)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from app.api.renderers import (
+    FastJSONRenderer,
+    StreamedList,
+    StreamedObject,
+    StreamingJSONRenderer,
+)
+
+DATA = {
+    "title": "Mason   Doha",
+    "salary": Decimal("1200.50"),
+    "posted": datetime(2026, 1, 2, 3, 4, 5),
+    "tags": ["ऊर्जा", None, True, 1.5],
+    1: "non-string key",
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_matches_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(DATA), JSONRenderer().render(DATA))
+
+    def test_indented_output(self):
+        context = {"indent": 2}
+        self.assertEqual(
+            FastJSONRenderer().render(DATA, "application/json", context),
+            JSONRenderer().render(DATA, "application/json", context),
+        )
+
+    def test_streamed_values(self):
+        def data():
+            return StreamedObject(
+                [("count", 2), ("results", StreamedList(iter([DATA, 1])))]
+            )
+
+        expected = JSONRenderer().render({"count": 2, "results": [DATA, 1]})
+        self.assertEqual(b"".join(StreamingJSONRenderer().stream(data())), expected)
+        self.assertEqual(FastJSONRenderer().render(data()), expected)
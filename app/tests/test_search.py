@@ -0,0 +1,44 @@
+from app.models.japan import JapanProgram, JapanProgramType
+from app.search_index import search
+from app.tests.utils import AppTestCase, make_job
+
+
+class SearchIndexTests(AppTestCase):
+    def titles(self, text):
+        results, facets, count = search(text)
+        return [result["title"] for result in results]
+
+    def test_indexes_on_save(self):
+        job = make_job("Scaffolder")
+        self.assertEqual(self.titles("scaff"), ["Scaffolder"])
+        job.status = "closed"
+        job.save()
+        self.assertEqual(self.titles("scaff"), [])
+
+    def test_category_rename_reindexes_jobs(self):
+        job = make_job("Mason")
+        job.category.name = "Stonework"
+        job.category.save()
+        self.assertEqual(self.titles("stonework"), ["Mason"])
+        self.assertEqual(self.titles("mason"), ["Mason"])
+
+    def test_program_type_rename_reindexes_programs(self):
+        program_type = JapanProgramType.objects.create(name="Caregiver")
+        JapanProgram.objects.create(
+            program_type=program_type, subtitle="N4 level", overview="Care work"
+        )
+        program_type.name = "Nursing Care"
+        program_type.save()
+        self.assertEqual(self.titles("nursing"), ["Nursing Care - N4 level"])
+        self.assertEqual(self.titles("caregiver"), [])
+
+    def test_search_api_follows_rename(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = make_job("Mason")
+        response = self.client.get("/api/search/?q=stonework")
+        self.assertEqual(response.json()["count"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            job.category.name = "Stonework"
+            job.category.save()
+        response = self.client.get("/api/search/?q=stonework")
+        self.assertEqual(response.json()["count"], 1)
@@ -0,0 +1,35 @@
+from app.tests.utils import AppTestCase, make_client, make_industry, make_job
+
+
+class SparseFieldsTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        industry = make_industry()
+        self.client_obj = make_client(industry=industry)
+        self.job = make_job(industry=industry, client=self.client_obj)
+
+    def test_fields_keeps_only_listed_fields(self):
+        response = self.client.get("/api/jobs/?fields=id,title,status_display")
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": self.job.pk, "title": "Mason", "status_display": "Open"}],
+        )
+
+    def test_fields_on_detail(self):
+        response = self.client.get(f"/api/jobs/{self.job.slug}/?fields=slug,industry.name")
+        self.assertEqual(
+            response.json(), {"slug": self.job.slug, "industry": {"name": "Construction"}}
+        )
+
+    def test_expand_replaces_key_with_object(self):
+        plain = self.client.get("/api/clients/").json()["results"][0]
+        self.assertEqual(plain["industry"], self.client_obj.industry_id)
+
+        expanded = self.client.get("/api/clients/?expand=industry").json()["results"][0]
+        self.assertEqual(expanded["industry"]["name"], "Construction")
+
+    def test_expand_with_fields(self):
+        response = self.client.get("/api/jobs/?expand=client&fields=id,client.name")
+        self.assertEqual(
+            response.json()["results"], [{"id": self.job.pk, "client": {"name": "Acme"}}]
+        )
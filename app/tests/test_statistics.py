@@ -0,0 +1,76 @@
+from app.api.job.statistics import compute_job_statistics, get_job_statistics
+from app.models.job import JobCategory
+from app.tests.utils import AppTestCase, make_industry, make_job
+
+
+class JobStatisticsTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.construction = construction = make_industry("Construction")
+        hospitality = make_industry("Hospitality")
+        masonry = JobCategory.objects.create(
+            name="Masonry", skill_level="skilled", industry=construction
+        )
+        cleaning = JobCategory.objects.create(
+            name="Cleaning", skill_level="unskilled", industry=hospitality
+        )
+        make_job("Mason", construction, category=masonry, vacancies=10)
+        make_job("Tiler", construction, category=masonry, vacancies=5, country="UAE")
+        make_job("Cleaner", hospitality, category=cleaning, vacancies=20)
+        make_job("Closed", construction, category=masonry, vacancies=99, status="closed")
+
+    def test_totals(self):
+        with self.assertNumQueries(1):
+            statistics = compute_job_statistics()
+        self.assertEqual(statistics["total_open_jobs"], 3)
+        self.assertEqual(statistics["total_vacancies"], 35)
+        self.assertEqual(
+            statistics["jobs_by_country"],
+            [
+                {"country": "Qatar", "count": 2, "vacancies": 30},
+                {"country": "UAE", "count": 1, "vacancies": 5},
+            ],
+        )
+        self.assertEqual(
+            statistics["jobs_by_industry"],
+            [
+                {"industry__name": "Construction", "count": 2, "vacancies": 15},
+                {"industry__name": "Hospitality", "count": 1, "vacancies": 20},
+            ],
+        )
+        self.assertEqual(
+            statistics["jobs_by_category"],
+            [
+                {"category__name": "Cleaning", "count": 1, "vacancies": 20},
+                {"category__name": "Masonry", "count": 2, "vacancies": 15},
+            ],
+        )
+        self.assertEqual(
+            statistics["jobs_by_skill_level"],
+            [
+                {
+                    "skill_level": "skilled",
+                    "count": 2,
+                    "vacancies": 15,
+                    "skill_level_display": "Skilled",
+                },
+                {
+                    "skill_level": "unskilled",
+                    "count": 1,
+                    "vacancies": 20,
+                    "skill_level_display": "Unskilled",
+                },
+            ],
+        )
+
+    def test_cached_until_jobs_change(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(get_job_statistics()["total_vacancies"], 35)
+        with self.assertNumQueries(0):
+            get_job_statistics()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Welder", self.construction, vacancies=3)
+        response = self.client.get(
+            "/api/jobs/statistics/", HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(response.json()["total_vacancies"], 38)
@@ -0,0 +1,94 @@
+import hashlib
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from app.models.storage import Blob, BlobReference
+from app.tests.utils import AppTestCase
+
+
+class DedupStorageTests(AppTestCase):
+    content = b"same bytes"
+
+    def setUp(self):
+        super().setUp()
+        self.digest = hashlib.sha256(self.content).hexdigest()
+
+    def test_same_content_is_stored_once(self):
+        first = default_storage.save("documents/a.txt", ContentFile(self.content))
+        second = default_storage.save("clients/b.txt", ContentFile(self.content))
+        self.assertEqual(Blob.objects.get().ref_count, 2)
+        self.assertEqual(default_storage.path(first), default_storage.path(second))
+        self.assertTrue(default_storage.path(first).endswith(self.digest))
+        self.assertEqual(default_storage.size(second), len(self.content))
+        with default_storage.open(second) as file:
+            self.assertEqual(file.read(), self.content)
+
+    def test_blob_goes_with_the_last_reference(self):
+        first = default_storage.save("documents/a.txt", ContentFile(self.content))
+        second = default_storage.save("documents/b.txt", ContentFile(self.content))
+        path = default_storage.path(first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            default_storage.delete(first)
+        self.assertEqual(Blob.objects.get().ref_count, 1)
+        self.assertFalse(default_storage.exists(first))
+        self.assertTrue(os.path.exists(path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            default_storage.delete(second)
+        self.assertFalse(Blob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    def test_existing_name_gets_a_new_one(self):
+        first = default_storage.save("documents/a.txt", ContentFile(self.content))
+        second = default_storage.save("documents/a.txt", ContentFile(b"other"))
+        self.assertNotEqual(first, second)
+        self.assertEqual(BlobReference.objects.count(), 2)
+
+    def test_files_written_by_another_process_are_found(self):
+        name = "derivatives/thumb/a.jpg"
+        self.assertFalse(default_storage.exists(name))
+        # What the worker's save leaves behind, without this process' forget()
+        Blob.objects.create(digest=self.digest, size=len(self.content), ref_count=1)
+        BlobReference.objects.create(name=name, blob_id=self.digest)
+        self.assertTrue(default_storage.exists(name))
+        self.assertEqual(default_storage.digest(name), self.digest)
+
+    def test_files_stored_before_deduplication(self):
+        name = "documents/legacy.txt"
+        path = os.path.join(default_storage.location, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self.content)
+        self.assertIsNone(default_storage.digest(name))
+        self.assertEqual(default_storage.path(name), path)
+        self.assertTrue(default_storage.exists(name))
+        default_storage.delete(name)
+        self.assertFalse(os.path.exists(path))
+
+    def test_orphan_stored_again_is_kept(self):
+        name = default_storage.save("documents/a.txt", ContentFile(self.content))
+        path = default_storage.path(name)
+        # Another upload of the same bytes committed before the removal ran
+        with self.captureOnCommitCallbacks() as callbacks:
+            default_storage.delete(name)
+        default_storage.save("documents/b.txt", ContentFile(self.content))
+        for callback in callbacks:
+            callback()
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(Blob.objects.get().ref_count, 1)
+
+    def test_orphan_removal_leaves_no_placeholder(self):
+        name = default_storage.save("documents/a.txt", ContentFile(self.content))
+        path = default_storage.path(name)
+        with self.captureOnCommitCallbacks(execute=True):
+            default_storage.delete(name)
+        self.assertFalse(Blob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+        name = default_storage.save("documents/b.txt", ContentFile(self.content))
+        self.assertEqual(default_storage.path(name), path)
+        with default_storage.open(name) as file:
+            self.assertEqual(file.read(), self.content)
@@ -0,0 +1,166 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from app.models.task import Task
+from app.tasks import (
+    claim,
+    enqueue,
+    execute,
+    finish,
+    prune_finished,
+    requeue_stale,
+    retry_delay,
+    task,
+)
+from app.tests.utils import AppTestCase
+
+CALLS = []
+
+
+@task(name="tests.record")
+def record(*args, **kwargs):
+    CALLS.append((args, kwargs))
+
+
+@task(name="tests.fail", max_attempts=2)
+def fail():
+    raise ValueError("broken")
+
+
+@override_settings(TASKS_RUN_EAGERLY=False)
+class TaskQueueTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        CALLS.clear()
+
+    def test_enqueue(self):
+        queued = record.enqueue(1, "a", key="value", delay=60)
+        self.assertEqual(queued.name, "tests.record")
+        self.assertEqual((queued.args, queued.kwargs), ([1, "a"], {"key": "value"}))
+        self.assertEqual(queued.status, "queued")
+        self.assertGreater(queued.run_at, timezone.now() + timedelta(seconds=50))
+
+    def test_dedupe_key(self):
+        first = record.enqueue(1, dedupe_key="record:1")
+        self.assertEqual(record.enqueue(1, dedupe_key="record:1").pk, first.pk)
+        self.assertEqual(Task.objects.count(), 1)
+        # A running task may have read stale data, queue another run
+        claim("worker")
+        second = record.enqueue(1, dedupe_key="record:1")
+        self.assertNotEqual(second.pk, first.pk)
+
+    def test_claim_order(self):
+        low = record.enqueue("low", priority=-10)
+        later = record.enqueue("later", priority=10, delay=60)
+        high = record.enqueue("high", priority=10)
+        claimed = claim("worker")
+        self.assertEqual(claimed.pk, high.pk)
+        self.assertEqual(claimed.status, "running")
+        self.assertEqual(claimed.locked_by, "worker")
+        self.assertEqual(claimed.attempts, 1)
+        self.assertEqual(claim("worker").pk, low.pk)
+        self.assertIsNone(claim("worker"))
+        self.assertEqual(Task.objects.get(pk=later.pk).status, "queued")
+
+    def test_execute(self):
+        queued = record.enqueue(1, key="value")
+        claim("worker")
+        self.assertEqual(execute(queued.pk), "succeeded")
+        self.assertEqual(CALLS, [((1,), {"key": "value"})])
+        queued.refresh_from_db()
+        self.assertIsNotNone(queued.finished_at)
+        self.assertEqual(queued.locked_by, "")
+
+    def test_retry_then_fail(self):
+        queued = fail.enqueue()
+        claim("worker")
+        with mock.patch("app.tasks.random.uniform", return_value=1.0):
+            self.assertEqual(execute(queued.pk), "queued")
+        queued.refresh_from_db()
+        self.assertIn("ValueError: broken", queued.last_error)
+        delay = (queued.run_at - timezone.now()).total_seconds()
+        self.assertAlmostEqual(delay, 10, delta=1)
+
+        Task.objects.filter(pk=queued.pk).update(run_at=timezone.now())
+        claim("worker")
+        self.assertEqual(execute(queued.pk), "failed")
+        queued.refresh_from_db()
+        self.assertEqual(queued.attempts, 2)
+        self.assertIsNotNone(queued.finished_at)
+
+    @override_settings(TASKS_RETRY_BACKOFF=10, TASKS_RETRY_BACKOFF_MAX=60)
+    def test_retry_backoff(self):
+        with mock.patch("app.tasks.random.uniform", return_value=1.0):
+            self.assertEqual([retry_delay(n) for n in range(1, 6)], [10, 20, 40, 60, 60])
+        for attempts in range(1, 6):
+            self.assertLessEqual(retry_delay(attempts), 60 * 1.2)
+            self.assertGreaterEqual(retry_delay(attempts), 10 * 0.8)
+
+    def test_failed_retry_yields_to_queued_duplicate(self):
+        queued = fail.enqueue(dedupe_key="fail")
+        claimed = claim("worker")
+        duplicate = fail.enqueue(dedupe_key="fail")
+        finish(claimed, "error")
+        self.assertEqual(Task.objects.get(pk=queued.pk).status, "failed")
+        self.assertEqual(Task.objects.get(pk=duplicate.pk).status, "queued")
+
+    @override_settings(TASKS_LOCK_TIMEOUT=60)
+    def test_requeue_stale(self):
+        queued = record.enqueue()
+        claim("worker")
+        self.assertEqual(requeue_stale(), 0)
+        Task.objects.filter(pk=queued.pk).update(
+            locked_at=timezone.now() - timedelta(minutes=5)
+        )
+        self.assertEqual(requeue_stale(), 1)
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, "queued")
+        self.assertIn("did not finish", queued.last_error)
+
+    def test_prune_finished(self):
+        old = record.enqueue()
+        recent = record.enqueue()
+        Task.objects.update(status="succeeded", finished_at=timezone.now())
+        Task.objects.filter(pk=old.pk).update(
+            finished_at=timezone.now() - timedelta(days=30)
+        )
+        self.assertEqual(prune_finished(), 1)
+        self.assertEqual(list(Task.objects.values_list("pk", flat=True)), [recent.pk])
+
+
+@override_settings(TASKS_RUN_EAGERLY=False)
+class RunWorkerTests(TransactionTestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_burst(self):
+        record.enqueue("a")
+        record.enqueue("b")
+        # Keep the test runner's own SIGINT handling. One thread: the
+        # in-memory test database locks whole tables, concurrent claim and
+        # finish writes fail with "database table is locked".
+        with mock.patch("signal.signal"):
+            call_command(
+                "runworker", "--burst", "--concurrency", "1", stdout=StringIO()
+            )
+        self.assertCountEqual(CALLS, [(("a",), {}), (("b",), {})])
+        statuses = set(Task.objects.values_list("status", flat=True))
+        self.assertEqual(statuses, {"succeeded"})
+
+
+class EagerTaskTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        CALLS.clear()
+
+    def test_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertIsNone(enqueue("tests.record", [1]))
+            self.assertEqual(CALLS, [])
+        self.assertEqual(CALLS, [((1,), {})])
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,60 @@
+from app.models.job import Job
+from app.trigram import TrigramIndex, get_trigram_index, trigrams
+from app.tests.utils import AppTestCase, make_industry, make_job
+
+
+class TrigramIndexTests(AppTestCase):
+    def test_trigrams(self):
+        self.assertEqual(trigrams("Doha"), {"  d", " do", "doh", "oha", "ha "})
+
+    def test_misspelling_resolves(self):
+        index = TrigramIndex(["Qatar", "Saudi Arabia", "United Arab Emirates"])
+        self.assertEqual(index.resolve("Quatar"), ["Qatar"])
+        self.assertEqual(index.resolve("saudi arabya"), ["Saudi Arabia"])
+
+    def test_threshold(self):
+        index = TrigramIndex(["Qatar", "Malaysia"])
+        self.assertEqual(index.resolve("Japan"), [])
+        self.assertIsNone(index.best_match("xyz"))
+
+    def test_exact_match_wins(self):
+        index = TrigramIndex(["Qatar", "Qatari", "Oman"])
+        self.assertEqual(index.resolve("qatari"), ["Qatari"])
+        self.assertEqual(index.resolve("Qatar"), ["Qatar"])
+        # Every stored spelling of the same value
+        index = TrigramIndex(["Qatar", "qatar ", "  QATAR"])
+        self.assertEqual(index.resolve("Qatar"), ["  QATAR", "Qatar", "qatar "])
+
+    def test_index_follows_model_version(self):
+        industry = make_industry()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Mason", industry, country="Qatar")
+        self.assertEqual(get_trigram_index(Job, "country").resolve("Oman"), [])
+        with self.assertNumQueries(0):
+            get_trigram_index(Job, "country")
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Welder", industry, country="Oman")
+        self.assertEqual(get_trigram_index(Job, "country").resolve("Omman"), ["Oman"])
+
+
+class FuzzyFilterTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        industry = make_industry()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_job("Mason", industry, country="Qatar", location="Doha")
+            make_job("Welder", industry, country="qatar ", location="Al Wakrah")
+            make_job("Driver", industry, country="Saudi Arabia", location="Riyadh")
+
+    def titles(self, **params):
+        response = self.client.get("/api/jobs/", params, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return sorted(result["title"] for result in response.json()["results"])
+
+    def test_misspelled_filter(self):
+        self.assertEqual(self.titles(country="Quatar"), ["Mason", "Welder"])
+        self.assertEqual(self.titles(country="saudi arabya"), ["Driver"])
+        self.assertEqual(self.titles(country="Qatar", location="Wakra"), ["Welder"])
+
+    def test_no_match_returns_nothing(self):
+        self.assertEqual(self.titles(country="Japan"), [])
@@ -0,0 +1,101 @@
+from unittest import mock
+
+from app.models.job import JobCategory
+from app.typeahead import TypeaheadIndex
+from app.tests.utils import AppTestCase, make_industry, make_job
+
+
+class TypeaheadTests(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.index = TypeaheadIndex()
+        self.industry = make_industry("Construction")
+        self.category = JobCategory.objects.create(
+            name="Masonry", skill_level="skilled", industry=self.industry
+        )
+
+    def make_job(self, title, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_job(title, self.industry, category=self.category, **fields)
+
+    def suggest(self, text, **kwargs):
+        # Skip the wait for the next version check
+        self.index.checked_at = None
+        return [
+            (suggestion["type"], suggestion["value"], suggestion["count"])
+            for suggestion in self.index.suggest(text, **kwargs)
+        ]
+
+    def test_prefix_of_any_word(self):
+        self.make_job("Maintenance Technician", country="Qatar", location="Doha")
+        self.assertEqual(
+            self.suggest("tech"), [("job_title", "Maintenance Technician", 1)]
+        )
+        self.assertEqual(
+            self.suggest("maint tech"), [("job_title", "Maintenance Technician", 1)]
+        )
+        # Words have to follow each other
+        self.assertEqual(self.suggest("tech maint"), [])
+        self.assertEqual(self.suggest("mas"), [("category", "Masonry", 1)])
+        self.assertEqual(self.suggest("const"), [("industry", "Construction", 1)])
+        self.assertEqual(self.suggest("  "), [])
+
+    def test_follows_saves_and_deletes(self):
+        job = self.make_job("Welder", country="Oman")
+        self.assertEqual(self.suggest("wel"), [("job_title", "Welder", 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.title = "Pipe Fitter"
+            job.save()
+        self.assertEqual(self.suggest("wel"), [])
+        self.assertEqual(self.suggest("fit"), [("job_title", "Pipe Fitter", 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.status = "closed"
+            job.save()
+        self.assertEqual(self.suggest("fit"), [])
+        self.assertEqual(self.suggest("oman"), [])
+
+        job = self.make_job("Rigger")
+        with self.captureOnCommitCallbacks(execute=True):
+            job.delete()
+        self.assertEqual(self.suggest("rig"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Stonework"
+            self.category.save()
+        self.assertEqual(self.suggest("mas"), [])
+        self.assertEqual(self.suggest("stone"), [("category", "Stonework", 1)])
+
+    def test_ordering_and_limit(self):
+        self.make_job("Mason", country="Qatar", location="Doha")
+        self.make_job("Mason", country="Qatar", location="Lusail")
+        self.make_job("Stone Mason", country="Oman", location="Muscat")
+        # Leading matches first, then by number of rows, then by value
+        self.assertEqual(
+            self.suggest("mas"),
+            [
+                ("job_title", "Mason", 2),
+                ("category", "Masonry", 1),
+                ("job_title", "Stone Mason", 1),
+            ],
+        )
+        self.assertEqual(self.suggest("mas", limit=1), [("job_title", "Mason", 2)])
+        self.assertEqual(
+            self.suggest("mas", kinds={"category"}), [("category", "Masonry", 1)]
+        )
+        self.assertEqual(
+            self.suggest("qatar", kinds={"country"}), [("country", "Qatar", 2)]
+        )
+
+    def test_autocomplete_endpoint(self):
+        self.make_job("Mason", country="Qatar")
+        with mock.patch("app.api.job.views.typeahead_index", self.index):
+            response = self.client.get(
+                "/api/jobs/autocomplete/",
+                {"q": "qat", "limit": 5},
+                HTTP_ACCEPT="application/json",
+            )
+        self.assertEqual(
+            response.json(), [{"type": "country", "value": "Qatar", "count": 1}]
+        )
@@ -0,0 +1,68 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from app.models.industry import Client, Industry
+from app.models.job import Job, JobCategory
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class AppTestCase(TestCase):
+    """A local-memory cache cleared per test and a throwaway MEDIA_ROOT per class."""
+
+    @classmethod
+    def setUpClass(cls):
+        media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        cls.enterClassContext(
+            override_settings(
+                CACHES=LOCMEM_CACHES, MEDIA_ROOT=media_root, TASKS_RUN_EAGERLY=True
+            )
+        )
+        super().setUpClass()
+
+    def setUp(self):
+        cache.clear()
+        # Name -> blob mappings of rows rolled back by earlier tests
+        mapping = getattr(default_storage, "mapping", None)
+        if mapping is not None:
+            mapping.clear()
+
+
+def make_industry(name="Construction", **fields):
+    return Industry.objects.create(
+        name=name, icon="🏗️", description=f"{name} jobs", **fields
+    )
+
+
+def make_job(title="Mason", industry=None, **fields):
+    industry = industry or make_industry()
+    category = fields.pop("category", None) or JobCategory.objects.create(
+        name=title, skill_level="skilled", industry=industry
+    )
+    fields.setdefault("country", "Qatar")
+    fields.setdefault("location", "Doha")
+    fields.setdefault("description", f"{title} wanted")
+    fields.setdefault("requirements", "Experience")
+    return Job.objects.create(
+        title=title, industry=industry, category=category, **fields
+    )
+
+
+def make_client(name="Acme", industry=None, **fields):
+    return Client.objects.create(name=name, industry=industry, **fields)
+
+
+def image_file(size=(400, 300), color=(200, 40, 40), image_format="JPEG"):
+    output = BytesIO()
+    Image.new("RGB", size, color).save(output, image_format)
+    return ContentFile(output.getvalue())
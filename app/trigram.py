@@ -0,0 +1,93 @@
+import threading
+from collections import Counter, defaultdict
+
+from django.core.cache import cache
+
+from app.cache import get_model_versions
+
+# Same cut-off as PostgreSQL's pg_trgm, "Quatar" -> "Qatar" scores 0.44
+SIMILARITY_THRESHOLD = 0.3
+INDEX_TIMEOUT = 60 * 60 * 24
+
+
+def normalize(value):
+    return " ".join(str(value).lower().split())
+
+
+def trigrams(value):
+    """pg_trgm style trigrams: every word padded with two spaces in front, one behind."""
+    grams = set()
+    for word in normalize(value).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """
+    Distinct values of one column grouped by their normalized form, with a
+    trigram -> normalized value posting list for fuzzy lookups.
+    """
+
+    def __init__(self, values):
+        self.values = defaultdict(set)
+        for value in values:
+            if normalize(value):
+                self.values[normalize(value)].add(value)
+        self.grams = {key: trigrams(key) for key in self.values}
+        self.postings = defaultdict(set)
+        for key, grams in self.grams.items():
+            for gram in grams:
+                self.postings[gram].add(key)
+
+    def best_match(self, text):
+        """The normalized value most similar to ``text``, or None."""
+        key = normalize(text)
+        if key in self.values:
+            return key
+        grams = trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        best, best_score = None, 0.0
+        for candidate, count in sorted(shared.items()):
+            score = count / len(grams | self.grams[candidate])
+            if score > best_score:
+                best, best_score = candidate, score
+        return best if best_score >= SIMILARITY_THRESHOLD else None
+
+    def resolve(self, text):
+        """Stored values matching ``text`` after normalization and typo correction."""
+        key = self.best_match(text)
+        return sorted(self.values[key]) if key is not None else []
+
+
+_local = {}
+_lock = threading.Lock()
+
+
+def get_trigram_index(model, field):
+    """
+    Return the index for ``model.field`` at the model's current version.
+
+    The distinct values are read from the table once per version and shared
+    through the cache. Each process keeps the last index it built, so a
+    lookup normally costs one cache read for the version.
+    """
+    version = get_model_versions([model])[model]
+    name = f"{model._meta.label_lower}:{field}"
+    local = _local.get(name)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    key = f"trigram:{name}:{version}"
+    values = cache.get(key)
+    if values is None:
+        values = list(
+            model.objects.order_by().values_list(field, flat=True).distinct()
+        )
+        cache.set(key, values, timeout=INDEX_TIMEOUT)
+    index = TrigramIndex(values)
+    with _lock:
+        _local[name] = (version, index)
+    return index
@@ -0,0 +1,195 @@
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import timedelta
+
+from django.utils import timezone
+
+from app.cache import get_model_versions
+from app.models.industry import Industry
+from app.models.job import Job, JobCategory
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Model versions live in the shared cache, so other workers' writes are
+# noticed within this many seconds without a cache read per keystroke.
+RECHECK_INTERVAL = 2
+# Jobs saved this long before the previous sync are re-read as well, to
+# catch transactions that committed after it had started
+SYNC_OVERLAP = timedelta(minutes=1)
+# Upper bound on the keys looked at for very short prefixes
+MAX_SCAN = 500
+
+
+def normalize(text):
+    return " ".join(WORD_RE.findall(text.lower()))
+
+
+def job_suggestions(title, country, location):
+    return tuple(
+        (kind, value)
+        for kind, value in (
+            ("job_title", title),
+            ("country", country),
+            ("location", location),
+        )
+        if value
+    )
+
+
+class TypeaheadIndex:
+    """
+    In-memory prefix index over open job titles, countries, locations,
+    job category and industry names.
+
+    Every suggestion is stored once per word it contains, as a sorted list
+    of ``(key, kind, value)`` searched with ``bisect``, so "tech" finds
+    "Maintenance Technician". Suggestions are reference counted by the
+    rows contributing them; when the model versions move, only the changed
+    jobs and the (small) category and industry tables are read again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.keys = []
+        self.counts = Counter()
+        self.contributions = {}
+        self.versions = {}
+        self.jobs_synced_at = None
+        self.checked_at = None
+
+    def add(self, suggestion):
+        self.counts[suggestion] += 1
+        if self.counts[suggestion] == 1:
+            kind, value = suggestion
+            words = normalize(value).split()
+            for i in range(len(words)):
+                insort(self.keys, (" ".join(words[i:]), kind, value))
+
+    def discard(self, suggestion):
+        self.counts[suggestion] -= 1
+        if self.counts[suggestion] > 0:
+            return
+        del self.counts[suggestion]
+        kind, value = suggestion
+        words = normalize(value).split()
+        for i in range(len(words)):
+            key = (" ".join(words[i:]), kind, value)
+            position = bisect_left(self.keys, key)
+            if position < len(self.keys) and self.keys[position] == key:
+                del self.keys[position]
+
+    def contribute(self, row, suggestions):
+        """Make ``suggestions`` the ones contributed by ``row``, a (source, pk) pair."""
+        previous = self.contributions.pop(row, ())
+        if suggestions:
+            self.contributions[row] = suggestions
+        for suggestion in suggestions:
+            self.add(suggestion)
+        for suggestion in previous:
+            self.discard(suggestion)
+
+    def replace_source(self, source, rows):
+        """Make ``rows`` ({pk: suggestions}) the only contributions of ``source``."""
+        stale = [
+            row
+            for row in self.contributions
+            if row[0] == source and row[1] not in rows
+        ]
+        for row in stale:
+            self.contribute(row, ())
+        for pk, suggestions in rows.items():
+            self.contribute((source, pk), suggestions)
+
+    def sync_jobs(self):
+        started = timezone.now()
+        jobs = Job.objects.filter(status="open")
+        if self.jobs_synced_at is None:
+            changed = jobs
+        else:
+            changed = jobs.filter(updated_at__gte=self.jobs_synced_at - SYNC_OVERLAP)
+        for pk, title, country, location in changed.order_by().values_list(
+            "pk", "title", "country", "location"
+        ):
+            self.contribute(("job", pk), job_suggestions(title, country, location))
+
+        # Closed and deleted jobs
+        open_ids = set(jobs.order_by().values_list("pk", flat=True))
+        for row in [
+            row
+            for row in self.contributions
+            if row[0] == "job" and row[1] not in open_ids
+        ]:
+            self.contribute(row, ())
+        self.jobs_synced_at = started
+
+    def refresh(self):
+        now = time.monotonic()
+        if self.checked_at is not None and now - self.checked_at < RECHECK_INTERVAL:
+            return
+        with self.lock:
+            if self.checked_at is not None and now - self.checked_at < RECHECK_INTERVAL:
+                return
+            versions = get_model_versions((Job, JobCategory, Industry))
+            if versions[Job] != self.versions.get(Job):
+                self.sync_jobs()
+            if versions[JobCategory] != self.versions.get(JobCategory):
+                self.replace_source(
+                    "category",
+                    {
+                        pk: (("category", name),)
+                        for pk, name in JobCategory.objects.values_list("pk", "name")
+                    },
+                )
+            if versions[Industry] != self.versions.get(Industry):
+                self.replace_source(
+                    "industry",
+                    {
+                        pk: (("industry", name),)
+                        for pk, name in Industry.objects.values_list("pk", "name")
+                    },
+                )
+            self.versions = versions
+            self.checked_at = time.monotonic()
+
+    def suggest(self, text, kinds=None, limit=10):
+        """
+        Suggestions with consecutive words starting with the words of
+        ``text`` ("maint tech"). Matches at the start of a suggestion come
+        first, then the ones shared by more rows.
+        """
+        words = normalize(text).split()
+        if not words:
+            return []
+        self.refresh()
+
+        keys = self.keys
+        matches = {}
+        position = bisect_left(keys, (words[0],))
+        for key, kind, value in keys[position : position + MAX_SCAN]:
+            if not key.startswith(words[0]):
+                break
+            if kinds and kind not in kinds:
+                continue
+            key_words = key.split()
+            if len(key_words) < len(words) or not all(
+                key_word.startswith(word) for key_word, word in zip(key_words, words)
+            ):
+                continue
+            suggestion = (kind, value)
+            leading = key == normalize(value)
+            matches[suggestion] = matches.get(suggestion, False) or leading
+
+        ranked = sorted(
+            matches.items(),
+            key=lambda item: (not item[1], -self.counts[item[0]], item[0][1]),
+        )
+        return [
+            {"type": kind, "value": value, "count": self.counts[kind, value]}
+            for (kind, value), _ in ranked[:limit]
+        ]
+
+
+typeahead_index = TypeaheadIndex()
@@ -11,7 +11,7 @@ environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
 
 from khrm.jazzmin import JAZZMIN_SETTINGS, JAZZMIN_UI_TWEAKS
 SECRET_KEY = "django-insecure-sjar38l1p^$$p_blhjbmx*xv(7qn8v8h3&b7txq#4!a6704m-s"
-DEBUG = True
+DEBUG = env.bool("DEBUG", default=True)
 ALLOWED_HOSTS = ["*"]
 
 INSTALLED_APPS = [
@@ -66,6 +66,13 @@ DATABASES = {
     }
 }
 
+# Cache
+# Snapshots and counters must be visible to every worker process, so the
+# default is a file based cache; point CACHE_URL at redis/memcached in production.
+CACHES = {
+    "default": env.cache("CACHE_URL", default=f"filecache://{BASE_DIR / '.cache'}"),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -124,8 +131,9 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
+        "app.api.renderers.FastJSONRenderer",
+        # Full HTML pages per request, only worth it while developing
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -134,6 +142,8 @@ REST_FRAMEWORK = {
     ],
     "EXCEPTION_HANDLER": "app.utils.custom_exception_handler",
 }
+# Upper bound for ?page_size= on app.api.pagination.KeysetPagination
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=100)
 
 # JWT Settings
 from datetime import timedelta
@@ -195,10 +205,47 @@ CSRF_TRUSTED_ORIGINS = [
 # File Upload Settings
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+STORAGES = {
+    # Uploads are stored once per distinct content, see app.storage
+    "default": {"BACKEND": "app.storage.DedupFileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+    },
+}
+# Cache-Control of /media/ responses by upload folder, the longest match wins
+MEDIA_CACHE_CONTROL = {
+    "": "public, max-age=86400",
+    "derivatives/": "public, max-age=604800",
+    "documents/": "public, max-age=3600",
+    # Applicant and employer uploads
+    "applications/": "private, no-cache",
+    "employer/": "private, no-cache",
+}
+# Hand /media/ transfers to the front proxy: "x-accel-redirect" (nginx,
+# with an internal location aliased to MEDIA_ROOT), "x-sendfile"
+# (Apache/lighttpd) or "" to send them from Django
+MEDIA_OFFLOAD = env("MEDIA_OFFLOAD", default="")
+MEDIA_ACCEL_REDIRECT_PREFIX = env(
+    "MEDIA_ACCEL_REDIRECT_PREFIX", default="/protected-media/"
+)
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 
+# Document download counters are buffered in memory and written in batches
+DOWNLOAD_COUNTER_FLUSH_INTERVAL = env.int("DOWNLOAD_COUNTER_FLUSH_INTERVAL", default=30)  # seconds
+DOWNLOAD_COUNTER_FLUSH_EVENTS = env.int("DOWNLOAD_COUNTER_FLUSH_EVENTS", default=100)
+
+# Background tasks, see app.tasks and the runworker command
+# Tasks run in-process after the commit unless this is turned off, only do so
+# once `manage.py runworker` is deployed or nothing will run them
+TASKS_RUN_EAGERLY = env.bool("TASKS_RUN_EAGERLY", default=True)
+TASKS_RETRY_BACKOFF = env.int("TASKS_RETRY_BACKOFF", default=10)  # seconds, doubled per attempt
+TASKS_RETRY_BACKOFF_MAX = env.int("TASKS_RETRY_BACKOFF_MAX", default=3600)
+# A running task locked longer than this is assumed lost with its worker
+TASKS_LOCK_TIMEOUT = env.int("TASKS_LOCK_TIMEOUT", default=600)  # seconds
+TASKS_KEEP_FINISHED_DAYS = env.int("TASKS_KEEP_FINISHED_DAYS", default=7)
+
 
 # Jazzmin tweaks
 JAZZMIN_SETTINGS = JAZZMIN_SETTINGS